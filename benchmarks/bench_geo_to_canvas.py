@@ -0,0 +1,47 @@
+"""Compare per-point and batch projection of every Africa vertex onto the canvas.
+
+Both paths produce identical integers (see tests/test_projection.py); this only times
+them.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_geo_to_canvas.py
+"""
+
+import json
+import time
+
+import shapely
+from shapely.geometry import shape
+
+from africa_quiz.projection import CoordinateProjector
+
+REPEATS = 5
+
+
+def main() -> None:
+    with open("africa.geojson") as f:
+        africa_data = json.load(f)
+
+    projector = CoordinateProjector(CoordinateProjector.calculate_bbox(africa_data), 1000, 960)
+    coords = shapely.get_coordinates([shape(f["geometry"]) for f in africa_data["features"]])
+    coord_list = coords.tolist()
+
+    scalar_time = batch_time = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for lon, lat in coord_list:
+            projector.geo_to_canvas(lon, lat)
+        scalar_time = min(scalar_time, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        projector.geo_to_canvas_array(coords)
+        batch_time = min(batch_time, time.perf_counter() - start)
+
+    print(f"{len(coords):,} vertices, best of {REPEATS}:")
+    print(f"  scalar loop: {scalar_time * 1e3:8.2f} ms")
+    print(f"  batch:       {batch_time * 1e3:8.2f} ms ({scalar_time / batch_time:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
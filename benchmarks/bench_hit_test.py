@@ -0,0 +1,78 @@
+"""Benchmark click hit testing throughput for each QuizManager hit-test engine.
+
+Batch rows time one handle_clicks call over all clicks.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_hit_test.py
+"""
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from synthetic import write_world_geojson
+
+from africa_quiz.projection import CoordinateProjector
+from africa_quiz.quiz import HIT_TEST_ENGINES, QuizManager
+
+CANVAS_WIDTH = 1000
+CANVAS_HEIGHT = 960
+
+
+def clicks_per_second(quiz_manager: QuizManager, clicks: list[tuple[int, int]]) -> float:
+    start = time.perf_counter()
+    for x, y in clicks:
+        quiz_manager.handle_click(x, y)
+    return len(clicks) / (time.perf_counter() - start)
+
+
+def batch_clicks_per_second(quiz_manager: QuizManager, clicks: list[tuple[int, int]]) -> float:
+    xs, ys = np.array(clicks).T
+    start = time.perf_counter()
+    quiz_manager.handle_clicks(xs, ys)
+    return len(clicks) / (time.perf_counter() - start)
+
+
+def run(label: str, geojson_path: Path, click_count: int) -> None:
+    with open(geojson_path) as f:
+        bbox = CoordinateProjector.calculate_bbox(json.load(f))
+    projector = CoordinateProjector(bbox, CANVAS_WIDTH, CANVAS_HEIGHT)
+
+    rng = random.Random(42)
+    clicks = [
+        (rng.randrange(CANVAS_WIDTH), rng.randrange(CANVAS_HEIGHT)) for _ in range(click_count)
+    ]
+
+    print(f"{label}:")
+    for engine in HIT_TEST_ENGINES:
+        for prepared in (False, True):
+            quiz_manager = QuizManager(
+                str(geojson_path), projector, hit_test=engine, prepare_geometries=prepared
+            )
+            rate = clicks_per_second(quiz_manager, clicks)
+            variant = f"{engine} ({'prepared' if prepared else 'unprepared'})"
+            print(f"  {variant:>22}: {rate:>12,.0f} clicks/s")
+            if prepared:
+                rate = batch_clicks_per_second(quiz_manager, clicks)
+                print(f"  {engine + ' (batch)':>22}: {rate:>12,.0f} clicks/s")
+            if quiz_manager.hit_map is not None:
+                hit_map = quiz_manager.hit_map
+                print(
+                    f"  {'':>22}  raster {hit_map.labels.dtype}: {hit_map.nbytes / 1024:,.0f} KiB,"
+                    f" {hit_map.ambiguous_fraction:.1%} ambiguous pixels"
+                )
+
+
+def main() -> None:
+    run("africa.geojson", Path("africa.geojson"), click_count=20_000)
+    with tempfile.TemporaryDirectory() as tmp:
+        world_path = write_world_geojson(Path(tmp) / "world.geojson", countries=4000)
+        run("synthetic world (4000 polygons)", world_path, click_count=2_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark click latency on countries with holes against exterior-only outlines.
+
+The same synthetic world is loaded twice: once with every host cut around its enclave
+(interior rings), once with exterior rings only, where enclave clicks are resolved by
+overlap precedence instead. Both variants must report the same country per click.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_holes.py
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from synthetic import write_world_geojson
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.projection import CoordinateProjector
+from africa_quiz.quiz import HIT_TEST_ENGINES, QuizManager
+
+CANVAS_WIDTH = 1000
+CANVAS_HEIGHT = 960
+CLICK_COUNT = 5_000
+
+
+def microseconds_per_click(quiz_manager: QuizManager, clicks: list[tuple[int, int]]) -> float:
+    start = time.perf_counter()
+    for x, y in clicks:
+        quiz_manager.handle_click(x, y)
+    return (time.perf_counter() - start) / len(clicks) * 1e6
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets = {
+            variant: CountryDataset.from_path(
+                write_world_geojson(
+                    Path(tmp) / f"{variant}.geojson", countries=2000, enclaves=True, holes=holes
+                )
+            )
+            for variant, holes in (("holes", True), ("exterior only", False))
+        }
+
+    projector = CoordinateProjector(datasets["holes"].bbox, CANVAS_WIDTH, CANVAS_HEIGHT)
+    rng = random.Random(42)
+    clicks = [
+        (rng.randrange(CANVAS_WIDTH), rng.randrange(CANVAS_HEIGHT)) for _ in range(CLICK_COUNT)
+    ]
+    xs, ys = np.array(clicks).T
+
+    print(f"{len(datasets['holes'].names)} countries, {CLICK_COUNT:,} clicks (us/click):")
+    print(f"  {'engine':>8}  {'holes':>13}  {'exterior only':>13}")
+    for engine in HIT_TEST_ENGINES:
+        latencies = []
+        answers = []
+        for dataset in datasets.values():
+            quiz_manager = QuizManager(dataset, projector, hit_test=engine)
+            latencies.append(microseconds_per_click(quiz_manager, clicks))
+            answers.append(quiz_manager.handle_clicks(xs, ys))
+        agree = "" if np.array_equal(*answers) else "  (answers differ!)"
+        print(f"  {engine:>8}  {latencies[0]:>13.1f}  {latencies[1]:>13.1f}{agree}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare memory of packed canvas rings with per-vertex Python int lists.
+
+Both layouts are measured with tracemalloc while building them from the same
+projected rings of a large synthetic world, then timed over one full pass of
+reading every ring as a flat coordinate list (what draw_map hands to Tk). The tier's
+cached plane coordinates are released after packing, as the app does, so only what
+stays alive between draws is counted.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_packed.py
+"""
+
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from synthetic import write_world_geojson
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.projection import CoordinateProjector
+from africa_quiz.simplify import PackedRings, SimplificationTier, exterior_rings, project_rings
+
+CANVAS_WIDTH = 4000
+CANVAS_HEIGHT = 1600
+
+
+def traced(build: object) -> tuple[object, int]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def tk_arguments(ring: list[int] | memoryview) -> list[int]:
+    # Lists go to Tk as they are; packed slices are expanded per call, as in draw_map
+    return ring if isinstance(ring, list) else ring.tolist()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_world_geojson(Path(tmp) / "world.geojson", countries=4000, vertices=500)
+        dataset = CountryDataset.from_path(path)
+
+    projector = CoordinateProjector(dataset.bbox, CANVAS_WIDTH, CANVAS_HEIGHT)
+    tier = SimplificationTier(1.0, 0.0, dataset.geometries)
+    rings, rings_per_geometry = exterior_rings(dataset.geometries)
+
+    def nested_lists() -> list[list[list[int]]]:
+        projected = iter(project_rings(rings, projector))
+        return [
+            [next(projected).ravel().tolist() for _ in range(ring_count)]
+            for ring_count in rings_per_geometry
+        ]
+
+    def packed_rings() -> PackedRings:
+        packed = tier.canvas_rings(projector)
+        tier.clear_projected()
+        return packed
+
+    nested, nested_bytes = traced(nested_lists)
+    packed, packed_bytes = traced(packed_rings)
+    vertices = packed.vertex_count
+
+    print(f"{len(packed):,} countries, {vertices:,} canvas vertices:")
+    layouts = (("nested lists", nested, nested_bytes), ("packed", packed, packed_bytes))
+    for label, layout, size in layouts:
+        start = time.perf_counter()
+        for country_rings in layout:
+            for ring in country_rings:
+                tk_arguments(ring)
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {label:>12}: {size / 2**20:>7.1f} MiB ({size / vertices:>5.1f} B/vertex),"
+            f" Tk argument prep {elapsed * 1e3:>6.1f} ms per full redraw"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark dataset startup with the process-pool geometry build at 1/2/4/8 workers.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_parallel.py
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import write_world_geojson
+
+from africa_quiz.dataset import CountryDataset
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def run(label: str, geojson_path: Path, repeats: int) -> None:
+    with open(geojson_path) as f:
+        geojson_data = json.load(f)
+
+    print(f"{label} ({len(geojson_data['features']):,} features, {os.cpu_count()} CPUs):")
+    baseline = None
+    for workers in WORKER_COUNTS:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            CountryDataset(geojson_data, workers=workers)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        baseline = baseline or best
+        print(f"  {workers} worker(s): {best * 1e3:8.1f} ms ({baseline / best:.2f}x)")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        world_path = write_world_geojson(Path(tmp) / "world.geojson", countries=4000, vertices=500)
+        run("synthetic world", world_path, repeats=3)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare projection costs and the per-projection vertex cache of simplification tiers.
+
+For each projection, times the first canvas_rings call of a tier (every vertex is
+projected), a second call at another canvas size (only the affine step runs on the
+cached plane coordinates), the memory that cache holds, and the worst round-trip error
+of canvas_to_geo over the dataset's vertices.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_projection.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from synthetic import write_world_geojson
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.projection import PROJECTIONS, CoordinateProjector, canvas_size, make_projection
+from africa_quiz.simplify import SimplificationTier, exterior_rings
+
+BASE_WIDTH = 4000
+
+
+def timed(call: object, *args: object) -> float:
+    start = time.perf_counter()
+    call(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_world_geojson(Path(tmp) / "world.geojson", countries=4000, vertices=500)
+        dataset = CountryDataset.from_path(path)
+
+    bbox = dataset.bbox
+    rings, _ = exterior_rings(dataset.geometries)
+    vertices = np.concatenate([np.asarray(ring.coords) for ring in rings])
+    print(f"{len(dataset.names):,} countries, {len(vertices):,} vertices:")
+
+    for name in PROJECTIONS:
+        projection = make_projection(name, bbox)
+        width, height = canvas_size(bbox, BASE_WIDTH, projection)
+        projector = CoordinateProjector(bbox, width, height, projection)
+        tier = SimplificationTier(1.0, 0.0, dataset.geometries)
+
+        first = timed(tier.canvas_rings, projector)
+        cached = timed(tier.canvas_rings, projector.scaled(2.0))
+        cache_bytes = tier.projected_nbytes
+
+        # Unrounded canvas positions of every vertex, mapped back to degrees
+        plane = projection.forward_array(vertices)
+        points = np.column_stack(
+            [
+                (plane[:, 0] - projector.min_x) * projector.x_scale,
+                (projector.max_y - plane[:, 1]) * projector.y_scale,
+            ]
+        )
+        error = np.abs(projector.canvas_to_geo_array(points) - vertices).max()
+        print(
+            f"  {name:>15}: first draw {first * 1e3:>6.1f} ms, cached redraw"
+            f" {cached * 1e3:>6.1f} ms (cache {cache_bytes / 2**20:.1f} MiB),"
+            f" round-trip error {error:.1e} deg"
+        )
+
+
+if __name__ == "__main__":
+    main()
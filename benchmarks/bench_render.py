@@ -0,0 +1,98 @@
+"""Benchmark per-click and round-transition canvas latency and Tk item churn.
+
+Needs a display. Run from the repository root:
+
+    uv run python benchmarks/bench_render.py
+"""
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from main import AfricaQuizApp
+
+
+@dataclass
+class ClickEvent:
+    x: int
+    y: int
+
+
+def next_item_id(app: AfricaQuizApp) -> int:
+    # Tk hands out item ids in increasing order, so a probe item measures creations
+    probe = app.canvas.create_line(0, 0, 0, 0)
+    app.canvas.delete(probe)
+    return probe
+
+
+def run(app: AfricaQuizApp, label: str, clicks: int) -> None:
+    rng = random.Random(0)
+    app.draw_map()
+    app.root.update()
+
+    first_id = next_item_id(app)
+    timings = []
+    for _ in range(clicks):
+        event = ClickEvent(rng.randrange(app.canvas_width), rng.randrange(app.canvas_height))
+        start = time.perf_counter()
+        app.on_click(event)
+        app.root.update_idletasks()
+        timings.append(time.perf_counter() - start)
+    created = next_item_id(app) - first_id - 1
+
+    timings.sort()
+    print(
+        f"  {label:>12}: median {timings[len(timings) // 2] * 1e3:6.2f} ms/click, "
+        f"p99 {timings[int(len(timings) * 0.99)] * 1e3:6.2f} ms, "
+        f"{created / clicks:8.1f} items created/click"
+    )
+
+
+def run_round_transitions(app: AfricaQuizApp, label: str, rounds: int) -> None:
+    app.draw_map()
+    app.root.update()
+
+    created = 0
+    timings = []
+    for _ in range(rounds):
+        # Color a handful of countries, then answer the last prompt of the round
+        for _ in range(5):
+            app.on_click(ClickEvent(0, 0))
+        app.quiz_manager.current_country_index = len(app.quiz_manager.countries) - 1
+        first_id = next_item_id(app)
+        start = time.perf_counter()
+        app.on_click(ClickEvent(0, 0))
+        app.root.update_idletasks()
+        timings.append(time.perf_counter() - start)
+        created += next_item_id(app) - first_id - 1
+
+    timings.sort()
+    print(
+        f"  {label:>12}: median {timings[len(timings) // 2] * 1e3:6.2f} ms/transition, "
+        f"{created / rounds:8.1f} items created/transition"
+    )
+
+
+def main() -> None:
+    modes = (("full redraw", False), ("incremental", True))
+
+    print("africa.geojson clicks:")
+    for label, incremental in modes:
+        app = AfricaQuizApp()
+        app.incremental_redraw = incremental
+        run(app, label, clicks=200)
+        app.root.destroy()
+
+    print("africa.geojson round transitions:")
+    for label, incremental in modes:
+        app = AfricaQuizApp()
+        app.incremental_redraw = incremental
+        run_round_transitions(app, label, rounds=50)
+        app.root.destroy()
+
+
+if __name__ == "__main__":
+    main()
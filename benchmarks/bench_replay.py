@@ -0,0 +1,50 @@
+"""Benchmark headless replay of recorded clicks through QuizSession.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_replay.py
+"""
+
+import random
+import time
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.projection import CoordinateProjector
+from africa_quiz.quiz import HIT_TEST_ENGINES, QuizManager
+from africa_quiz.session import QuizSession
+
+CANVAS_WIDTH = 1000
+CANVAS_HEIGHT = 1049
+CLICK_COUNT = 200_000
+
+
+def main() -> None:
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, CANVAS_WIDTH, CANVAS_HEIGHT)
+
+    rng = random.Random(42)
+    clicks = [
+        (rng.randrange(CANVAS_WIDTH), rng.randrange(CANVAS_HEIGHT)) for _ in range(CLICK_COUNT)
+    ]
+
+    for engine in HIT_TEST_ENGINES:
+        session = QuizSession(QuizManager(dataset, projector, hit_test=engine))
+        start = time.perf_counter()
+        session.click_batch(clicks)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{engine:>8}: {CLICK_COUNT / elapsed * 60:>14,.0f} clicks/min, "
+            f"{session.rounds_completed:,} rounds"
+        )
+
+    # Evaluation alone, for clicks whose countries were already resolved
+    session = QuizSession(QuizManager(dataset, projector))
+    answers = [rng.choice([*dataset.names, None]) for _ in range(CLICK_COUNT)]
+    start = time.perf_counter()
+    session.answer_batch(answers)
+    elapsed = time.perf_counter() - start
+    print(f"{'answers':>8}: {CLICK_COUNT / elapsed * 60:>14,.0f} answers/min")
+
+
+if __name__ == "__main__":
+    main()
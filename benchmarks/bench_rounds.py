@@ -0,0 +1,58 @@
+"""Benchmark starting quiz rounds: copy-and-shuffle against lazy seeded permutations.
+
+Starting a lazy round is constant time; the cost moves to reading countries, one
+Feistel evaluation each, which a player does at human speed.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_rounds.py
+"""
+
+import random
+import time
+
+from africa_quiz.rounds import RoundSchedule
+
+ROUNDS = 10_000
+
+
+def shuffled_rounds_per_second(names: tuple[str, ...], rounds: int) -> float:
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        order = list(names)
+        rng.shuffle(order)
+    return rounds / (time.perf_counter() - start)
+
+
+def lazy_rounds_per_second(names: tuple[str, ...], rounds: int) -> float:
+    schedule = RoundSchedule(names, seed=0)
+    start = time.perf_counter()
+    for number in range(rounds):
+        schedule.round(number)
+    return rounds / (time.perf_counter() - start)
+
+
+def lookups_per_second(names: tuple[str, ...], count: int) -> float:
+    order = RoundSchedule(names, seed=0).round(0)
+    start = time.perf_counter()
+    for position in range(count):
+        order[position % len(order)]
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    for size in (49, 4_000, 1_000_000):
+        names = tuple(f"Country {i}" for i in range(size))
+        rounds = max(10, ROUNDS * 49 // size)
+        shuffled = shuffled_rounds_per_second(names, rounds)
+        lazy = lazy_rounds_per_second(names, ROUNDS)
+        lookups = lookups_per_second(names, 100_000)
+        print(
+            f"{size:>9,} countries: shuffle {shuffled:>11,.0f} rounds/s,"
+            f" lazy {lazy:>9,.0f} rounds/s, {lookups:>9,.0f} prompts/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
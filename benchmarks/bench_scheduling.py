@@ -0,0 +1,38 @@
+"""Benchmark spaced-repetition picks per second as the country count grows.
+
+Each pick is one heap push and pop, so throughput should only fall logarithmically.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_scheduling.py
+"""
+
+import random
+import time
+
+from africa_quiz.scheduling import SpacedRepetitionScheduler
+
+PICKS = 200_000
+
+
+def picks_per_second(country_count: int, accuracy: float) -> float:
+    rng = random.Random(0)
+    answers = [rng.random() < accuracy for _ in range(PICKS)]
+    scheduler = SpacedRepetitionScheduler(range(country_count))
+    start = time.perf_counter()
+    for correct in answers:
+        scheduler.record(correct)
+    return PICKS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    for country_count in (49, 4_000, 1_000_000):
+        start = time.perf_counter()
+        SpacedRepetitionScheduler(range(country_count))
+        setup_ms = (time.perf_counter() - start) * 1000
+        rate = picks_per_second(country_count, accuracy=0.8)
+        print(f"{country_count:>9,} countries: {rate:>10,.0f} picks/s, setup {setup_ms:,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Load-test the quiz server with simulated players and report click latency.
+
+Starts the server in a child process on a free port, opens one keep-alive connection
+per simulated player, and has every player send single-click requests as fast as the
+server answers. Run from the repository root:
+
+    uv run python benchmarks/bench_server.py [--players 1000] [--clicks 50]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import statistics
+import time
+
+from africa_quiz.server import serve
+
+
+async def request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    payload: dict | None = None,
+) -> dict:
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    await reader.readline()  # Status line
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return json.loads(await reader.readexactly(length))
+
+
+async def player(
+    port: int, width: int, height: int, clicks: int, seed: int, latencies: list[float]
+) -> None:
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    session = (await request(reader, writer, "POST", "/sessions"))["session"]
+    for _ in range(clicks):
+        click = [rng.randrange(width), rng.randrange(height)]
+        start = time.perf_counter()
+        await request(reader, writer, "POST", f"/sessions/{session}/clicks", {"clicks": [click]})
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+def run_server(port: int) -> None:
+    asyncio.run(serve("africa.geojson", "127.0.0.1", port))
+
+
+def serve_in_background(port: int) -> multiprocessing.Process:
+    process = multiprocessing.Process(target=run_server, args=(port,), daemon=True)
+    process.start()
+    # Wait until the server accepts connections
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run(players: int, clicks: int) -> None:
+    port = free_port()
+    process = serve_in_background(port)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    info = await request(reader, writer, "GET", "/")
+    writer.close()
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            player(port, info["width"], info["height"], clicks, seed, latencies)
+            for seed in range(players)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    process.terminate()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{players:,} players x {clicks:,} clicks over one shared geometry store")
+    print(f"  throughput: {len(latencies) / elapsed:>10,.0f} clicks/s")
+    print(f"  p50       : {quantiles[49] * 1e3:>10.2f} ms")
+    print(f"  p99       : {quantiles[98] * 1e3:>10.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--clicks", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.players, args.clicks))
+
+
+if __name__ == "__main__":
+    main()
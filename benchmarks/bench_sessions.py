@@ -0,0 +1,55 @@
+"""Benchmark memory per player session and answer throughput on country IDs.
+
+Sessions share one GeometryStore; each holds one feedback byte per country and a
+lazy round order, so per-session memory should stay flat as sessions are added.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_sessions.py
+"""
+
+import random
+import time
+import tracemalloc
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.hitmap import OCEAN
+from africa_quiz.projection import CoordinateProjector
+from africa_quiz.quiz import QuizManager
+from africa_quiz.session import QuizSession
+from africa_quiz.store import GeometryStore
+
+SESSIONS = 10_000
+ANSWERS_PER_SESSION = 20
+
+
+def main() -> None:
+    dataset = CountryDataset.from_path("africa.geojson")
+    store = GeometryStore(dataset, CoordinateProjector(dataset.bbox, 1000, 1049))
+    country_count = len(store.country_names)
+
+    rng = random.Random(0)
+    answers = [
+        rng.choice([OCEAN, *range(country_count)]) for _ in range(SESSIONS * ANSWERS_PER_SESSION)
+    ]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [QuizSession(QuizManager.from_store(store, seed=i)) for i in range(SESSIONS)]
+    created = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    answer_iter = iter(answers)
+    for session in sessions:
+        for _ in range(ANSWERS_PER_SESSION):
+            session.answer_id(next(answer_iter))
+    elapsed = time.perf_counter() - start
+
+    print(f"{SESSIONS:,} sessions over {country_count} countries:")
+    print(f"  memory: {(created - before) / SESSIONS:,.0f} bytes/session")
+    print(f"  answers: {len(answers) / elapsed:,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
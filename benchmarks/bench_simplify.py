@@ -0,0 +1,76 @@
+"""Report vertex counts and Tk draw time for each simplification tier.
+
+Draw times need a display and are skipped without one. Run from the repository root:
+
+    uv run python benchmarks/bench_simplify.py
+"""
+
+import tempfile
+import time
+import tkinter as tk
+from collections.abc import Sequence
+from pathlib import Path
+
+import shapely
+from synthetic import write_world_geojson
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.projection import CoordinateProjector
+from africa_quiz.simplify import build_simplification_tiers, exterior_rings
+
+BASE_WIDTH = 1000
+
+
+def draw_time(canvas: tk.Canvas | None, rings: Sequence[Sequence[Sequence[int]]]) -> str:
+    if canvas is None:
+        return "n/a (no display)"
+    start = time.perf_counter()
+    for country_rings in rings:
+        for ring in country_rings:
+            if len(ring) >= 6:
+                canvas.create_polygon(list(ring), fill="", outline="black")
+    canvas.update_idletasks()
+    elapsed = time.perf_counter() - start
+    canvas.delete("all")
+    return f"{elapsed * 1e3:.1f} ms"
+
+
+def run(label: str, dataset: CountryDataset, canvas: tk.Canvas | None) -> None:
+    bbox = dataset.bbox
+    height = int(BASE_WIDTH * (bbox[3] - bbox[1]) / (bbox[2] - bbox[0]))
+    projector = CoordinateProjector(bbox, BASE_WIDTH, height)
+    raw_rings, _ = exterior_rings(dataset.geometries)
+    raw_vertices = int(shapely.get_num_coordinates(raw_rings).sum())
+
+    print(f"{label}:")
+    raw = [
+        [projector.geo_to_canvas_array(ring.coords).ravel().tolist() for ring in rings]
+        for rings in (exterior_rings([geometry])[0] for geometry in dataset.geometries)
+    ]
+    print(f"  raw      : {raw_vertices:>10,} vertices sent to Tk, draw {draw_time(canvas, raw)}")
+    for tier in build_simplification_tiers(dataset.geometries, projector):
+        zoomed = CoordinateProjector(bbox, int(BASE_WIDTH * tier.zoom), int(height * tier.zoom))
+        rings = tier.canvas_rings(zoomed)
+        tk_vertices = sum(len(ring) // 2 for country_rings in rings for ring in country_rings)
+        print(
+            f"  zoom {tier.zoom:>4g}: {tier.vertex_count:>10,} simplified, "
+            f"{tk_vertices:>10,} sent to Tk, draw {draw_time(canvas, rings)}"
+        )
+
+
+def main() -> None:
+    try:
+        root = tk.Tk()
+        canvas = tk.Canvas(root, width=BASE_WIDTH, height=BASE_WIDTH)
+        canvas.pack()
+    except tk.TclError:
+        canvas = None
+
+    run("africa.geojson", CountryDataset.from_path("africa.geojson"), canvas)
+    with tempfile.TemporaryDirectory() as tmp:
+        world_path = write_world_geojson(Path(tmp) / "world.geojson", countries=2000, vertices=2000)
+        run("synthetic world (2000 polygons)", CountryDataset.from_path(world_path), canvas)
+
+
+if __name__ == "__main__":
+    main()
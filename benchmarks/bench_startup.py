@@ -0,0 +1,54 @@
+"""Benchmark cold (JSON parse) versus warm (binary cache) dataset loads.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_startup.py
+"""
+
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from synthetic import write_world_geojson
+
+from africa_quiz.cache import cache_path_for
+from africa_quiz.dataset import CountryDataset
+
+
+def best_of(repeats: int, load: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(label: str, geojson_path: Path, repeats: int) -> None:
+    cache_path_for(geojson_path).unlink(missing_ok=True)
+    cold = best_of(repeats, lambda: CountryDataset.from_path(geojson_path))
+
+    CountryDataset.from_path(geojson_path, use_cache=True)  # Populate the cache
+    warm = best_of(repeats, lambda: CountryDataset.from_path(geojson_path, use_cache=True))
+
+    size = geojson_path.stat().st_size / 1024
+    cache_size = cache_path_for(geojson_path).stat().st_size / 1024
+    print(f"{label} ({size:,.0f} KiB GeoJSON, {cache_size:,.0f} KiB cache):")
+    print(f"  cold: {cold * 1e3:8.1f} ms")
+    print(f"  warm: {warm * 1e3:8.1f} ms ({cold / warm:.1f}x faster)")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        africa_path = Path(tmp) / "africa.geojson"
+        shutil.copy("africa.geojson", africa_path)
+        run("africa.geojson", africa_path, repeats=20)
+
+        world_path = write_world_geojson(Path(tmp) / "world.geojson", countries=4000)
+        run("synthetic world (4000 polygons)", world_path, repeats=3)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare peak memory of full versus streaming GeoJSON loads.
+
+tracemalloc sees Python allocations (the parsed JSON document and feature dicts), not the
+GEOS memory behind shapely geometries, which is the same for both modes.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_streaming.py
+"""
+
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from synthetic import write_world_geojson
+
+from africa_quiz.dataset import CountryDataset
+
+
+def measure(load: Callable[[], object]) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        world_path = write_world_geojson(Path(tmp) / "world.geojson", countries=10_000)
+        size = world_path.stat().st_size / 2**20
+        print(f"synthetic world (10000 polygons, {size:,.0f} MiB GeoJSON):")
+        for label, stream in (("full", False), ("stream", True)):
+            elapsed, peak = measure(lambda s=stream: CountryDataset.from_path(world_path, stream=s))
+            print(f"  {label:>6}: {elapsed:6.2f} s, peak Python memory {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark per-feature versus bulk geometry validation during dataset loads.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_validation.py
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from shapely.geometry import MultiPolygon, Polygon
+from synthetic import write_world_geojson
+
+from africa_quiz.validation import build_countries
+
+
+def per_feature(features: list[dict]) -> dict:
+    # The original loader: build and check each geometry on its own
+    country_data = {}
+    for feature in features:
+        coords = feature["geometry"]["coordinates"]
+        if feature["geometry"]["type"] == "Polygon":
+            geometry = Polygon(coords[0])
+        else:
+            geometry = MultiPolygon([Polygon(poly[0]) for poly in coords])
+        if geometry.is_valid:
+            country_data[feature["properties"]["name"]] = geometry
+    return country_data
+
+
+def best_of(repeats: int, load: callable) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        world_path = write_world_geojson(Path(tmp) / "world.geojson", countries=4000)
+        with open(world_path) as f:
+            features = json.load(f)["features"]
+
+    # Make every tenth country self-intersecting
+    for feature in features[::10]:
+        ring = feature["geometry"]["coordinates"][0]
+        ring[1], ring[2] = ring[2], ring[1]
+
+    _, _, _, report = build_countries(features)
+    print(f"{len(features):,} features: {report.summary()}")
+    print(f"  per feature is_valid: {best_of(3, lambda: per_feature(features)) * 1e3:8.1f} ms")
+    print(f"  bulk is_valid       : {best_of(3, lambda: build_countries(features)) * 1e3:8.1f} ms")
+    repair = best_of(3, lambda: build_countries(features, repair=True))
+    print(f"  bulk with repair    : {repair * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark per-frame draw preparation while zoomed into a detailed world map.
+
+For each zoom, times what draw_map does before handing coordinates to Tk: culling
+countries by bounds, picking the simplification tier and moving its packed rings
+into view. At zoom 1 the whole map is drawn, so nothing is culled.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_viewport.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from synthetic import write_world_geojson
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.projection import CoordinateProjector
+from africa_quiz.simplify import build_simplification_tiers, tier_for_zoom
+from africa_quiz.viewport import Viewport
+
+CANVAS_WIDTH = 1000
+CANVAS_HEIGHT = 400
+FRAMES = 5
+
+
+def prepare_frame(
+    viewport: Viewport,
+    rings_by_tier: list,
+    tiers: list,
+    bounds: np.ndarray,
+    projector: CoordinateProjector,
+) -> tuple[int, int]:
+    tier_index = tier_for_zoom(tiers, viewport.zoom)
+    rings, scale_x, scale_y = rings_by_tier[tier_index]
+    visible = np.flatnonzero(viewport.visible(bounds, projector)).tolist()
+    vertices = 0
+    for country_id in visible:
+        for ring in rings[country_id]:
+            points = np.frombuffer(ring, dtype=np.int32).reshape(-1, 2)
+            coords = viewport.to_screen_array(points, scale_x, scale_y).ravel().tolist()
+            vertices += len(coords) // 2
+    return len(visible), vertices
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_world_geojson(Path(tmp) / "world.geojson", countries=4000, vertices=400)
+        dataset = CountryDataset.from_path(path)
+
+    projector = CoordinateProjector(dataset.bbox, CANVAS_WIDTH, CANVAS_HEIGHT)
+    tiers = build_simplification_tiers(
+        dataset.geometries, projector, zoom_levels=(1, 2, 4, 8, 16, 32, 64)
+    )
+    rings_by_tier = []
+    for tier in tiers:
+        zoomed = CoordinateProjector(
+            dataset.bbox, round(CANVAS_WIDTH * tier.zoom), round(CANVAS_HEIGHT * tier.zoom)
+        )
+        rings_by_tier.append(
+            (
+                tier.canvas_rings(zoomed),
+                zoomed.x_scale / projector.x_scale,
+                zoomed.y_scale / projector.y_scale,
+            )
+        )
+
+    print(f"{len(dataset.names):,} countries:")
+    for zoom in (1, 4, 16, 64):
+        viewport = Viewport(CANVAS_WIDTH, CANVAS_HEIGHT)
+        viewport.zoom_at(CANVAS_WIDTH / 2, CANVAS_HEIGHT / 2, zoom)
+        start = time.perf_counter()
+        for frame in range(FRAMES):
+            viewport.pan(3 if frame % 2 else -3, 0)
+            countries, vertices = prepare_frame(
+                viewport, rings_by_tier, tiers, dataset.bounds, projector
+            )
+        elapsed = (time.perf_counter() - start) / FRAMES
+        print(
+            f"  zoom {zoom:>2}: {countries:>5,} countries, {vertices:>9,} vertices,"
+            f" {elapsed * 1e3:>7.1f} ms/frame"
+        )
+
+
+if __name__ == "__main__":
+    main()
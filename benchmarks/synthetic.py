@@ -0,0 +1,89 @@
+"""Synthetic world-scale GeoJSON generator for benchmarks."""
+
+import json
+import math
+import random
+from pathlib import Path
+
+
+def make_world_geojson(
+    countries: int = 4000,
+    vertices: int = 120,
+    seed: int = 0,
+    enclaves: bool = False,
+    holes: bool = True,
+) -> dict:
+    """Build a FeatureCollection of non-overlapping, jagged polygons covering the globe.
+
+    Args:
+        countries: Approximate number of polygons to generate
+        vertices: Number of vertices per polygon ring
+        seed: Seed for the jitter so runs are reproducible
+        enclaves: Add a small enclave country at the centre of every polygon
+        holes: Cut a hole for each enclave out of its host; without holes hosts and
+            enclaves overlap, as in data that only ships exterior rings
+
+    Returns:
+        GeoJSON FeatureCollection dict
+    """
+    rng = random.Random(seed)
+    cols = max(1, int(math.sqrt(countries * 2)))
+    rows = max(1, math.ceil(countries / cols))
+    cell_w = 360.0 / cols
+    cell_h = 140.0 / rows
+
+    features = []
+    for row in range(rows):
+        for col in range(cols):
+            if len(features) >= countries * (2 if enclaves else 1):
+                break
+            center_lon = -180.0 + (col + 0.5) * cell_w
+            center_lat = -60.0 + (row + 0.5) * cell_h
+            ring = []
+            for i in range(vertices):
+                angle = 2 * math.pi * i / vertices
+                # Stay inside 45% of the cell so neighbours never overlap
+                radius = 0.3 + 0.15 * rng.random()
+                ring.append(
+                    [
+                        round(center_lon + math.cos(angle) * radius * cell_w, 6),
+                        round(center_lat + math.sin(angle) * radius * cell_h, 6),
+                    ]
+                )
+            ring.append(ring[0])
+            rings = [ring]
+            if enclaves:
+                # Well inside the 30% minimum radius of the host
+                enclave = [
+                    [
+                        round(center_lon + math.cos(angle) * 0.15 * cell_w, 6),
+                        round(center_lat + math.sin(angle) * 0.15 * cell_h, 6),
+                    ]
+                    for angle in (2 * math.pi * i / vertices for i in range(vertices))
+                ]
+                enclave.append(enclave[0])
+                if holes:
+                    rings.append(enclave[::-1])
+                features.append(
+                    {
+                        "type": "Feature",
+                        "properties": {"name": f"Enclave {row}-{col}"},
+                        "geometry": {"type": "Polygon", "coordinates": [enclave]},
+                    }
+                )
+            features.append(
+                {
+                    "type": "Feature",
+                    "properties": {"name": f"Region {row}-{col}"},
+                    "geometry": {"type": "Polygon", "coordinates": rings},
+                }
+            )
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+def write_world_geojson(path: Path, **kwargs: int | bool) -> Path:
+    """Write a synthetic world dataset to disk and return its path."""
+    with open(path, "w") as f:
+        json.dump(make_world_geojson(**kwargs), f)
+    return path
@@ -2,54 +2,83 @@ import tkinter as tk
 from pathlib import Path
 from typing import Any
 
-from africa_quiz.projection import CoordinateProjector
+import numpy as np
+
+from africa_quiz.dataset import CountryDataset
+from africa_quiz.projection import CoordinateProjector, canvas_size, make_projection
 from africa_quiz.quiz import QuizManager
+from africa_quiz.session import COLORS, QuizSession, colored_ids
+from africa_quiz.simplify import PackedRings, build_simplification_tiers, tier_for_zoom
+from africa_quiz.viewport import Viewport
+
+# Zoom multiplier per mouse wheel step
+ZOOM_STEP = 1.25
+
+# Pointer travel in pixels before a left-button press becomes a pan instead of a click
+DRAG_THRESHOLD = 4
+
+# Quiet period after the last zoom or pan event before the map is redrawn in detail
+REDRAW_DELAY_MS = 60
+
+# Quiet period after the last window resize event before the map is rescaled
+RESIZE_DELAY_MS = 40
 
 
 class AfricaQuizApp:
-    def __init__(self, geojson_path: str = "africa.geojson") -> None:
+    def __init__(
+        self,
+        geojson_path: str | CountryDataset = "africa.geojson",
+        use_cache: bool = False,
+        projection: str = "equirectangular",
+    ) -> None:
         """Initialize the Africa Quiz App.
 
         Args:
-            geojson_path: Path to the GeoJSON file containing Africa country data
+            geojson_path: Path to the GeoJSON file containing Africa country data, or an
+                already loaded CountryDataset
+            use_cache: Load geometries from the binary cache next to the GeoJSON file
+            projection: Map projection, one of africa_quiz.projection.PROJECTIONS
         """
-        # Convert to Path object and validate
-        self.geojson_path = Path(geojson_path)
-        if not self.geojson_path.exists():
-            import tkinter.messagebox as messagebox
+        if isinstance(geojson_path, CountryDataset):
+            dataset = geojson_path
+            self.geojson_path = Path(dataset.source) if dataset.source else None
+        else:
+            # Convert to Path object and validate
+            self.geojson_path = Path(geojson_path)
+            if not self.geojson_path.exists():
+                import tkinter.messagebox as messagebox
 
-            messagebox.showerror("Error", f"GeoJSON file not found: {geojson_path}")
-            return
+                messagebox.showerror("Error", f"GeoJSON file not found: {geojson_path}")
+                return
         self.root = tk.Tk()
         self.root.title("Africa Geography Quiz")
 
-        # Calculate proper canvas dimensions based on actual Africa bounds
-        import json
-
-        try:
-            with open(self.geojson_path) as f:
-                geojson_data = json.load(f)
-        except FileNotFoundError:
-            import tkinter.messagebox as messagebox
-
-            messagebox.showerror("Error", f"GeoJSON file not found: {self.geojson_path}")
-            self.root.destroy()
-            return
-        except json.JSONDecodeError as e:
-            import tkinter.messagebox as messagebox
-
-            messagebox.showerror("Error", f"Invalid GeoJSON format: {e}")
-            self.root.destroy()
-            return
-        except Exception as e:
-            import tkinter.messagebox as messagebox
-
-            messagebox.showerror("Error", f"Error loading GeoJSON file: {e}")
-            self.root.destroy()
-            return
+        # Parse the GeoJSON once; the dataset is shared with the quiz manager
+        if not isinstance(geojson_path, CountryDataset):
+            try:
+                dataset = CountryDataset.from_path(self.geojson_path, use_cache=use_cache)
+            except FileNotFoundError:
+                import tkinter.messagebox as messagebox
+
+                messagebox.showerror("Error", f"GeoJSON file not found: {self.geojson_path}")
+                self.root.destroy()
+                return
+            except ValueError as e:
+                import tkinter.messagebox as messagebox
+
+                messagebox.showerror("Error", str(e))
+                self.root.destroy()
+                return
+            except Exception as e:
+                import tkinter.messagebox as messagebox
+
+                messagebox.showerror("Error", f"Error loading GeoJSON file: {e}")
+                self.root.destroy()
+                return
 
+        # Calculate proper canvas dimensions based on actual Africa bounds
         try:
-            bbox = CoordinateProjector.calculate_bbox(geojson_data)
+            bbox = dataset.bbox
         except Exception as e:
             import tkinter.messagebox as messagebox
 
@@ -57,23 +86,18 @@ class AfricaQuizApp:
             self.root.destroy()
             return
 
-        # Calculate canvas dimensions maintaining Africa's aspect ratio
+        # Calculate canvas dimensions maintaining Africa's projected aspect ratio
         # Start with a reasonable base size and scale to maintain proportions
         base_width = 1000  # Larger base size for better visibility
-        geographic_ratio = (bbox[2] - bbox[0]) / (bbox[3] - bbox[1])  # lon_range / lat_range
-
-        if geographic_ratio > 1:
-            # Wider than tall
-            self.canvas_width = base_width
-            self.canvas_height = int(base_width / geographic_ratio)
-        else:
-            # Taller than wide (or square)
-            self.canvas_height = base_width
-            self.canvas_width = int(base_width * geographic_ratio)
 
         try:
-            self.projector = CoordinateProjector(bbox, self.canvas_width, self.canvas_height)
-            self.quiz_manager = QuizManager(str(self.geojson_path), self.projector)
+            map_projection = make_projection(projection, bbox)
+            self.canvas_width, self.canvas_height = canvas_size(bbox, base_width, map_projection)
+            self.projector = CoordinateProjector(
+                bbox, self.canvas_width, self.canvas_height, map_projection
+            )
+            self.quiz_manager = QuizManager(dataset, self.projector)
+            self.session = QuizSession(self.quiz_manager)
         except Exception as e:
             import tkinter.messagebox as messagebox
 
@@ -88,113 +112,286 @@ class AfricaQuizApp:
         )
         self.prompt_label.pack(pady=10)
 
-        # Create canvas
+        # Create canvas; it follows the window size, while canvas_width and canvas_height
+        # stay the size of the base map. No highlight border, so <Configure> reports
+        # exactly the drawable size
         self.canvas = tk.Canvas(
-            self.root, width=self.canvas_width, height=self.canvas_height, bg="lightblue"
+            self.root,
+            width=self.canvas_width,
+            height=self.canvas_height,
+            bg="lightblue",
+            highlightthickness=0,
         )
-        self.canvas.pack()
+        self.canvas.pack(fill=tk.BOTH, expand=True)
 
         # Create status label for feedback
         self.status_label = tk.Label(self.root, text="", font=("Arial", 12))
         self.status_label.pack(pady=5)
 
-        # Bind click events
-        self.canvas.bind("<Button-1>", self.on_click)
-
-        # Pre-calculate canvas geometries for all countries
-        self.canvas_geometries = {}
-        for country_name, geo_geometry in self.quiz_manager.country_data.items():
-            canvas_coords = []
-            if hasattr(geo_geometry, "geoms"):  # MultiPolygon
-                for polygon in geo_geometry.geoms:
-                    poly_coords = []
-                    for x, y in polygon.exterior.coords:
-                        canvas_x, canvas_y = self.projector.geo_to_canvas(x, y)
-                        poly_coords.extend([canvas_x, canvas_y])
-                    canvas_coords.append(poly_coords)
-            else:  # Polygon
-                poly_coords = []
-                for x, y in geo_geometry.exterior.coords:
-                    canvas_x, canvas_y = self.projector.geo_to_canvas(x, y)
-                    poly_coords.extend([canvas_x, canvas_y])
-                canvas_coords.append(poly_coords)
-
-            self.canvas_geometries[country_name] = canvas_coords
-
-        # Track country colors for visual feedback
-        self.country_colors = {}
+        # A left click answers, a left-button drag pans and the mouse wheel zooms
+        self.viewport = Viewport(self.canvas_width, self.canvas_height)
+        self._drag_origin: tuple[int, int] | None = None
+        self._drag_last = (0, 0)
+        self._dragging = False
+        self._redraw_job: str | None = None
+        self._drawn_tier = 0
+        self.canvas.bind("<ButtonPress-1>", self.on_press)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_release)
+        self.canvas.bind("<MouseWheel>", self.on_wheel)  # Windows and macOS
+        self.canvas.bind("<Button-4>", self.on_wheel)  # X11 wheel up
+        self.canvas.bind("<Button-5>", self.on_wheel)  # X11 wheel down
+
+        # Window resizes rescale the drawn map once the size settles
+        self._resize_job: str | None = None
+        self._pending_size = (self.canvas_width, self.canvas_height)
+        self.canvas.bind("<Configure>", self.on_configure)
+
+        # Simplify outlines once per zoom level, then pre-calculate canvas geometries
+        # for all countries from the base tier, packed into one int32 buffer and indexed
+        # by country ID
+        self.simplification_tiers = build_simplification_tiers(
+            list(self.quiz_manager.country_data.values()),
+            self.projector,
+            topology=self.quiz_manager.dataset.topology,
+        )
+        # The app keeps each tier's packed rings, so the tiers' cached plane coordinates
+        # are released as soon as they are packed
+        self.canvas_geometries = self.simplification_tiers[0].canvas_rings(self.projector)
+        self.simplification_tiers[0].clear_projected()
+        # Per tier index: rings projected at the tier's zoom, with their scale relative to
+        # base map pixels
+        self._tier_rings: dict[int, tuple[PackedRings, float, float]] = {
+            0: (self.canvas_geometries, 1.0, 1.0)
+        }
+
+        # Canvas polygons are outlines only, so draw larger countries first and let
+        # enclaves (e.g. Lesotho inside South Africa's hole) paint on top of them
+        self.draw_order = self.quiz_manager.store.innermost_first[::-1].tolist()
+
+        # Feedback colors are owned by the session; the map only renders them
+        self.color_codes = self.session.color_codes
+        self.country_colors = self.session.colors  # By-name view, for display
+
+        # Canvas item ids per country ID, created by draw_map and restyled in place on
+        # clicks; set incremental_redraw to False to redraw the whole map every click
+        self.country_items: list[list[int]] = []
+        self.label_items: list[int | None] = []
+        self.incremental_redraw = True
+
+    def tier_rings(self, tier_index: int) -> tuple[PackedRings, float, float]:
+        """Canvas rings of a simplification tier at its own zoom, projected on first use.
+
+        Returns:
+            Tuple of (rings, x scale, y scale), the scales relative to base map pixels
+        """
+        cached = self._tier_rings.get(tier_index)
+        if cached is None:
+            projector = self.projector
+            tier = self.simplification_tiers[tier_index]
+            zoomed = projector.scaled(tier.zoom)
+            cached = (
+                tier.canvas_rings(zoomed),
+                zoomed.x_scale / projector.x_scale,
+                zoomed.y_scale / projector.y_scale,
+            )
+            tier.clear_projected()
+            self._tier_rings[tier_index] = cached
+        return cached
 
     def draw_map(self) -> None:
+        """Draw every visible country from scratch and remember the canvas item ids.
+
+        Countries whose bounds miss the viewport are skipped, and outlines come from
+        the coarsest simplification tier that is still accurate at the current zoom.
+        """
         # Clear canvas
         self.canvas.delete("all")
+        country_names = self.quiz_manager.country_names
+        self.country_items = [[] for _ in country_names]
+        self.label_items = [None] * len(country_names)
+
+        viewport = self.viewport
+        tier_index = tier_for_zoom(self.simplification_tiers, viewport.scale)
+        self._drawn_tier = tier_index
+        rings, scale_x, scale_y = self.tier_rings(tier_index)
+        visible = viewport.visible(self.quiz_manager.dataset.bounds, self.projector).tolist()
+        as_is = viewport.is_identity and tier_index == 0
 
         # Draw all countries
-        for country_name, canvas_coords_list in self.canvas_geometries.items():
-            color = self.country_colors.get(country_name, "")
+        for country_id in self.draw_order:
+            if not visible[country_id]:
+                continue
+            country_name = country_names[country_id]
+            color = COLORS[self.color_codes[country_id]]
             outline_color = "black"
 
-            for canvas_coords in canvas_coords_list:
+            items = []
+            for canvas_coords in rings[country_id]:
                 if len(canvas_coords) >= 6:  # Need at least 3 points (6 coordinates)
-                    if color:
-                        self.canvas.create_polygon(
-                            canvas_coords, fill=color, outline=outline_color, tags=country_name
-                        )
+                    # Tk only takes Python numbers, so the packed slice is expanded (and
+                    # moved into view) just for the call
+                    if as_is:
+                        screen_coords = canvas_coords.tolist()
                     else:
+                        points = np.frombuffer(canvas_coords, dtype=np.int32).reshape(-1, 2)
+                        screen = viewport.to_screen_array(points, scale_x, scale_y)
+                        screen_coords = screen.ravel().tolist()
+                    items.append(
                         self.canvas.create_polygon(
-                            canvas_coords, fill="", outline=outline_color, tags=country_name
+                            screen_coords,
+                            fill=color,
+                            outline=outline_color,
+                            tags=country_name,
                         )
+                    )
+            self.country_items[country_id] = items
 
         # Draw country labels for colored countries
-        for country_name, color in self.country_colors.items():
-            if color:
-                # Find centroid of first polygon for label placement
-                canvas_coords = self.canvas_geometries[country_name][0]
-                if len(canvas_coords) >= 6:
-                    # Simple centroid calculation
-                    x_coords = canvas_coords[::2]
-                    y_coords = canvas_coords[1::2]
-                    center_x = sum(x_coords) / len(x_coords)
-                    center_y = sum(y_coords) / len(y_coords)
-
-                    self.canvas.create_text(
-                        center_x,
-                        center_y,
-                        text=country_name,
-                        font=("Arial", 8, "bold"),
-                        fill="white" if color == "red" else "black",
-                    )
+        for country_id in colored_ids(self.color_codes):
+            self._draw_label(country_id, COLORS[self.color_codes[country_id]])
+
+    def _draw_label(self, country_id: int, color: str) -> None:
+        # Find centroid of first polygon for label placement
+        canvas_coords = self.canvas_geometries[country_id][0]
+        if len(canvas_coords) >= 6:
+            # Simple centroid calculation
+            x_coords = canvas_coords[::2]
+            y_coords = canvas_coords[1::2]
+            center_x, center_y = self.viewport.map_to_screen(
+                sum(x_coords) / len(x_coords), sum(y_coords) / len(y_coords)
+            )
 
-    def on_click(self, event: Any) -> None:
-        x, y = event.x, event.y
-        is_correct, clicked_country = self.quiz_manager.handle_click(x, y)
-        current_country = self.quiz_manager.get_current_country()
+            self.label_items[country_id] = self.canvas.create_text(
+                center_x,
+                center_y,
+                text=self.quiz_manager.country_names[country_id],
+                font=("Arial", 8, "bold"),
+                fill=_label_color(color),
+            )
 
-        if clicked_country:
-            if is_correct:
-                self.country_colors[clicked_country] = "green"
-                self.status_label.config(text=f"Correct! {clicked_country}")
+    def update_country(self, country_id: int) -> None:
+        """Restyle one country's existing canvas items to match its current color."""
+        color = COLORS[self.color_codes[country_id]]
+        for item in self.country_items[country_id]:
+            self.canvas.itemconfigure(item, fill=color)
+
+        # Labels are created on first use and then only shown or hidden
+        label = self.label_items[country_id]
+        if color:
+            if label is None:
+                self._draw_label(country_id, color)
             else:
-                self.country_colors[current_country] = "red"
-                self.status_label.config(
-                    text=(
-                        f"Incorrect. You clicked {clicked_country}, "
-                        f"correct answer: {current_country}"
-                    )
-                )
-        else:
-            # Ocean click
-            self.country_colors[current_country] = "red"
-            self.status_label.config(text=f"Ocean click. Correct answer: {current_country}")
+                self.canvas.itemconfigure(label, fill=_label_color(color), state="normal")
+        elif label is not None:
+            self.canvas.itemconfigure(label, state="hidden")
+
+    def on_press(self, event: Any) -> None:
+        self._drag_origin = self._drag_last = (event.x, event.y)
+        self._dragging = False
+
+    def on_drag(self, event: Any) -> None:
+        if self._drag_origin is None:
+            return
+        if not self._dragging:
+            origin_x, origin_y = self._drag_origin
+            if max(abs(event.x - origin_x), abs(event.y - origin_y)) < DRAG_THRESHOLD:
+                return  # Still a click
+            self._dragging = True
+
+        last_x, last_y = self._drag_last
+        self._drag_last = (event.x, event.y)
+        before = self._view_state()
+        self.viewport.pan(event.x - last_x, event.y - last_y)
+        self._follow_view(before)
+
+    def on_release(self, event: Any) -> None:
+        dragged = self._dragging
+        self._drag_origin = None
+        self._dragging = False
+        if not dragged:
+            self.on_click(event)
+
+    def on_wheel(self, event: Any) -> None:
+        zoom_in = getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0
+        before = self._view_state()
+        self.viewport.zoom_at(event.x, event.y, ZOOM_STEP if zoom_in else 1 / ZOOM_STEP)
+        self._follow_view(before)
+
+    def on_configure(self, event: Any) -> None:
+        self._pending_size = (event.width, event.height)
+        if self._pending_size == (self.viewport.screen_width, self.viewport.screen_height):
+            return
+        # Dragging a window edge fires a stream of events; only act on the last one
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
+        self._resize_job = self.root.after(RESIZE_DELAY_MS, self.apply_resize)
+
+    def apply_resize(self) -> None:
+        """Fit the map to the latest canvas size by rescaling the items already drawn.
+
+        Nothing is reprojected. A redraw only follows when the new scale calls for
+        another simplification tier, or when zoomed in, where a larger window uncovers
+        countries that were culled.
+        """
+        self._resize_job = None
+        before = self._view_state()
+        self.viewport.resize(*self._pending_size)
+        viewport = self.viewport
+        self._follow_view(before, redraw=False)
+        # Growing the side that does not limit the fit leaves the view state unchanged
+        # but still uncovers map, so the redraw decision is independent of the transform
+        if (
+            tier_for_zoom(self.simplification_tiers, viewport.scale) != self._drawn_tier
+            or viewport.zoom > viewport.min_zoom
+        ):
+            self.schedule_redraw()
+
+    def _view_state(self) -> tuple[float, float, float]:
+        return (self.viewport.scale, self.viewport.x, self.viewport.y)
+
+    def _follow_view(self, before: tuple[float, float, float], redraw: bool = True) -> None:
+        # Move the existing items with one affine canvas operation for instant feedback,
+        # then redraw culled and at the right detail once the view settles
+        scale, x, y = before
+        viewport = self.viewport
+        if before == self._view_state():
+            return
+        if viewport.scale != scale:
+            ratio = viewport.scale / scale
+            self.canvas.scale("all", 0, 0, ratio, ratio)
+        self.canvas.move(
+            "all", (x - viewport.x) * viewport.scale, (y - viewport.y) * viewport.scale
+        )
+        if redraw:
+            self.schedule_redraw()
 
-        # Redraw map with new colors
+    def schedule_redraw(self) -> None:
+        """Redraw the map once no view change has arrived for REDRAW_DELAY_MS."""
+        if self._redraw_job is not None:
+            self.root.after_cancel(self._redraw_job)
+        self._redraw_job = self.root.after(REDRAW_DELAY_MS, self._redraw)
+
+    def _redraw(self) -> None:
+        self._redraw_job = None
         self.draw_map()
 
-        # Progress to next country
-        self.quiz_manager.current_country_index += 1
+    def on_click(self, event: Any) -> None:
+        x, y = self.viewport.screen_to_map(event.x, event.y)
+        outcome = self.session.click(x, y)
+
+        if outcome.correct:
+            self.status_label.config(text=f"Correct! {outcome.clicked}")
+        elif outcome.clicked:
+            self.status_label.config(
+                text=(f"Incorrect. You clicked {outcome.clicked}, correct answer: {outcome.target}")
+            )
+        else:
+            self.status_label.config(text=f"Ocean click. Correct answer: {outcome.target}")
 
-        # Update prompt for next country (or reset round)
-        if self.quiz_manager.is_round_complete():
-            # Show completion message and start new round
+        incremental = self.incremental_redraw and self.country_items
+        if outcome.round_complete:
+            # Show completion message; the session has already started a new round
             total_countries = len(self.quiz_manager.countries)
             self.status_label.config(
                 text=(
@@ -202,23 +399,40 @@ class AfricaQuizApp:
                     f"African countries. Starting new round..."
                 )
             )
-            self.country_colors.clear()
-            self.quiz_manager.start_new_round()
-            self.draw_map()  # Redraw to clear labels
-            next_country = self.quiz_manager.get_current_country()
-            self.prompt_label.config(text=f"Click on: {next_country}")
+            if incremental:
+                # Reuse polygons and labels for the next round
+                for country_id in outcome.cleared_ids:
+                    self.update_country(country_id)
+            else:
+                self.draw_map()  # Redraw to clear labels
+        elif incremental:
+            self.update_country(outcome.target_id)  # Restyle only the country that changed
         else:
-            next_country = self.quiz_manager.get_current_country()
-            self.prompt_label.config(text=f"Click on: {next_country}")
+            self.draw_map()
+
+        next_country = self.quiz_manager.get_current_country()
+        self.prompt_label.config(text=f"Click on: {next_country}")
+
+
+def _label_color(color: str) -> str:
+    return "white" if color == "red" else "black"
 
 
-def main(geojson_path: str = "africa.geojson") -> None:
+def main(
+    geojson_path: str | CountryDataset = "africa.geojson",
+    projection: str = "equirectangular",
+    use_cache: bool = True,
+) -> None:
     """Main entry point for the Africa Quiz application.
 
     Args:
-        geojson_path: Path to the GeoJSON file containing Africa country data
+        geojson_path: Path to the GeoJSON file containing Africa country data, or an
+            already loaded CountryDataset
+        projection: Map projection, one of africa_quiz.projection.PROJECTIONS
+        use_cache: Load geometries from (and refresh) the binary cache next to the
+            GeoJSON file
     """
-    app = AfricaQuizApp(geojson_path)
+    app = AfricaQuizApp(geojson_path, use_cache=use_cache, projection=projection)
     if hasattr(app, "root"):  # Only proceed if initialization succeeded
         app.draw_map()  # Draw the initial map
         app.root.mainloop()
@@ -227,8 +441,5 @@ def main(geojson_path: str = "africa.geojson") -> None:
 if __name__ == "__main__":
     import sys
 
-    # Support command line argument for GeoJSON path
-    if len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main()
+    # Support command line arguments for GeoJSON path and projection
+    main(*sys.argv[1:3])
@@ -0,0 +1,127 @@
+"""Binary on-disk cache of parsed country geometries for fast warm starts.
+
+Cache layout (little endian), stored next to the source as ``<source>.cache``:
+
+    8 bytes   magic ``AQCACHE2`` (version 1 caches predate interior rings)
+    8 bytes   header length in bytes (uint64)
+    header    UTF-8 JSON: source fingerprint, country names, bbox
+    padding   zero bytes up to an 8-byte boundary
+    offsets   int64[n + 1] byte offsets of each geometry within the WKB blob
+    blob      concatenated WKB of every country geometry, in load order
+
+The file is memory-mapped on load, so only the header is parsed as JSON and the
+geometries are decoded straight from WKB without re-validating them.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+from itertools import pairwise
+from pathlib import Path
+
+import numpy as np
+import shapely
+from shapely.errors import ShapelyError
+
+from .dataset import CountryDataset
+
+CACHE_MAGIC = b"AQCACHE2"
+CACHE_SUFFIX = ".cache"
+
+
+def cache_path_for(geojson_path: str | Path) -> Path:
+    """Return where the cache for a GeoJSON file lives."""
+    geojson_path = Path(geojson_path)
+    return geojson_path.with_name(geojson_path.name + CACHE_SUFFIX)
+
+
+def source_fingerprint(geojson_path: str | Path) -> dict:
+    """Identify a source file's content by modification time, size and SHA-256."""
+    geojson_path = Path(geojson_path)
+    stat = geojson_path.stat()
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(geojson_path.read_bytes()).hexdigest(),
+    }
+
+
+def write_dataset_cache(dataset: CountryDataset, geojson_path: str | Path) -> Path | None:
+    """Write the dataset's geometries to the cache next to its source file.
+
+    Args:
+        dataset: Dataset loaded from geojson_path
+        geojson_path: Source GeoJSON file the dataset was parsed from
+
+    Returns:
+        Path of the written cache, or None if it could not be written
+    """
+    cache_path = cache_path_for(geojson_path)
+    wkb = shapely.to_wkb(dataset.geometries)
+    offsets = np.zeros(len(wkb) + 1, dtype="<i8")
+    np.cumsum([len(blob) for blob in wkb], out=offsets[1:])
+
+    header = json.dumps(
+        {
+            "source": source_fingerprint(geojson_path),
+            "names": dataset.names,
+            "bbox": list(dataset.bbox),
+        }
+    ).encode()
+    padding = b"\0" * (-(len(CACHE_MAGIC) + 8 + len(header)) % 8)
+
+    # Write to a temporary file first so a crash never leaves a truncated cache behind
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(CACHE_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(padding)
+            f.write(offsets.tobytes())
+            f.write(b"".join(wkb))
+        tmp_path.replace(cache_path)
+    except OSError:
+        # The cache is only an optimization; read-only data directories are fine
+        tmp_path.unlink(missing_ok=True)
+        return None
+    return cache_path
+
+
+def load_cached_dataset(geojson_path: str | Path) -> CountryDataset | None:
+    """Load a dataset from the cache if it exists and matches the source file.
+
+    Args:
+        geojson_path: Source GeoJSON file
+
+    Returns:
+        Cached dataset, or None if the cache is missing, stale or unreadable
+    """
+    cache_path = cache_path_for(geojson_path)
+    try:
+        fingerprint = source_fingerprint(geojson_path)
+        with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[: len(CACHE_MAGIC)] != CACHE_MAGIC:
+                return None
+            (header_len,) = struct.unpack_from("<Q", mm, len(CACHE_MAGIC))
+            header_start = len(CACHE_MAGIC) + 8
+            header = json.loads(mm[header_start : header_start + header_len])
+            if header["source"] != fingerprint:
+                return None
+
+            names = header["names"]
+            offsets_start = header_start + header_len
+            offsets_start += -offsets_start % 8
+            offsets = np.frombuffer(mm, dtype="<i8", count=len(names) + 1, offset=offsets_start)
+            blob_start = offsets_start + offsets.nbytes
+            bounds = (blob_start + offsets).tolist()
+            wkb = [mm[start:end] for start, end in pairwise(bounds)]
+            del offsets  # Release the buffer export before the mapping is closed
+        geometries = shapely.from_wkb(wkb)
+    except (OSError, ValueError, KeyError, struct.error, ShapelyError):
+        return None
+
+    return CountryDataset.from_geometries(
+        dict(zip(names, geometries)), tuple(header["bbox"]), source=geojson_path
+    )
@@ -0,0 +1,317 @@
+"""Country dataset loading for Africa Geography Quiz Game."""
+
+import json
+from collections.abc import Iterable
+from itertools import batched
+from pathlib import Path
+
+import numpy as np
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+from .projection import CoordinateProjector
+from .topology import Topology
+from .validation import LoadReport, build_countries
+
+# Features validated together when building from a stream
+STREAM_BATCH_SIZE = 1024
+
+
+class CountryDataset:
+    """Country features parsed once from GeoJSON and shared by the quiz logic and the UI."""
+
+    def __init__(
+        self,
+        geojson_data: dict,
+        source: str | Path | None = None,
+        workers: int = 1,
+        repair: bool = False,
+    ) -> None:
+        """Build country geometries from an already parsed GeoJSON document.
+
+        Args:
+            geojson_data: Parsed GeoJSON FeatureCollection
+            source: Where the data came from, used in error messages
+            workers: Number of processes to build and validate geometries in, capped at
+                the CPU count; 1 builds them in this process
+            repair: Fix invalid geometries with make_valid instead of skipping them
+
+        Raises:
+            ValueError: If the document is not a FeatureCollection or has no usable countries
+        """
+        self.source = str(source) if source is not None else None
+        self._bbox: tuple[float, float, float, float] | None = None
+        self._bounds: np.ndarray | None = None
+        self.topology: Topology | None = None
+        self.load_report: LoadReport | None = None  # What happened to each feature
+
+        # Validate GeoJSON structure
+        if not isinstance(geojson_data, dict) or "features" not in geojson_data:
+            raise ValueError("Invalid GeoJSON format: missing 'features' key")
+
+        if not isinstance(geojson_data["features"], list):
+            raise ValueError("Invalid GeoJSON format: 'features' must be a list")
+
+        self._geojson_data: dict | None = geojson_data
+        self.country_data: dict[str, BaseGeometry] = {}  # Country name -> shapely geometry
+
+        if workers > 1:
+            from .parallel import build_geometries_parallel
+
+            names, geometries, self.load_report = build_geometries_parallel(
+                geojson_data["features"], workers, repair
+            )
+        else:
+            _, names, geometries, self.load_report = build_countries(
+                geojson_data["features"], repair
+            )
+        # Later features with a repeated name replace earlier ones
+        self.country_data.update(zip(names, geometries))
+
+        self._require_countries()
+
+    def _require_countries(self) -> None:
+        # Validate that we loaded some countries
+        if not self.country_data:
+            raise ValueError(f"No valid countries found in GeoJSON file: {self.source}")
+
+    @classmethod
+    def from_path(
+        cls,
+        geojson_path: str | Path,
+        use_cache: bool = False,
+        stream: bool = False,
+        topology: bool = False,
+        workers: int = 1,
+        repair: bool = False,
+    ) -> "CountryDataset":
+        """Parse a GeoJSON (or TopoJSON) file once and build the dataset from it.
+
+        TopoJSON input is detected from its "type" and always loaded with its topology.
+        Its arcs are needed all at once, so it is read whole even when stream is set.
+
+        Args:
+            geojson_path: Path to the GeoJSON file containing country data
+            use_cache: Load from (and refresh) the binary cache next to the file, so warm
+                starts skip JSON parsing and geometry validation
+            stream: Read features incrementally instead of loading the whole document,
+                keeping peak memory bounded for very large files
+            topology: Also build the shared-border arc store (see dataset.topology); the
+                binary cache does not hold arcs, so it is bypassed
+            workers: Number of processes to build GeoJSON geometries in (see
+                CountryDataset); streamed and topology loads build them in this process
+            repair: Fix invalid geometries with make_valid instead of skipping them; the
+                binary cache stores whatever was loaded, so it is bypassed
+
+        Returns:
+            Loaded dataset
+        """
+        if topology or repair:
+            use_cache = False
+
+        if use_cache:
+            from .cache import load_cached_dataset, write_dataset_cache
+
+            dataset = load_cached_dataset(geojson_path)
+            if dataset is not None:
+                return dataset
+
+        if stream:
+            from .streaming import iter_geojson_features, read_document_type
+
+            # TopoJSON has no feature list to stream; load it below like any TopoJSON
+            stream = read_document_type(geojson_path) != "Topology"
+
+        if stream:
+            features = iter_geojson_features(geojson_path)
+            if topology:
+                dataset = cls.from_topology(
+                    Topology.from_features(features), source=geojson_path, repair=repair
+                )
+            else:
+                dataset = cls.from_features(features, source=geojson_path, repair=repair)
+        else:
+            geojson_data = _read_geojson(geojson_path)
+            if isinstance(geojson_data, dict) and geojson_data.get("type") == "Topology":
+                topology_data = Topology.from_topojson(geojson_data)
+                dataset = cls.from_topology(topology_data, source=geojson_path, repair=repair)
+            elif topology:
+                topology_data = Topology.from_geojson(geojson_data)
+                dataset = cls.from_topology(topology_data, source=geojson_path, repair=repair)
+            else:
+                dataset = cls(geojson_data, source=geojson_path, workers=workers, repair=repair)
+
+        if use_cache and dataset.topology is None:
+            write_dataset_cache(dataset, geojson_path)
+        return dataset
+
+    @classmethod
+    def from_features(
+        cls, features: Iterable[dict], source: str | Path | None = None, repair: bool = False
+    ) -> "CountryDataset":
+        """Build a dataset from a stream of features without keeping the raw features.
+
+        Geometries and the bounding box are built as features arrive, in batches of
+        STREAM_BATCH_SIZE, so each batch can be released as soon as it has been processed.
+
+        Args:
+            features: GeoJSON features, e.g. from iter_geojson_features
+            source: Path of the source GeoJSON file
+            repair: Fix invalid geometries with make_valid instead of skipping them
+
+        Returns:
+            Loaded dataset
+        """
+        dataset = cls.from_geometries({}, None, source=source)
+        dataset.load_report = LoadReport()
+        min_lon = min_lat = float("inf")
+        max_lon = max_lat = float("-inf")
+        bbox_known = True
+
+        start = 0
+        for batch in batched(features, STREAM_BATCH_SIZE):
+            _, names, geometries, report = build_countries(batch, repair, start)
+            dataset.country_data.update(zip(names, geometries))
+            dataset.load_report.extend(report)
+            start += len(batch)
+            if bbox_known:
+                try:
+                    feature_bbox = CoordinateProjector.calculate_bbox({"features": batch})
+                except Exception:
+                    # Leave the bbox to be computed (and fail) from the source on demand
+                    bbox_known = False
+                    continue
+                min_lon = min(min_lon, feature_bbox[0])
+                min_lat = min(min_lat, feature_bbox[1])
+                max_lon = max(max_lon, feature_bbox[2])
+                max_lat = max(max_lat, feature_bbox[3])
+
+        if bbox_known:
+            dataset._bbox = (min_lon, min_lat, max_lon, max_lat)
+        dataset._require_countries()
+        return dataset
+
+    @classmethod
+    def from_topology(
+        cls, topology: Topology, source: str | Path | None = None, repair: bool = False
+    ) -> "CountryDataset":
+        """Build a dataset from a shared-border topology.
+
+        Geometries are decoded from the arcs with the usual feature rules, and the
+        dataset keeps a topology restricted to the loaded countries (sharing the arc
+        arrays) so the canvas precompute can project each shared vertex once.
+
+        Args:
+            topology: Topology built from GeoJSON or loaded from TopoJSON
+            source: Path of the source file
+            repair: Fix invalid geometries with make_valid instead of skipping them; the
+                arcs keep the original outlines
+
+        Returns:
+            Loaded dataset
+        """
+        dataset = cls.from_geometries({}, topology.bbox, source=source)
+        indices, names, geometries, dataset.load_report = build_countries(
+            topology.to_features(), repair
+        )
+        dataset.country_data.update(zip(names, geometries))
+        objects = {name: topology.objects[index] for index, name in zip(indices, names)}
+
+        dataset.topology = Topology(
+            topology.coords,
+            topology.arc_offsets,
+            [objects[name] for name in dataset.country_data],
+        )
+        dataset._require_countries()
+        return dataset
+
+    @classmethod
+    def from_geometries(
+        cls,
+        country_data: dict[str, BaseGeometry],
+        bbox: tuple[float, float, float, float] | None,
+        source: str | Path | None = None,
+    ) -> "CountryDataset":
+        """Build a dataset from already validated geometries, e.g. read from a cache.
+
+        The raw GeoJSON document is only parsed again if features are requested.
+
+        Args:
+            country_data: Mapping of country name to geometry, in load order
+            bbox: Geographic bounding box of the source document, or None to compute it
+                from the source when first requested
+            source: Path of the source GeoJSON file
+
+        Returns:
+            Dataset sharing the given mapping
+        """
+        dataset = cls.__new__(cls)
+        dataset.source = str(source) if source is not None else None
+        dataset._bbox = bbox
+        dataset._bounds = None
+        dataset._geojson_data = None
+        dataset.topology = None
+        dataset.load_report = None
+        dataset.country_data = country_data
+        return dataset
+
+    @property
+    def geojson_data(self) -> dict:
+        """Raw GeoJSON document, re-read from the source when loaded from a cache.
+
+        Topology datasets decode their loaded countries from the arcs instead.
+        """
+        if self._geojson_data is None and self.topology is not None:
+            features = self.topology.to_features()
+            self._geojson_data = {"type": "FeatureCollection", "features": features}
+        if self._geojson_data is None:
+            if self.source is None:
+                raise ValueError("Dataset has no GeoJSON source to read features from")
+            self._geojson_data = _read_geojson(self.source)
+        return self._geojson_data
+
+    @property
+    def features(self) -> list[dict]:
+        """Raw GeoJSON features of the source document."""
+        return self.geojson_data["features"]
+
+    @property
+    def names(self) -> list[str]:
+        """Country names in load order."""
+        return list(self.country_data)
+
+    @property
+    def geometries(self) -> list[BaseGeometry]:
+        """Country geometries in load order."""
+        return list(self.country_data.values())
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """Per-country (min_lon, min_lat, max_lon, max_lat) rows in load order.
+
+        Useful for spatial indexing and for culling countries outside a viewport.
+        """
+        if self._bounds is None:
+            self._bounds = shapely.bounds(self.geometries)
+        return self._bounds
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        """Geographic bounding box of every polygon feature in the source document."""
+        if self._bbox is None:
+            self._bbox = CoordinateProjector.calculate_bbox(self.geojson_data)
+        return self._bbox
+
+
+def _read_geojson(geojson_path: str | Path) -> dict:
+    try:
+        with open(geojson_path) as f:
+            return json.load(f)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"GeoJSON file not found: {geojson_path}") from e
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid GeoJSON format: {e}") from e
+    except PermissionError as e:
+        raise PermissionError(f"Permission denied accessing GeoJSON file: {geojson_path}") from e
+    except Exception as e:
+        raise RuntimeError(f"Unexpected error loading GeoJSON file {geojson_path}: {e}") from e
@@ -0,0 +1,147 @@
+"""Pixel raster hit map for constant-time canvas click lookups."""
+
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry.base import BaseGeometry
+
+from .projection import CoordinateProjector
+
+# Lookup result for pixels known to be water; undecided pixels return None
+OCEAN = -1
+
+# Batch lookup result for pixels that need an exact test (None in scalar lookups)
+UNRESOLVED = -2
+
+
+class RasterHitMap:
+    """Label raster mapping every canvas pixel to the index of the country under it.
+
+    The canvas is split into square cells. A cell whose geographic extent lies strictly
+    inside a country is labelled with that country, a cell touching no country is ocean,
+    and every other cell (borders, coastlines, overlaps) is marked ambiguous so callers
+    fall back to an exact geometric test for those pixels.
+    """
+
+    def __init__(
+        self,
+        geometries: list[BaseGeometry],
+        projector: CoordinateProjector,
+        cell_size: int = 4,
+        precedence: np.ndarray | None = None,
+    ) -> None:
+        """Rasterize geometries onto the projector's canvas.
+
+        Args:
+            geometries: Country geometries; labels are indices into this list
+            projector: Projector defining canvas size and pixel-to-geo mapping
+            cell_size: Edge length in pixels of the cells classified as a whole
+            precedence: Rank per geometry; where countries overlap the lowest rank wins.
+                Defaults to list order
+        """
+        if cell_size < 1:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+
+        self.width = projector.canvas_width
+        self.height = projector.canvas_height
+        self.cell_size = cell_size
+
+        # Smallest unsigned type that fits every label plus the ocean and ambiguous values
+        for dtype in (np.uint8, np.uint16, np.uint32):
+            if len(geometries) + 2 <= np.iinfo(dtype).max:
+                break
+        self._ambiguous = np.iinfo(dtype).max
+        if precedence is None:
+            precedence = np.arange(len(geometries))
+        self.labels = self._rasterize(geometries, projector, dtype, np.asarray(precedence))
+
+    def _rasterize(
+        self,
+        geometries: list[BaseGeometry],
+        projector: CoordinateProjector,
+        dtype: type,
+        precedence: np.ndarray,
+    ) -> np.ndarray:
+        # Cell boxes span [x0, x0 + cell_size] so they cover every click position in the
+        # cell; their geographic bounds cover all those click points in any projection.
+        # Edges bend by far less than the bounds' margin over a few pixels, so the corners
+        # suffice
+        x0 = np.arange(0, self.width, self.cell_size)
+        y0 = np.arange(0, self.height, self.cell_size)
+        corners = np.stack(np.meshgrid(x0, y0), axis=-1).reshape(-1, 2)
+        bounds = projector.canvas_boxes_to_geo(corners, corners + self.cell_size, samples=2)
+        boxes = shapely.box(bounds[:, 0], bounds[:, 1], bounds[:, 2], bounds[:, 3])
+
+        # Highest-precedence country touching each cell, mirroring the exact hit test; if
+        # it does not cover the whole cell, the cell is ambiguous
+        cell_index, geom_index = STRtree(geometries).query(boxes, predicate="intersects")
+        first_rank = np.full(len(boxes), len(geometries), dtype=np.int64)
+        np.minimum.at(first_rank, cell_index, precedence[geom_index])
+        touched = first_rank < len(geometries)
+        by_rank = np.argsort(precedence)
+        first = np.where(touched, by_rank[np.minimum(first_rank, len(geometries) - 1)], 0)
+
+        cell_labels = np.zeros(len(boxes), dtype=dtype)  # 0 = ocean
+        cell_labels[touched] = self._ambiguous
+        candidates = np.flatnonzero(touched)
+        inside = shapely.contains_properly(
+            np.asarray(geometries, dtype=object)[first[candidates]], boxes[candidates]
+        )
+        cell_labels[candidates[inside]] = first[candidates[inside]] + 1
+
+        # Expand cells to pixels and crop the partial cells on the right and bottom edges
+        cell_labels = cell_labels.reshape(len(y0), len(x0))
+        pixels = np.repeat(np.repeat(cell_labels, self.cell_size, axis=0), self.cell_size, axis=1)
+        return np.ascontiguousarray(pixels[: self.height, : self.width])
+
+    def lookup(self, x: int, y: int) -> int | None:
+        """Return the country index at a canvas pixel.
+
+        Args:
+            x: Canvas x coordinate in pixels
+            y: Canvas y coordinate in pixels
+
+        Returns:
+            Country index, OCEAN for water, or None when the pixel is ambiguous,
+            outside the canvas or fractional and needs an exact geometric test
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height) or x != int(x) or y != int(y):
+            return None
+        label = int(self.labels[int(y), int(x)])
+        if label == self._ambiguous:
+            return None
+        return label - 1  # 0 (ocean) maps onto OCEAN
+
+    def lookup_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Look up many canvas points at once.
+
+        Args:
+            xs: Canvas x coordinates
+            ys: Canvas y coordinates, same shape as xs
+
+        Returns:
+            Int array of country indices, OCEAN for water, or UNRESOLVED where lookup
+            would return None
+        """
+        xs = np.asarray(xs).ravel()
+        ys = np.asarray(ys).ravel()
+        result = np.full(len(xs), UNRESOLVED, dtype=np.int64)
+
+        # Only whole pixels on the canvas can be read from the raster
+        on_canvas = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        on_canvas &= (xs == np.floor(xs)) & (ys == np.floor(ys))
+        labels = self.labels[ys[on_canvas].astype(np.intp), xs[on_canvas].astype(np.intp)]
+        result[on_canvas] = np.where(
+            labels == self._ambiguous, UNRESOLVED, labels.astype(np.int64) - 1
+        )
+        return result
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the label raster in bytes."""
+        return self.labels.nbytes
+
+    @property
+    def ambiguous_fraction(self) -> float:
+        """Share of canvas pixels that fall back to exact testing."""
+        return float(np.count_nonzero(self.labels == self._ambiguous)) / self.labels.size
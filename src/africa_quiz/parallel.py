@@ -0,0 +1,76 @@
+"""Parallel country geometry build across worker processes for large boundary files."""
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+from .validation import LoadReport, build_countries
+
+
+def _build_chunk(
+    start: int, features: list[dict], repair: bool
+) -> tuple[list[str], list[bytes], LoadReport]:
+    # Runs in a worker: apply the usual feature rules and ship survivors back as WKB,
+    # which pickles far smaller and faster than shapely objects
+    _, names, geometries, report = build_countries(features, repair, start)
+    return names, shapely.to_wkb(geometries).tolist(), report
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    # A fork server starts workers from a clean single-threaded process, so a threaded
+    # host (the Tk app, the asyncio server's executors) is never forked mid-lock
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
+
+def build_geometries_parallel(
+    features: list[dict], workers: int, repair: bool = False, chunks_per_worker: int = 4
+) -> tuple[list[str], list[BaseGeometry], LoadReport]:
+    """Build and validate country geometries in a process pool.
+
+    Features are split into contiguous chunks and results are merged in feature order,
+    so adding them to a dict gives exactly the mapping a sequential load would build,
+    including skipped features and repeated names. Each chunk is pickled to its worker
+    and only WKB comes back, so concurrent loads in one process stay independent.
+
+    Workers start from a fork server where the platform has one, otherwise with the
+    default start method. Where that method is fork, workers > 1 is unsafe from a
+    process that already runs threads, since a child can inherit a held lock.
+
+    Args:
+        features: GeoJSON features
+        workers: Number of worker processes; capped at the CPU count, and a single
+            worker builds in this process
+        repair: Fix invalid geometries with make_valid instead of skipping them
+        chunks_per_worker: Chunks per worker, trading scheduling overhead for balance
+
+    Returns:
+        Tuple of (names, geometries) of accepted countries in feature order, and the
+        load report of the whole document
+    """
+    # More processes than CPUs only adds startup and pickling cost
+    workers = min(workers, os.cpu_count() or 1)
+    if workers <= 1:
+        _, names, geometries, report = build_countries(features, repair)
+        return names, geometries, report
+
+    chunk_size = max(1, math.ceil(len(features) / (workers * chunks_per_worker)))
+    starts = range(0, len(features), chunk_size)
+    chunks = [features[start : start + chunk_size] for start in starts]
+    repairs = [repair] * len(starts)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_worker_context()) as executor:
+        results = list(executor.map(_build_chunk, starts, chunks, repairs))
+
+    names = []
+    geometries = []
+    report = LoadReport()
+    for chunk_names, wkb, chunk_report in results:
+        names.extend(chunk_names)
+        geometries.extend(shapely.from_wkb(wkb).tolist())
+        report.extend(chunk_report)
+    return names, geometries, report
@@ -1,11 +1,272 @@
 """Coordinate projection module for Africa Geography Quiz Game."""
 
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from itertools import chain
+from typing import ClassVar
+
+import numpy as np
+
+from .topology import Topology
+
+# Names accepted by make_projection
+PROJECTIONS = ("equirectangular", "mercator", "lambert", "albers")
+
+# Mercator stretches to infinity at the poles, so latitudes are clipped here
+MAX_MERCATOR_LAT = 85.05112878
+
+# Points sampled along each edge when bounding a curved outline, and the fraction of the
+# sampled extent added on every side to cover the curve between samples
+EDGE_SAMPLES = 17
+CURVED_EDGE_MARGIN = 0.01
+
+
+class Projection(ABC):
+    """Map projection from (longitude, latitude) in degrees to plane coordinates.
+
+    Subclasses implement vectorized forward and inverse transforms. Plane units are
+    arbitrary; CoordinateProjector scales the projected extent of a bounding box onto
+    the canvas. Projections are frozen dataclasses, so equal parameters compare and hash
+    equal and can key caches of projected coordinates.
+    """
+
+    name: ClassVar[str] = ""
+    # Meridians and parallels are straight axis-parallel lines, so a canvas rectangle
+    # covers exactly the geographic box spanned by its corners
+    cylindrical: ClassVar[bool] = False
+
+    @abstractmethod
+    def forward(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Project longitudes and latitudes in degrees to plane (x, y), y pointing north."""
+
+    @abstractmethod
+    def inverse(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Map plane (x, y) back to longitudes and latitudes in degrees."""
+
+    def forward_array(self, coords: np.ndarray) -> np.ndarray:
+        """Project an (n, 2) array of (longitude, latitude) pairs to plane coordinates."""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        projected = np.empty(coords.shape, dtype=np.float64)
+        projected[:, 0], projected[:, 1] = self.forward(coords[:, 0], coords[:, 1])
+        return projected
+
+    def projected_bounds(
+        self, bbox: tuple[float, float, float, float]
+    ) -> tuple[float, float, float, float]:
+        """Plane (min_x, min_y, max_x, max_y) extent of a geographic bounding box."""
+        min_lon, min_lat, max_lon, max_lat = bbox
+        if self.cylindrical:
+            (min_x, max_x), (min_y, max_y) = self.forward(
+                np.array([min_lon, max_lon]), np.array([min_lat, max_lat])
+            )
+            return (float(min_x), float(min_y), float(max_x), float(max_y))
+
+        # Parallels and meridians curve, but the outline of the box still bounds its image
+        lons = np.linspace(min_lon, max_lon, EDGE_SAMPLES * 8)
+        lats = np.linspace(min_lat, max_lat, EDGE_SAMPLES * 8)
+        edge_lon = np.concatenate(
+            [lons, lons, np.full_like(lats, min_lon), np.full_like(lats, max_lon)]
+        )
+        edge_lat = np.concatenate(
+            [np.full_like(lons, min_lat), np.full_like(lons, max_lat), lats, lats]
+        )
+        x, y = self.forward(edge_lon, edge_lat)
+        return (float(x.min()), float(y.min()), float(x.max()), float(y.max()))
+
+    def degree_scale(self, bbox: tuple[float, float, float, float]) -> tuple[float, float]:
+        """Largest plane distance covered by one degree inside a bounding box.
+
+        Returns:
+            Tuple of (max x units per degree, max y units per degree), over steps in
+            either longitude or latitude
+        """
+        min_lon, min_lat, max_lon, max_lat = bbox
+        step = 1e-3
+        lon, lat = np.meshgrid(
+            np.linspace(min_lon, max_lon - step, EDGE_SAMPLES),
+            np.linspace(min_lat, max_lat - step, EDGE_SAMPLES),
+        )
+        x, y = self.forward(lon, lat)
+        east_x, east_y = self.forward(lon + step, lat)
+        north_x, north_y = self.forward(lon, lat + step)
+        x_scale = max(np.abs(east_x - x).max(), np.abs(north_x - x).max()) / step
+        y_scale = max(np.abs(east_y - y).max(), np.abs(north_y - y).max()) / step
+        return (float(x_scale), float(y_scale))
+
+
+@dataclass(frozen=True)
+class Equirectangular(Projection):
+    """Plate carrée: longitude and latitude used directly as plane coordinates."""
+
+    name: ClassVar[str] = "equirectangular"
+    cylindrical: ClassVar[bool] = True
+
+    def forward(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return (lon, lat)
+
+    def inverse(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return (x, y)
+
+    def degree_scale(self, bbox: tuple[float, float, float, float]) -> tuple[float, float]:
+        return (1.0, 1.0)
+
+
+@dataclass(frozen=True)
+class Mercator(Projection):
+    """Conformal cylindrical projection on the unit sphere."""
+
+    name: ClassVar[str] = "mercator"
+    cylindrical: ClassVar[bool] = True
+
+    def forward(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        phi = np.radians(np.clip(lat, -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT))
+        return (np.radians(lon), np.arctanh(np.sin(phi)))
+
+    def inverse(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return (np.degrees(x), np.degrees(np.arctan(np.sinh(y))))
+
+
+@dataclass(frozen=True)
+class LambertAzimuthalEqualArea(Projection):
+    """Equal-area azimuthal projection on the unit sphere, centered on a point."""
+
+    center_lon: float = 0.0
+    center_lat: float = 0.0
+    name: ClassVar[str] = "lambert"
+
+    def forward(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        phi = np.radians(lat)
+        dlam = np.radians(np.subtract(lon, self.center_lon))
+        phi0 = np.radians(self.center_lat)
+        cos_c = np.sin(phi0) * np.sin(phi) + np.cos(phi0) * np.cos(phi) * np.cos(dlam)
+        k = np.sqrt(2.0 / (1.0 + cos_c))
+        x = k * np.cos(phi) * np.sin(dlam)
+        y = k * (np.cos(phi0) * np.sin(phi) - np.sin(phi0) * np.cos(phi) * np.cos(dlam))
+        return (x, y)
+
+    def inverse(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        phi0 = np.radians(self.center_lat)
+        rho = np.hypot(x, y)
+        c = 2.0 * np.arcsin(np.minimum(rho / 2.0, 1.0))
+        sin_c, cos_c = np.sin(c), np.cos(c)
+        # At the center rho is 0 and the latitude term's limit is the center latitude
+        y_over_rho = np.divide(y * sin_c, rho, out=np.zeros_like(rho), where=rho > 0)
+        phi = np.arcsin(np.clip(cos_c * np.sin(phi0) + y_over_rho * np.cos(phi0), -1.0, 1.0))
+        dlam = np.arctan2(x * sin_c, rho * np.cos(phi0) * cos_c - y * np.sin(phi0) * sin_c)
+        return (self.center_lon + np.degrees(dlam), np.degrees(phi))
+
+
+@dataclass(frozen=True)
+class AlbersEqualArea(Projection):
+    """Equal-area conic projection on the unit sphere with two standard parallels."""
+
+    center_lon: float = 0.0
+    origin_lat: float = 0.0
+    parallel_1: float = 20.0
+    parallel_2: float = 50.0
+    name: ClassVar[str] = "albers"
+
+    def __post_init__(self) -> None:
+        if abs(np.sin(np.radians(self.parallel_1)) + np.sin(np.radians(self.parallel_2))) < 1e-9:
+            raise ValueError(
+                f"Standard parallels {self.parallel_1} and {self.parallel_2} are symmetric "
+                "about the equator, which flattens the cone; use the lambert projection"
+            )
+
+    def _cone(self) -> tuple[float, float, float]:
+        phi1, phi2 = np.radians(self.parallel_1), np.radians(self.parallel_2)
+        n = (np.sin(phi1) + np.sin(phi2)) / 2.0
+        c = np.cos(phi1) ** 2 + 2.0 * n * np.sin(phi1)
+        rho0 = np.sqrt(c - 2.0 * n * np.sin(np.radians(self.origin_lat))) / n
+        return (float(n), float(c), float(rho0))
+
+    def forward(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n, c, rho0 = self._cone()
+        rho = np.sqrt(c - 2.0 * n * np.sin(np.radians(lat))) / n
+        theta = n * np.radians(np.subtract(lon, self.center_lon))
+        return (rho * np.sin(theta), rho0 - rho * np.cos(theta))
+
+    def inverse(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n, c, rho0 = self._cone()
+        sign = np.sign(n)
+        dy = rho0 - np.asarray(y, dtype=np.float64)
+        rho = np.hypot(x, dy)
+        theta = np.arctan2(sign * np.asarray(x, dtype=np.float64), sign * dy)
+        phi = np.arcsin(np.clip((c - (rho * n) ** 2) / (2.0 * n), -1.0, 1.0))
+        return (self.center_lon + np.degrees(theta / n), np.degrees(phi))
+
+
+def make_projection(name: str, bbox: tuple[float, float, float, float]) -> Projection:
+    """Create a projection fitted to a region.
+
+    Azimuthal projections are centered on the bounding box; Albers puts its standard
+    parallels one sixth of the latitude range inside each edge.
+
+    Args:
+        name: One of PROJECTIONS
+        bbox: (min_lon, min_lat, max_lon, max_lat) of the mapped region
+
+    Returns:
+        Projection instance
+
+    Raises:
+        ValueError: If the name is unknown, or for albers on a region whose latitude range
+            is symmetric about the equator
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    center_lon = (min_lon + max_lon) / 2
+    center_lat = (min_lat + max_lat) / 2
+    if name == "equirectangular":
+        return Equirectangular()
+    if name == "mercator":
+        return Mercator()
+    if name == "lambert":
+        return LambertAzimuthalEqualArea(center_lon, center_lat)
+    if name == "albers":
+        inset = (max_lat - min_lat) / 6
+        return AlbersEqualArea(center_lon, center_lat, min_lat + inset, max_lat - inset)
+    raise ValueError(f"Unknown projection: {name!r} (expected one of {PROJECTIONS})")
+
+
+def canvas_size(
+    bbox: tuple[float, float, float, float],
+    base_width: int = 1000,
+    projection: Projection | None = None,
+) -> tuple[int, int]:
+    """Canvas dimensions keeping the projected region's aspect ratio.
+
+    The longer side gets base_width pixels.
+
+    Args:
+        bbox: (min_lon, min_lat, max_lon, max_lat) of the mapped region
+        base_width: Length of the longer canvas side in pixels
+        projection: Map projection; defaults to equirectangular
+
+    Returns:
+        Tuple of (width, height) in pixels
+    """
+    min_x, min_y, max_x, max_y = (projection or Equirectangular()).projected_bounds(bbox)
+    ratio = (max_x - min_x) / (max_y - min_y)
+    if ratio > 1:
+        return (base_width, int(base_width / ratio))  # Wider than tall
+    return (int(base_width * ratio), base_width)  # Taller than wide (or square)
+
 
 class CoordinateProjector:
-    """Projects geographic coordinates to canvas coordinates using equirectangular projection."""
+    """Projects geographic coordinates to canvas coordinates.
+
+    A Projection maps degrees to plane coordinates, which are then scaled so the
+    bounding box's projected extent fills the canvas. The default equirectangular
+    projection maps degrees linearly, with x_scale and y_scale pixels per degree.
+    """
 
     def __init__(
-        self, bbox: tuple[float, float, float, float], canvas_width: int, canvas_height: int
+        self,
+        bbox: tuple[float, float, float, float],
+        canvas_width: int,
+        canvas_height: int,
+        projection: Projection | None = None,
     ) -> None:
         """Initialize projector with bounding box and canvas dimensions.
 
@@ -13,16 +274,41 @@ class CoordinateProjector:
             bbox: (min_lon, min_lat, max_lon, max_lat) geographic bounding box
             canvas_width: Target canvas width in pixels
             canvas_height: Target canvas height in pixels
+            projection: Map projection; defaults to equirectangular
         """
         self.min_lon, self.min_lat, self.max_lon, self.max_lat = bbox
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
+        self.projection = projection if projection is not None else Equirectangular()
 
-        # Calculate scale factors
+        # Calculate scale factors from the projected extent, in pixels per plane unit
         self.lon_range = self.max_lon - self.min_lon
         self.lat_range = self.max_lat - self.min_lat
-        self.x_scale = canvas_width / self.lon_range
-        self.y_scale = canvas_height / self.lat_range
+        self.min_x, self.min_y, self.max_x, self.max_y = self.projection.projected_bounds(bbox)
+        self.x_scale = canvas_width / (self.max_x - self.min_x)
+        self.y_scale = canvas_height / (self.max_y - self.min_y)
+        self._pixels_per_degree: float | None = None
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        return (self.min_lon, self.min_lat, self.max_lon, self.max_lat)
+
+    @property
+    def pixels_per_degree(self) -> float:
+        """Largest canvas distance covered by one degree anywhere inside the bounding box."""
+        if self._pixels_per_degree is None:
+            x_degree, y_degree = self.projection.degree_scale(self.bbox)
+            self._pixels_per_degree = max(self.x_scale * x_degree, self.y_scale * y_degree)
+        return self._pixels_per_degree
+
+    def scaled(self, zoom: float) -> "CoordinateProjector":
+        """Projector for the same region and projection on a canvas zoom times larger."""
+        return CoordinateProjector(
+            self.bbox,
+            round(self.canvas_width * zoom),
+            round(self.canvas_height * zoom),
+            self.projection,
+        )
 
     def geo_to_canvas(self, lon: float, lat: float) -> tuple[int, int]:
         """Convert geographic coordinates to canvas pixel coordinates.
@@ -34,8 +320,9 @@ class CoordinateProjector:
         Returns:
             Tuple of (x, y) canvas coordinates in pixels
         """
-        x = int((lon - self.min_lon) * self.x_scale)
-        y = int((self.max_lat - lat) * self.y_scale)  # Flip Y axis for canvas
+        px, py = self.projection.forward(lon, lat)
+        x = int((px - self.min_x) * self.x_scale)
+        y = int((self.max_y - py) * self.y_scale)  # Flip Y axis for canvas
         return (x, y)
 
     def canvas_to_geo(self, x: int, y: int) -> tuple[float, float]:
@@ -48,33 +335,169 @@ class CoordinateProjector:
         Returns:
             Tuple of (longitude, latitude) in degrees
         """
-        lon = (x / self.x_scale) + self.min_lon
-        lat = self.max_lat - (y / self.y_scale)  # Flip Y axis back
-        return (lon, lat)
+        lon, lat = self.projection.inverse(
+            (x / self.x_scale) + self.min_x,
+            self.max_y - (y / self.y_scale),  # Flip Y axis back
+        )
+        return (float(lon), float(lat))
+
+    def geo_to_canvas_array(self, coords: np.ndarray) -> np.ndarray:
+        """Convert many geographic coordinates to canvas pixels at once.
+
+        Produces exactly the same integers as calling geo_to_canvas per point.
+
+        Args:
+            coords: Array of shape (n, 2) holding (longitude, latitude) pairs
+
+        Returns:
+            Integer array of shape (n, 2) holding (x, y) canvas coordinates
+        """
+        return self.projected_to_canvas_array(self.projection.forward_array(coords))
+
+    def projected_to_canvas_array(self, projected: np.ndarray) -> np.ndarray:
+        """Convert already projected plane coordinates to canvas pixels.
+
+        This is the cheap, affine half of geo_to_canvas_array, for coordinates projected
+        once and cached, e.g. by a SimplificationTier drawn at several canvas sizes.
+
+        Args:
+            projected: Array of shape (n, 2) from this projector's projection.forward_array
+
+        Returns:
+            Integer array of shape (n, 2) holding (x, y) canvas coordinates
+        """
+        canvas = np.empty(projected.shape, dtype=np.int64)
+        # astype truncates toward zero, matching int() in the scalar version
+        canvas[:, 0] = ((projected[:, 0] - self.min_x) * self.x_scale).astype(np.int64)
+        canvas[:, 1] = ((self.max_y - projected[:, 1]) * self.y_scale).astype(np.int64)
+        return canvas
+
+    def canvas_to_geo_array(self, points: np.ndarray) -> np.ndarray:
+        """Convert many canvas pixel coordinates back to geographic coordinates at once.
+
+        Args:
+            points: Array of shape (n, 2) holding (x, y) canvas coordinates
+
+        Returns:
+            Float array of shape (n, 2) holding (longitude, latitude) pairs
+        """
+        points = np.asarray(points).reshape(-1, 2)
+        coords = np.empty(points.shape, dtype=np.float64)
+        coords[:, 0], coords[:, 1] = self.projection.inverse(
+            (points[:, 0] / self.x_scale) + self.min_x, self.max_y - (points[:, 1] / self.y_scale)
+        )
+        return coords
+
+    def canvas_boxes_to_geo(
+        self, top_left: np.ndarray, bottom_right: np.ndarray, samples: int = EDGE_SAMPLES
+    ) -> np.ndarray:
+        """Bound the geographic area covered by canvas rectangles.
+
+        Exact for cylindrical projections. Otherwise each outline is sampled and padded by
+        CURVED_EDGE_MARGIN, so the result may be slightly larger but never smaller.
+
+        Args:
+            top_left: Array of shape (n, 2) of rectangle (left, top) canvas corners
+            bottom_right: Array of shape (n, 2) of rectangle (right, bottom) canvas corners
+            samples: Points per edge for curved projections, corners included; 2 (the
+                corners alone) suffices for rectangles a few pixels wide
+
+        Returns:
+            Float array of shape (n, 4) holding (min_lon, min_lat, max_lon, max_lat) rows
+        """
+        top_left = np.asarray(top_left, dtype=np.float64).reshape(-1, 2)
+        bottom_right = np.asarray(bottom_right, dtype=np.float64).reshape(-1, 2)
+        if self.projection.cylindrical:
+            west_north = self.canvas_to_geo_array(top_left)
+            east_south = self.canvas_to_geo_array(bottom_right)
+            return np.column_stack(
+                [west_north[:, 0], east_south[:, 1], east_south[:, 0], west_north[:, 1]]
+            )
+
+        # Sample all four edges of every rectangle: shape (n, 4 * samples, 2)
+        t = np.linspace(0.0, 1.0, samples)
+        left, top = top_left[:, :1], top_left[:, 1:]
+        right, bottom = bottom_right[:, :1], bottom_right[:, 1:]
+        across = left + (right - left) * t
+        down = top + (bottom - top) * t
+        xs = np.concatenate(
+            [across, across, np.repeat(left, len(t), 1), np.repeat(right, len(t), 1)], 1
+        )
+        ys = np.concatenate(
+            [np.repeat(top, len(t), 1), np.repeat(bottom, len(t), 1), down, down], 1
+        )
+        geo = self.canvas_to_geo_array(np.stack([xs, ys], axis=-1)).reshape(*xs.shape, 2)
+        low, high = geo.min(axis=1), geo.max(axis=1)
+        margin = (high - low) * CURVED_EDGE_MARGIN
+        return np.column_stack([low - margin, high + margin])
 
     @staticmethod
-    def calculate_bbox(geojson_data: dict) -> tuple[float, float, float, float]:
-        min_lon = min_lat = float("inf")
-        max_lon = max_lat = float("-inf")
+    def feature_bounds(geojson_data: dict) -> np.ndarray:
+        """Compute the bounding box of every feature with array reductions.
+
+        Args:
+            geojson_data: Parsed GeoJSON FeatureCollection
 
-        for feature in geojson_data["features"]:
+        Returns:
+            Float array of shape (n_features, 4) holding (min_lon, min_lat, max_lon, max_lat)
+            per feature; rows are NaN for features without polygon coordinates
+        """
+        features = geojson_data["features"]
+        bounds = np.full((len(features), 4), np.nan)
+
+        # Gather every ring once, remembering which feature it belongs to
+        rings = []
+        ring_owners = []
+        for index, feature in enumerate(features):
             geometry = feature["geometry"]
             coords = geometry["coordinates"]
 
             if geometry["type"] == "Polygon":
-                for ring in coords:
-                    for lon, lat in ring:
-                        min_lon = min(min_lon, lon)
-                        max_lon = max(max_lon, lon)
-                        min_lat = min(min_lat, lat)
-                        max_lat = max(max_lat, lat)
+                polygons = [coords]
             elif geometry["type"] == "MultiPolygon":
-                for polygon in coords:
-                    for ring in polygon:
-                        for lon, lat in ring:
-                            min_lon = min(min_lon, lon)
-                            max_lon = max(max_lon, lon)
-                            min_lat = min(min_lat, lat)
-                            max_lat = max(max_lat, lat)
-
-        return (min_lon, min_lat, max_lon, max_lat)
+                polygons = coords
+            else:
+                continue
+
+            for polygon in polygons:
+                rings.extend(polygon)
+                ring_owners.extend([index] * len(polygon))
+
+        if not rings:
+            return bounds
+
+        # GeoJSON positions may carry an altitude (or more); only lon and lat are bounded
+        points = np.array(
+            [position[:2] for position in chain.from_iterable(rings)], dtype=np.float64
+        ).reshape(-1, 2)
+        if not len(points):
+            return bounds
+        owners = np.repeat(ring_owners, [len(ring) for ring in rings])
+
+        # Points are grouped by feature, so each feature is one contiguous reduceat segment
+        starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        rows = owners[starts]
+        bounds[rows, 0] = np.minimum.reduceat(points[:, 0], starts)
+        bounds[rows, 1] = np.minimum.reduceat(points[:, 1], starts)
+        bounds[rows, 2] = np.maximum.reduceat(points[:, 0], starts)
+        bounds[rows, 3] = np.maximum.reduceat(points[:, 1], starts)
+        return bounds
+
+    @staticmethod
+    def calculate_bbox(geojson_data: dict) -> tuple[float, float, float, float]:
+        if geojson_data.get("type") == "Topology":
+            # Every shared vertex is stored once in the arcs, so reduce those directly
+            return Topology.from_topojson(geojson_data).bbox
+
+        bounds = CoordinateProjector.feature_bounds(geojson_data)
+        bounds = bounds[~np.isnan(bounds[:, 0])]
+
+        if not len(bounds):
+            return (float("inf"), float("inf"), float("-inf"), float("-inf"))
+
+        return (
+            float(bounds[:, 0].min()),
+            float(bounds[:, 1].min()),
+            float(bounds[:, 2].max()),
+            float(bounds[:, 3].max()),
+        )
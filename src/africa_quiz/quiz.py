@@ -1,107 +1,177 @@
-import json
-import random
-
-from shapely.geometry import MultiPolygon, Point, Polygon
+import numpy as np
+from shapely import STRtree
+from shapely.geometry.base import BaseGeometry
 
+from .dataset import CountryDataset
+from .hitmap import OCEAN, RasterHitMap
 from .projection import CoordinateProjector
+from .rounds import RoundOrder, RoundSchedule
+from .scheduling import SpacedRepetitionScheduler
+from .store import HIT_TEST_ENGINES as HIT_TEST_ENGINES
+from .store import GeometryStore
+
+# How prompts are chosen: "rounds" asks every country once per round in a shuffled
+# order, "spaced" picks from per-country performance with a Leitner scheduler
+SCHEDULERS = ("rounds", "spaced")
 
 
 class QuizManager:
-    def __init__(self, geojson_path: str, projector: CoordinateProjector) -> None:
-        self.projector = projector
-        self.countries = []  # List of country names for quiz order
-        self.country_data = {}  # Dict mapping country names to geometric data
+    def __init__(
+        self,
+        geojson_path: str | CountryDataset,
+        projector: CoordinateProjector,
+        hit_test: str = "strtree",
+        prepare_geometries: bool = True,
+        seed: int | None = None,
+        scheduler: str = "rounds",
+    ) -> None:
+        # Reuse an already loaded dataset, or parse the file for path-based callers
+        if isinstance(geojson_path, CountryDataset):
+            dataset = geojson_path
+        else:
+            dataset = CountryDataset.from_path(geojson_path)
+
+        self.store = GeometryStore(dataset, projector, hit_test, prepare_geometries)
+        self._init_player_state(seed, scheduler)
+
+    @classmethod
+    def from_store(
+        cls, store: GeometryStore, seed: int | None = None, scheduler: str = "rounds"
+    ) -> "QuizManager":
+        """Create a player's quiz on top of an already built, shared geometry store.
+
+        Only the quiz order and progress are per player, so this is cheap enough to do
+        for every connecting client.
+
+        Args:
+            store: Shared geometry store
+            seed: Seed of the player's round orders; None picks one at random
+            scheduler: How prompts are chosen, one of SCHEDULERS
+        """
+        quiz_manager = cls.__new__(cls)
+        quiz_manager.store = store
+        quiz_manager._init_player_state(seed, scheduler)
+        return quiz_manager
+
+    def _init_player_state(self, seed: int | None, scheduler: str) -> None:
+        if scheduler not in SCHEDULERS:
+            raise ValueError(f"Unknown scheduler: {scheduler!r} (expected one of {SCHEDULERS})")
+
+        # Round orders are lazy permutations of the shared name tuple, so a round costs
+        # O(1) to start and replaying a seed replays every round
+        self.rounds = RoundSchedule(self.store.country_names, seed)
+        self.round_number = -1
         self.current_country_index = 0
+        self.countries: RoundOrder = self.rounds.round(0)  # Quiz order of this round
 
-        # Load countries from GeoJSON file with comprehensive error handling
-        try:
-            with open(geojson_path) as f:
-                geojson_data = json.load(f)
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"GeoJSON file not found: {geojson_path}") from e
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid GeoJSON format: {e}") from e
-        except PermissionError as e:
-            raise PermissionError(
-                f"Permission denied accessing GeoJSON file: {geojson_path}"
-            ) from e
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error loading GeoJSON file {geojson_path}: {e}") from e
-
-        # Validate GeoJSON structure
-        if not isinstance(geojson_data, dict) or "features" not in geojson_data:
-            raise ValueError("Invalid GeoJSON format: missing 'features' key")
-
-        if not isinstance(geojson_data["features"], list):
-            raise ValueError("Invalid GeoJSON format: 'features' must be a list")
-
-        for feature in geojson_data["features"]:
-            # Validate feature structure
-            if not isinstance(feature, dict):
-                continue  # Skip malformed features
-
-            properties = feature.get("properties", {})
-            geometry = feature.get("geometry", {})
-
-            # Skip features without required properties
-            if not properties.get("name"):
-                continue  # Skip features without names
-
-            country_name = properties["name"]
-            coords = geometry.get("coordinates")
-            geometry_type = geometry.get("type")
-
-            if not coords or geometry_type not in ["Polygon", "MultiPolygon"]:
-                continue  # Skip unsupported or malformed geometry types
-
-            try:
-                # Create shapely geometry
-                if geometry_type == "Polygon":
-                    geo_geometry = Polygon(coords[0])
-                elif geometry_type == "MultiPolygon":
-                    geo_geometry = MultiPolygon([Polygon(poly[0]) for poly in coords])
-
-                # Validate geometry
-                if not geo_geometry.is_valid:
-                    continue  # Skip invalid geometries
-
-                self.countries.append(country_name)
-                self.country_data[country_name] = geo_geometry
-
-            except Exception:
-                # Skip countries with geometry processing errors
-                continue
-
-        # Validate that we loaded some countries
-        if not self.countries:
-            raise ValueError(f"No valid countries found in GeoJSON file: {geojson_path}")
+        # Spaced repetition keeps fixed-length rounds for feedback resets, but picks each
+        # prompt from the scheduler; countries are introduced in the first round's order
+        self.scheduler = scheduler
+        self.spaced: SpacedRepetitionScheduler | None = None
+        if scheduler == "spaced":
+            order = self.countries
+            self.spaced = SpacedRepetitionScheduler(order.index_at(i) for i in range(len(order)))
 
-        # Start with a shuffled list
+        # Start with a shuffled order
         self.start_new_round()
 
+    @property
+    def seed(self) -> int:
+        """Seed that reproduces this player's sequence of rounds."""
+        return self.rounds.seed
+
+    # Shared, read-only data lives in the store
+    @property
+    def dataset(self) -> CountryDataset:
+        return self.store.dataset
+
+    @property
+    def projector(self) -> CoordinateProjector:
+        return self.store.projector
+
+    @property
+    def hit_test(self) -> str:
+        return self.store.hit_test
+
+    @property
+    def prepare_geometries(self) -> bool:
+        return self.store.prepare_geometries
+
+    @property
+    def country_data(self) -> dict[str, BaseGeometry]:
+        return self.store.country_data
+
+    @property
+    def country_names(self) -> tuple[str, ...]:
+        return self.store.country_names
+
+    @property
+    def country_ids(self) -> dict[str, int]:
+        return self.store.country_ids
+
+    @property
+    def spatial_index(self) -> STRtree:
+        return self.store.spatial_index
+
+    @property
+    def hit_map(self) -> RasterHitMap | None:
+        return self.store.hit_map
+
+    @property
+    def current_country_id(self) -> int:
+        """ID of the country the player is asked to find."""
+        if self.spaced is not None:
+            return self.spaced.current
+        return self.countries.index_at(self.current_country_index)
+
     def get_current_country(self) -> str:
         if not self.countries:
             return "No countries loaded"
-        return self.countries[self.current_country_index]
+        return self.store.country_names[self.current_country_id]
 
     def start_new_round(self) -> None:
         if self.countries:
-            random.shuffle(self.countries)
+            self.round_number += 1
+            if self.spaced is None:
+                self.countries = self.rounds.round(self.round_number)
             self.current_country_index = 0
 
+    def record_answer(self, correct: bool) -> None:
+        """Move past the current prompt, letting the scheduler learn from the answer."""
+        self.current_country_index += 1
+        if self.spaced is not None:
+            self.spaced.record(correct)
+
     def handle_click(self, x: int, y: int) -> tuple[bool, str | None]:
-        # Convert canvas coordinates to geographic coordinates
-        lon, lat = self.projector.canvas_to_geo(x, y)
-        point = Point(lon, lat)
-
-        # Test against all countries
-        for country_name, geo_geometry in self.country_data.items():
-            if geo_geometry.contains(point):
-                current_country = self.get_current_country()
-                is_correct = country_name == current_country
-                return (is_correct, country_name)
-
-        return (False, None)  # Ocean click
+        country_id = self.store.locate_id(x, y)
+        if country_id == OCEAN:
+            return (False, None)  # Ocean click
+
+        is_correct = country_id == self.current_country_id
+        return (is_correct, self.store.country_names[country_id])
+
+    def handle_clicks(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Locate many canvas clicks at once.
+
+        Points are projected in one batch and classified with a single STRtree bulk
+        query, giving exactly the countries handle_click would report one at a time.
+
+        Args:
+            xs: Canvas x coordinates
+            ys: Canvas y coordinates, same shape as xs
+
+        Returns:
+            Int array of indices into country_names, OCEAN for ocean clicks
+        """
+        return self.store.locate_array(xs, ys)
+
+    def locate(self, x: int, y: int) -> str | None:
+        """Return the country under a canvas point, or None for the ocean."""
+        return self.store.locate(x, y)
+
+    def locate_id(self, x: int, y: int) -> int:
+        """Return the ID of the country under a canvas point, or OCEAN."""
+        return self.store.locate_id(x, y)
 
     def is_round_complete(self) -> bool:
         return self.current_country_index >= len(self.countries)
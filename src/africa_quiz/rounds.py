@@ -0,0 +1,113 @@
+"""Reproducible quiz round orders generated lazily from a seed.
+
+A round order is a pseudo-random permutation of the country list computed on demand
+by a keyed Feistel network, so creating a round costs O(1) time and memory no matter
+how many countries there are, and round k of a seed is the same on every machine
+without generating rounds 0..k-1 first. The shared country list is never copied or
+reordered.
+"""
+
+import random
+from collections.abc import Sequence
+from typing import overload
+
+_MASK64 = (1 << 64) - 1
+
+# Feistel rounds; four rounds of a decent mixing function look random for quiz purposes
+FEISTEL_ROUNDS = 4
+
+
+def _mix64(value: int) -> int:
+    # SplitMix64 finalizer: a cheap, well-distributed 64-bit hash
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class RoundOrder(Sequence[str]):
+    """One round's quiz order: a lazily evaluated permutation of the country names."""
+
+    __slots__ = ("_half_bits", "_half_mask", "_keys", "key", "names")
+
+    def __init__(self, names: Sequence[str], key: int) -> None:
+        """Define the permutation of names selected by key.
+
+        Args:
+            names: Country names in load order; shared, never modified
+            key: 64-bit permutation key, e.g. from RoundSchedule.round_key
+        """
+        self.names = names
+        self.key = key & _MASK64
+
+        # Permute the smallest even-bit domain holding every index and cycle-walk out of
+        # range values back in; the domain is under 4x the list, so walks are short
+        half_bits = max(1, ((len(names) - 1).bit_length() + 1) // 2)
+        self._half_bits = half_bits
+        self._half_mask = (1 << half_bits) - 1
+        self._keys = tuple(_mix64(self.key + step) for step in range(FEISTEL_ROUNDS))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @overload
+    def __getitem__(self, position: int) -> str: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[str]: ...
+
+    def __getitem__(self, position: int | slice) -> str | list[str]:
+        if isinstance(position, slice):
+            return [self.names[self.index_at(i)] for i in range(*position.indices(len(self)))]
+        return self.names[self.index_at(position)]
+
+    def index_at(self, position: int) -> int:
+        """Return the load-order index of the country asked at a position of the round.
+
+        Raises:
+            IndexError: If position is out of range
+        """
+        size = len(self.names)
+        if position < 0:
+            position += size
+        if not 0 <= position < size:
+            raise IndexError(f"Round position out of range: {position}")
+
+        value = self._permute(position)
+        while value >= size:
+            value = self._permute(value)
+        return value
+
+    def _permute(self, value: int) -> int:
+        bits = self._half_bits
+        mask = self._half_mask
+        left, right = value >> bits, value & mask
+        for round_key in self._keys:
+            left, right = right, left ^ (_mix64(right ^ round_key) & mask)
+        return (left << bits) | right
+
+    def __repr__(self) -> str:
+        return f"RoundOrder({len(self)} countries, key={self.key:#x})"
+
+
+class RoundSchedule:
+    """Every round order of one seed, addressable by round number."""
+
+    def __init__(self, names: Sequence[str], seed: int | None = None) -> None:
+        """Set up the rounds of a seed.
+
+        Args:
+            names: Country names in load order; shared, never modified
+            seed: Integer seed; None draws one from the global random module, so
+                random.seed still makes unseeded sessions reproducible
+        """
+        self.names = names
+        self.seed = random.getrandbits(64) if seed is None else seed
+
+    def round_key(self, number: int) -> int:
+        """Return the permutation key of a round number."""
+        return _mix64(_mix64(self.seed & _MASK64) ^ (number & _MASK64))
+
+    def round(self, number: int) -> RoundOrder:
+        """Return the order of a round, in constant time."""
+        return RoundOrder(self.names, self.round_key(number))
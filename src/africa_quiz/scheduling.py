@@ -0,0 +1,66 @@
+"""Spaced-repetition prompt scheduling from per-country performance."""
+
+import heapq
+from collections.abc import Iterable
+
+# Prompts until a country is asked again, per Leitner box; a miss sends a country back
+# to box 0, each correct answer moves it up one box
+LEITNER_INTERVALS = (4, 16, 64, 256, 1024)
+
+
+class SpacedRepetitionScheduler:
+    """Leitner-box scheduler picking the most overdue country from a heap of due steps.
+
+    Time is counted in prompts answered. Every country sits in the heap exactly once,
+    keyed by the step it is next due, so picking the next prompt and rescheduling the
+    answered one are one heappush and one heappop: O(log n) per answer.
+    """
+
+    def __init__(
+        self, order: Iterable[int], intervals: tuple[int, ...] = LEITNER_INTERVALS
+    ) -> None:
+        """Queue every country for its first showing.
+
+        Args:
+            order: Permutation of the country indices, in the order countries are first
+                introduced (one per step, unless reviews are due)
+            intervals: Prompts until the next showing, per Leitner box
+        """
+        if not intervals or min(intervals) < 1:
+            raise ValueError(f"intervals must be positive, got {intervals}")
+        self.intervals = intervals
+        self.step = 0  # Prompts answered so far
+
+        # (due step, insertion sequence, country index); the sequence keeps ties FIFO
+        # and already sorted entries form a valid heap
+        self._heap = [(position, position, index) for position, index in enumerate(order)]
+        if not self._heap:
+            raise ValueError("Cannot schedule an empty country list")
+        country_count = self._sequence = len(self._heap)
+        self.boxes = [0] * country_count  # Leitner box per country
+        self.attempts = [0] * country_count
+        self.correct = [0] * country_count
+        self.current = heapq.heappop(self._heap)[2]  # Index of the country being asked
+
+    def record(self, correct: bool) -> int:
+        """Reschedule the current country from its answer and pick the next one.
+
+        Args:
+            correct: Whether the current country was found
+
+        Returns:
+            Index of the next country to ask
+        """
+        index = self.current
+        self.attempts[index] += 1
+        if correct:
+            self.correct[index] += 1
+            self.boxes[index] = min(self.boxes[index] + 1, len(self.intervals) - 1)
+        else:
+            self.boxes[index] = 0
+
+        self.step += 1
+        due = self.step + self.intervals[self.boxes[index]]
+        self.current = heapq.heappushpop(self._heap, (due, self._sequence, index))[2]
+        self._sequence += 1
+        return self.current
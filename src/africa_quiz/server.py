@@ -0,0 +1,311 @@
+"""Multi-player quiz server: one shared GeometryStore, one QuizSession per player.
+
+A small HTTP/1.1 JSON API on asyncio streams (keep-alive supported):
+
+    GET    /                      canvas size, projection and country count
+    POST   /sessions              start a session, optionally {"seed": n, "scheduler": s}
+    GET    /sessions/<id>         current prompt, progress and colors
+    POST   /sessions/<id>/clicks  {"clicks": [[x, y], ...]} -> outcomes and next prompt
+    DELETE /sessions/<id>         end a session
+
+Sessions idle for SESSION_TTL_SECONDS expire, and at most MAX_SESSIONS are kept.
+Hit tests are fast enough (microseconds per click) to run directly on the event loop.
+Run with ``python -m africa_quiz.server [geojson_path] [--port PORT] [--projection NAME]``;
+``--no-cache`` skips the binary cache written next to the GeoJSON file.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import time
+import uuid
+from dataclasses import asdict
+from pathlib import Path
+
+from .dataset import CountryDataset
+from .projection import PROJECTIONS, CoordinateProjector, canvas_size, make_projection
+from .quiz import QuizManager
+from .session import QuizSession
+from .store import GeometryStore
+
+MAX_BODY_BYTES = 1 << 20
+
+# Sessions idle for longer than this are dropped; beyond MAX_SESSIONS the least recently
+# used session is dropped to make room, so abandoned clients cannot exhaust memory
+SESSION_TTL_SECONDS = 3600.0
+MAX_SESSIONS = 100_000
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+class QuizServer:
+    """Routes JSON requests to per-player sessions backed by one geometry store."""
+
+    def __init__(
+        self,
+        store: GeometryStore,
+        session_ttl: float = SESSION_TTL_SECONDS,
+        max_sessions: int = MAX_SESSIONS,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions must be positive, got {max_sessions}")
+        self.store = store
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self.sessions: dict[str, QuizSession] = {}
+        self._last_used: dict[str, float] = {}  # Session id -> monotonic time, oldest first
+
+    @classmethod
+    def from_path(
+        cls,
+        geojson_path: str | Path,
+        base_width: int = 1000,
+        projection: str = "equirectangular",
+        use_cache: bool = True,
+    ) -> "QuizServer":
+        """Load a dataset and size the canvas like the desktop app does.
+
+        Args:
+            geojson_path: Path to the GeoJSON file
+            base_width: Length of the longer canvas side in pixels
+            projection: Map projection, one of PROJECTIONS
+            use_cache: Load from (and refresh) the binary cache next to the GeoJSON file
+        """
+        dataset = CountryDataset.from_path(geojson_path, use_cache=use_cache)
+        bbox = dataset.bbox
+        map_projection = make_projection(projection, bbox)
+        width, height = canvas_size(bbox, base_width, map_projection)
+        projector = CoordinateProjector(bbox, width, height, map_projection)
+        return cls(GeometryStore(dataset, projector))
+
+    def create_session(self, seed: int | None = None, scheduler: str = "rounds") -> str:
+        session_id = uuid.uuid4().hex
+        quiz_manager = QuizManager.from_store(self.store, seed, scheduler)
+        self.expire_sessions()
+        while len(self.sessions) >= self.max_sessions:
+            self._drop_session(next(iter(self._last_used)))
+        self.sessions[session_id] = QuizSession(quiz_manager)
+        self._last_used[session_id] = time.monotonic()
+        return session_id
+
+    def expire_sessions(self) -> int:
+        """Drop sessions idle for longer than session_ttl and return how many were dropped."""
+        deadline = time.monotonic() - self.session_ttl
+        expired = []
+        for session_id, last_used in self._last_used.items():
+            if last_used > deadline:
+                break  # Ordered by last use, so every later session is fresher
+            expired.append(session_id)
+        for session_id in expired:
+            self._drop_session(session_id)
+        return len(expired)
+
+    def _get_session(self, session_id: str) -> QuizSession | None:
+        session = self.sessions.get(session_id)
+        if session is not None:
+            del self._last_used[session_id]
+            self._last_used[session_id] = time.monotonic()
+        return session
+
+    def _drop_session(self, session_id: str) -> None:
+        del self.sessions[session_id]
+        del self._last_used[session_id]
+
+    def dispatch(self, method: str, path: str, body: bytes = b"") -> tuple[int, dict]:
+        """Handle one request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            body: Raw request body
+
+        Returns:
+            Tuple of (HTTP status, JSON-serializable response)
+        """
+        parts = [part for part in path.split("?")[0].split("/") if part]
+
+        if not parts:
+            if method != "GET":
+                return 405, {"error": f"{method} not allowed"}
+            projector = self.store.projector
+            return 200, {
+                "width": projector.canvas_width,
+                "height": projector.canvas_height,
+                "projection": projector.projection.name,
+                "countries": len(self.store.country_names),
+                "sessions": len(self.sessions),
+            }
+
+        if parts[0] != "sessions" or len(parts) > 3:
+            return 404, {"error": f"Unknown path: {path}"}
+
+        if len(parts) == 1:
+            if method != "POST":
+                return 405, {"error": f"{method} not allowed"}
+            try:
+                options = json.loads(body) if body else {}
+                seed = options.get("seed")
+                if seed is not None and not isinstance(seed, int):
+                    raise TypeError(f"seed must be an integer, got {seed!r}")
+                session_id = self.create_session(seed, options.get("scheduler", "rounds"))
+            except (ValueError, AttributeError, TypeError) as e:
+                return 400, {"error": f"Expected an empty body or session options: {e}"}
+            return 201, {"session": session_id, **self._state(self.sessions[session_id])}
+
+        self.expire_sessions()
+        session = self._get_session(parts[1])
+        if session is None:
+            return 404, {"error": f"Unknown session: {parts[1]}"}
+
+        if len(parts) == 2:
+            if method == "GET":
+                return 200, self._state(session)
+            if method == "DELETE":
+                self._drop_session(parts[1])
+                return 200, {}
+            return 405, {"error": f"{method} not allowed"}
+
+        if parts[2] != "clicks":
+            return 404, {"error": f"Unknown path: {path}"}
+        if method != "POST":
+            return 405, {"error": f"{method} not allowed"}
+        try:
+            clicks = json.loads(body)["clicks"]
+            points = [(float(x), float(y)) for x, y in clicks]
+            if not all(math.isfinite(x) and math.isfinite(y) for x, y in points):
+                raise ValueError("click coordinates must be finite numbers")
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {"error": f"Expected {{'clicks': [[x, y], ...]}}: {e}"}
+
+        # A single click is cheaper through the scalar hit test than a bulk query
+        if len(points) == 1:
+            outcomes = [session.click(*points[0])]
+        else:
+            outcomes = session.click_batch(points)
+        return 200, {
+            "outcomes": [asdict(outcome) for outcome in outcomes],
+            "prompt": session.current_country,
+        }
+
+    @staticmethod
+    def _state(session: QuizSession) -> dict:
+        return {
+            "prompt": session.current_country,
+            "index": session.quiz_manager.current_country_index,
+            "seed": session.quiz_manager.seed,
+            "round": session.quiz_manager.round_number,
+            "scheduler": session.quiz_manager.scheduler,
+            "colors": dict(session.colors),
+            "rounds_completed": session.rounds_completed,
+            "correct": session.correct_count,
+            "incorrect": session.incorrect_count,
+            "ocean": session.ocean_count,
+        }
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve HTTP requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await _write_response(writer, 400, {"error": "Malformed request line"})
+                    break
+
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await _write_response(writer, 400, {"error": "Malformed Content-Length"})
+                    break
+                if length > MAX_BODY_BYTES:
+                    await _write_response(writer, 413, {"error": "Request body too large"})
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = self.dispatch(method, path, body)
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    and version.upper() != "HTTP/1.0"
+                )
+                await _write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # Client went away or sent garbage; drop the connection
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        """Start listening; port 0 picks a free port."""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool = False
+) -> None:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode() + body)
+    await writer.drain()
+
+
+async def serve(
+    geojson_path: str | Path,
+    host: str,
+    port: int,
+    projection: str = "equirectangular",
+    use_cache: bool = True,
+) -> None:
+    server = QuizServer.from_path(geojson_path, projection=projection, use_cache=use_cache)
+    listener = await server.start(host, port)
+    async with listener:
+        print(f"Serving quiz on http://{host}:{listener.sockets[0].getsockname()[1]}")
+        await listener.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the Africa quiz to many players.")
+    parser.add_argument("geojson_path", nargs="?", default="africa.geojson")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--projection", choices=PROJECTIONS, default="equirectangular")
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="parse the GeoJSON without reading or writing the binary cache",
+    )
+    args = parser.parse_args()
+    asyncio.run(serve(args.geojson_path, args.host, args.port, args.projection, args.use_cache))
+
+
+if __name__ == "__main__":
+    main()
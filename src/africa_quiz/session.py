@@ -0,0 +1,153 @@
+"""Headless quiz state machine, usable without Tk for replays and load tests."""
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from .hitmap import OCEAN
+from .quiz import QuizManager
+
+CORRECT_COLOR = "green"
+INCORRECT_COLOR = "red"
+
+# Per-country feedback is stored as one byte per country ID; COLORS maps codes to colors
+NO_FEEDBACK = 0
+CORRECT = 1
+INCORRECT = 2
+COLORS = ("", CORRECT_COLOR, INCORRECT_COLOR)
+
+
+@dataclass(frozen=True, slots=True)
+class ClickOutcome:
+    """Result of answering one prompt."""
+
+    target: str  # Country the player was asked to find
+    clicked: str | None  # Country under the click, or None for the ocean
+    correct: bool
+    colored: str  # Country whose feedback color changed
+    color: str
+    round_complete: bool  # This answer finished the round and a new one started
+    target_id: int  # Country ID of target (and colored)
+    cleared: tuple[str, ...] = ()  # Countries whose colors were reset by the new round
+    cleared_ids: tuple[int, ...] = ()  # Country IDs of cleared
+
+
+class FeedbackColors(Mapping[str, str]):
+    """Read-only country name -> color view of a session's feedback codes.
+
+    Only colored countries are present, in country ID order.
+    """
+
+    def __init__(self, codes: bytearray, names: tuple[str, ...], ids: dict[str, int]) -> None:
+        self._codes = codes
+        self._names = names
+        self._ids = ids
+
+    def __getitem__(self, country_name: str) -> str:
+        code = self._codes[self._ids[country_name]]
+        if code == NO_FEEDBACK:
+            raise KeyError(country_name)
+        return COLORS[code]
+
+    def __iter__(self) -> Iterator[str]:
+        names = self._names
+        return (names[country_id] for country_id in colored_ids(self._codes))
+
+    def __len__(self) -> int:
+        return len(self._codes) - self._codes.count(NO_FEEDBACK)
+
+    def __repr__(self) -> str:
+        return f"FeedbackColors({dict(self)!r})"
+
+
+def colored_ids(codes: bytearray) -> list[int]:
+    """Return the IDs of every country with feedback, in ID order."""
+    return np.flatnonzero(np.frombuffer(codes, dtype=np.uint8)).tolist()
+
+
+class QuizSession:
+    """Owns answer evaluation, feedback colors, progression and round resets.
+
+    The GUI only renders outcomes; everything else happens here, so recorded clicks can
+    be replayed headlessly at hit-test speed.
+    """
+
+    def __init__(self, quiz_manager: QuizManager) -> None:
+        self.quiz_manager = quiz_manager
+
+        # Feedback this round: one code per country ID, with a by-name view for display
+        self.color_codes = bytearray(len(quiz_manager.country_names))
+        self.colors = FeedbackColors(
+            self.color_codes, quiz_manager.country_names, quiz_manager.country_ids
+        )
+        self.rounds_completed = 0
+        self.correct_count = 0
+        self.incorrect_count = 0
+        self.ocean_count = 0
+
+    @property
+    def current_country(self) -> str:
+        return self.quiz_manager.get_current_country()
+
+    def click(self, x: int, y: int) -> ClickOutcome:
+        """Answer the current prompt with a canvas click."""
+        return self.answer_id(self.quiz_manager.locate_id(x, y))
+
+    def answer(self, clicked: str | None) -> ClickOutcome:
+        """Answer the current prompt with an already resolved country.
+
+        Args:
+            clicked: Country the player picked, or None for an ocean click
+
+        Returns:
+            Outcome of the answer, including any round transition it caused
+        """
+        return self.answer_id(OCEAN if clicked is None else self.quiz_manager.country_ids[clicked])
+
+    def answer_id(self, clicked_id: int) -> ClickOutcome:
+        """Answer the current prompt with a country ID, or OCEAN for an ocean click."""
+        quiz_manager = self.quiz_manager
+        target_id = quiz_manager.current_country_id
+        correct = clicked_id == target_id
+
+        # The asked-for country is painted either way: green when found, red when missed
+        if correct:
+            self.correct_count += 1
+        elif clicked_id == OCEAN:
+            self.ocean_count += 1
+        else:
+            self.incorrect_count += 1
+        code = CORRECT if correct else INCORRECT
+        self.color_codes[target_id] = code
+
+        quiz_manager.record_answer(correct)
+        names = quiz_manager.country_names
+        target = names[target_id]
+        clicked = None if clicked_id == OCEAN else names[clicked_id]
+        color = COLORS[code]
+        if not quiz_manager.is_round_complete():
+            return ClickOutcome(target, clicked, correct, target, color, False, target_id)
+
+        cleared_ids = tuple(colored_ids(self.color_codes))
+        self.color_codes[:] = bytes(len(self.color_codes))
+        self.rounds_completed += 1
+        quiz_manager.start_new_round()
+        cleared = tuple(names[country_id] for country_id in cleared_ids)
+        return ClickOutcome(
+            target, clicked, correct, target, color, True, target_id, cleared, cleared_ids
+        )
+
+    def click_batch(self, clicks: Iterable[tuple[int, int]]) -> list[ClickOutcome]:
+        """Answer consecutive prompts with a batch of canvas clicks.
+
+        Hit tests do not depend on quiz state, so every click is resolved in one
+        handle_clicks call before any answer is evaluated.
+        """
+        points = np.asarray(list(clicks)).reshape(-1, 2)
+        indices = self.quiz_manager.handle_clicks(points[:, 0], points[:, 1]).tolist()
+        return [self.answer_id(country_id) for country_id in indices]
+
+    def answer_batch(self, answers: Iterable[str | None]) -> list[ClickOutcome]:
+        """Answer consecutive prompts with already resolved countries."""
+        return [self.answer(clicked) for clicked in answers]
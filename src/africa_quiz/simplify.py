@@ -0,0 +1,314 @@
+"""Simplified country outlines for drawing at canvas resolution."""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import pairwise
+
+import numpy as np
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+from .projection import CoordinateProjector, Projection
+from .topology import Topology
+
+# Canvas scales (relative to the base map size) that get their own simplified outlines;
+# they reach the viewport's MAX_ZOOM, since tier_for_zoom falls back to the last tier
+# beyond it and that tier is only accurate to half a pixel at its own scale
+DEFAULT_ZOOM_LEVELS = (1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+# Maximum deviation of a simplified outline from the original, in canvas pixels
+PIXEL_TOLERANCE = 0.5
+
+# Projections whose plane coordinates a tier keeps (16 bytes per vertex each); the least
+# recently used one is dropped beyond this
+PROJECTION_CACHE_SIZE = 2
+
+
+def exterior_rings(geometries: list[BaseGeometry]) -> tuple[list, list[int]]:
+    """Collect the exterior ring of every polygon part.
+
+    Args:
+        geometries: Polygon or MultiPolygon geometries
+
+    Returns:
+        Tuple of (exterior rings in order, number of rings per geometry)
+    """
+    rings = []
+    rings_per_geometry = []
+    for geometry in geometries:
+        polygons = geometry.geoms if hasattr(geometry, "geoms") else [geometry]
+        rings.extend(polygon.exterior for polygon in polygons)
+        rings_per_geometry.append(len(polygons))
+    return rings, rings_per_geometry
+
+
+def project_rings(rings: list, projector: CoordinateProjector) -> list[np.ndarray]:
+    """Project rings to integer canvas coordinates in one batch, dropping repeated pixels.
+
+    Consecutive vertices that land on the same pixel add nothing to the drawn outline,
+    so only the first of each run is kept.
+
+    Args:
+        rings: Shapely rings (or line strings) in geographic coordinates
+        projector: Projector for the target canvas
+
+    Returns:
+        One integer array of shape (k, 2) per ring
+    """
+    if not rings:
+        return []
+    sizes = shapely.get_num_coordinates(rings)
+    points = projector.geo_to_canvas_array(shapely.get_coordinates(rings))
+    return split_canvas_rings(points, sizes)
+
+
+def split_canvas_rings(points: np.ndarray, sizes: np.ndarray) -> list[np.ndarray]:
+    """Split canvas points stored ring after ring, dropping repeated pixels as project_rings.
+
+    Args:
+        points: Integer canvas points of shape (n, 2)
+        sizes: Number of points in each ring
+
+    Returns:
+        One integer array of shape (k, 2) per ring
+    """
+    ring_ids = np.repeat(np.arange(len(sizes)), sizes)
+
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = (points[1:] != points[:-1]).any(axis=1) | (ring_ids[1:] != ring_ids[:-1])
+    sizes = np.bincount(ring_ids[keep], minlength=len(sizes))
+    return np.split(points[keep], np.cumsum(sizes)[:-1])
+
+
+def project_topology_rings(
+    topology: Topology, projector: CoordinateProjector
+) -> list[list[np.ndarray]]:
+    """Project every arc vertex once and stitch each object's exterior rings from it.
+
+    Args:
+        topology: Arc store whose objects are the countries to draw
+        projector: Projector for the target canvas
+
+    Returns:
+        Per object, one integer array of shape (k, 2) per polygon exterior ring, with
+        consecutive repeated pixels dropped as in project_rings
+    """
+    return stitch_topology_rings(topology, projector.geo_to_canvas_array(topology.coords))
+
+
+def stitch_topology_rings(topology: Topology, canvas_coords: np.ndarray) -> list[list[np.ndarray]]:
+    """Stitch each object's exterior rings from already projected arc vertices.
+
+    Args:
+        topology: Arc store whose objects are the countries to draw
+        canvas_coords: Integer canvas points of every arc vertex, aligned with
+            topology.coords
+
+    Returns:
+        Per object, one integer array of shape (k, 2) per polygon exterior ring
+    """
+    projected = []
+    for topology_object in topology.objects:
+        rings = []
+        for polygon in topology_object.polygons:
+            ring = topology.ring(polygon[0], canvas_coords)
+            keep = np.ones(len(ring), dtype=bool)
+            keep[1:] = (ring[1:] != ring[:-1]).any(axis=1)
+            rings.append(ring[keep])
+        projected.append(rings)
+    return projected
+
+
+class PackedRings(Sequence[list[memoryview]]):
+    """Projected canvas rings of every country in one contiguous int32 buffer.
+
+    coords holds x0, y0, x1, y1, ... of all rings back to back. Ring i spans
+    coords[ring_offsets[i]:ring_offsets[i + 1]] and country c owns rings
+    country_offsets[c] up to country_offsets[c + 1]. Indexing by country ID gives
+    that country's rings as flat memoryview slices, so no per-vertex Python objects
+    are kept around between draws.
+    """
+
+    def __init__(
+        self, coords: np.ndarray, ring_offsets: np.ndarray, country_offsets: np.ndarray
+    ) -> None:
+        self.coords = coords
+        self.ring_offsets = ring_offsets
+        self.country_offsets = country_offsets
+        self._view = memoryview(coords)
+
+    @classmethod
+    def from_points(
+        cls, points: np.ndarray, ring_sizes: Sequence[int], rings_per_country: Sequence[int]
+    ) -> "PackedRings":
+        """Pack ring vertices stored back to back.
+
+        Args:
+            points: Integer canvas points of shape (n, 2), ring after ring
+            ring_sizes: Number of points in each ring
+            rings_per_country: Number of rings of each country, in country ID order
+
+        Returns:
+            Packed rings
+        """
+        coords = np.ascontiguousarray(points, dtype=np.int32).reshape(-1)
+        ring_offsets = np.zeros(len(ring_sizes) + 1, dtype=np.int64)
+        np.cumsum(np.asarray(ring_sizes) * 2, out=ring_offsets[1:])
+        country_offsets = np.zeros(len(rings_per_country) + 1, dtype=np.int64)
+        np.cumsum(rings_per_country, out=country_offsets[1:])
+        return cls(coords, ring_offsets, country_offsets)
+
+    def __len__(self) -> int:
+        return len(self.country_offsets) - 1
+
+    def __getitem__(self, country_id: int) -> list[memoryview]:
+        if not -len(self) <= country_id < len(self):
+            raise IndexError(f"Country ID out of range: {country_id}")
+        country_id %= len(self)
+        first, last = self.country_offsets[country_id : country_id + 2].tolist()
+        view = self._view
+        offsets = self.ring_offsets[first : last + 1].tolist()
+        return [view[start:stop] for start, stop in pairwise(offsets)]
+
+    def __iter__(self) -> Iterator[list[memoryview]]:
+        return (self[country_id] for country_id in range(len(self)))
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.coords) // 2
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the coordinate buffer and both offset arrays."""
+        return self.coords.nbytes + self.ring_offsets.nbytes + self.country_offsets.nbytes
+
+
+@dataclass
+class SimplificationTier:
+    """Country outlines simplified for one canvas scale."""
+
+    zoom: float
+    tolerance: float  # Douglas-Peucker tolerance in geographic degrees
+    geometries: list[BaseGeometry]
+    topology: Topology | None = None  # Simplified arcs, aligned with geometries
+    # Plane coordinates of the tier's vertices per projection, most recently used last,
+    # so drawing at another canvas size, or switching back to a projection, only repeats
+    # the affine step
+    _projected: dict[Projection, np.ndarray] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def projected_vertices(self, projection: Projection) -> np.ndarray:
+        """Plane coordinates of every vertex drawn, cached for recently used projections.
+
+        Returns:
+            Float array of shape (n, 2): the topology's arc vertices, or else the exterior
+            ring vertices ring after ring
+        """
+        projected = self._projected.pop(projection, None)
+        if projected is None:
+            if self.topology is not None:
+                coords = self.topology.coords
+            else:
+                rings, _ = exterior_rings(self.geometries)
+                coords = shapely.get_coordinates(rings) if rings else np.empty((0, 2))
+            projected = projection.forward_array(coords)
+            while len(self._projected) >= PROJECTION_CACHE_SIZE:
+                del self._projected[next(iter(self._projected))]
+        self._projected[projection] = projected
+        return projected
+
+    def clear_projected(self) -> None:
+        """Release the cached plane coordinates, e.g. once the rings needed are packed."""
+        self._projected.clear()
+
+    @property
+    def projected_nbytes(self) -> int:
+        """Bytes held by cached plane coordinates."""
+        return sum(projected.nbytes for projected in self._projected.values())
+
+    def canvas_rings(self, projector: CoordinateProjector) -> PackedRings:
+        """Project this tier's exterior rings for drawing.
+
+        Args:
+            projector: Projector for the canvas the tier is drawn on
+
+        Returns:
+            Packed rings; per geometry, a list of flat [x0, y0, x1, y1, ...] rings
+        """
+        # Only this affine step depends on the canvas size
+        canvas = projector.projected_to_canvas_array(self.projected_vertices(projector.projection))
+        if self.topology is not None:
+            projected = stitch_topology_rings(self.topology, canvas)
+            rings = [ring for country_rings in projected for ring in country_rings]
+            rings_per_geometry = [len(country_rings) for country_rings in projected]
+        else:
+            exteriors, rings_per_geometry = exterior_rings(self.geometries)
+            sizes = shapely.get_num_coordinates(exteriors) if exteriors else []
+            rings = split_canvas_rings(canvas, sizes) if exteriors else []
+
+        points = np.concatenate(rings) if rings else np.empty((0, 2), dtype=np.int32)
+        ring_sizes = [len(ring) for ring in rings]
+        return PackedRings.from_points(points, ring_sizes, rings_per_geometry)
+
+    @property
+    def vertex_count(self) -> int:
+        """Number of exterior ring vertices before pixel deduplication.
+
+        With a topology this is the number of stored arc vertices, which counts shared
+        border vertices once.
+        """
+        if self.topology is not None:
+            return self.topology.vertex_count
+        rings, _ = exterior_rings(self.geometries)
+        return int(shapely.get_num_coordinates(rings).sum()) if rings else 0
+
+
+def build_simplification_tiers(
+    geometries: list[BaseGeometry],
+    projector: CoordinateProjector,
+    zoom_levels: tuple[float, ...] = DEFAULT_ZOOM_LEVELS,
+    topology: Topology | None = None,
+) -> list[SimplificationTier]:
+    """Simplify every geometry once per zoom level.
+
+    The tolerance is half a pixel at each level's scale. Simplification preserves
+    topology, so no polygon collapses or becomes self-intersecting. With a topology,
+    each shared border arc is simplified once, so neighbours keep identical borders.
+
+    Args:
+        geometries: Country geometries in geographic coordinates
+        projector: Projector for the base (zoom 1) canvas
+        zoom_levels: Canvas scales to prepare, relative to the base canvas
+        topology: Optional arc store whose objects are aligned with geometries
+
+    Returns:
+        One tier per zoom level, in the given order
+    """
+    pixels_per_degree = projector.pixels_per_degree
+    geometry_array = np.asarray(geometries, dtype=object)
+
+    tiers = []
+    for zoom in zoom_levels:
+        tolerance = PIXEL_TOLERANCE / (pixels_per_degree * zoom)
+        simplified = shapely.simplify(geometry_array, tolerance, preserve_topology=True)
+        simplified_topology = topology.simplify(tolerance) if topology is not None else None
+        tiers.append(SimplificationTier(zoom, tolerance, list(simplified), simplified_topology))
+    return tiers
+
+
+def tier_for_zoom(tiers: list[SimplificationTier], zoom: float) -> int:
+    """Pick the coarsest tier still within half a pixel at a canvas scale.
+
+    Args:
+        tiers: Tiers ordered by increasing zoom, as from build_simplification_tiers
+        zoom: Current canvas scale relative to the base canvas
+
+    Returns:
+        Index of the first tier prepared for at least this zoom, or of the most detailed
+        tier beyond the last level
+    """
+    for index, tier in enumerate(tiers):
+        if tier.zoom >= zoom:
+            return index
+    return len(tiers) - 1
@@ -0,0 +1,184 @@
+"""Immutable geometry data shared by every quiz player."""
+
+from collections.abc import Sequence
+
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import Point
+from shapely.geometry.base import BaseGeometry
+
+from .dataset import CountryDataset
+from .hitmap import OCEAN, UNRESOLVED, RasterHitMap
+from .projection import CoordinateProjector
+
+# Hit-test strategies understood by GeometryStore (and QuizManager)
+HIT_TEST_ENGINES = ("linear", "strtree", "raster")
+
+
+class GeometryStore:
+    """Country geometries, projector and hit-test indexes, built once and never mutated.
+
+    Everything here is independent of any one player, so a single store can back any
+    number of QuizManager instances (one per player) without copying geometry.
+
+    Preparing geometries never changes their values, but attaches GEOS's edge index to
+    the geometry objects themselves, which belong to the dataset. Prepared stores built
+    on one dataset therefore share that preparation, while a store created with
+    prepare_geometries=False always works on private copies, so no other store can
+    prepare them later.
+    """
+
+    def __init__(
+        self,
+        dataset: CountryDataset,
+        projector: CoordinateProjector,
+        hit_test: str = "strtree",
+        prepare_geometries: bool = True,
+    ) -> None:
+        if hit_test not in HIT_TEST_ENGINES:
+            raise ValueError(
+                f"Unknown hit-test engine: {hit_test!r} (expected one of {HIT_TEST_ENGINES})"
+            )
+
+        self.dataset = dataset
+        self.projector = projector
+        self.hit_test = hit_test
+        self.prepare_geometries = prepare_geometries
+        self.country_data = dataset.country_data  # Dict mapping country names to geometry
+
+        # Build the spatial index once; tree positions follow load order so candidates
+        # can be resolved back to names and tested in the same order as a linear scan
+        # Countries are identified by their load-order index (country ID) everywhere on
+        # the hot path; names, geometries and per-player state are parallel to it and
+        # names are only resolved for display
+        self.country_names = tuple(self.country_data)
+        self.geometries = tuple(self.country_data.values())
+        if not prepare_geometries:
+            # WKB round-trips coordinates exactly and yields fresh, unprepared objects
+            copies = shapely.from_wkb(shapely.to_wkb(self.geometries))
+            self.geometries = tuple(copies.tolist())
+            self.country_data = dict(zip(self.country_names, self.geometries))
+        self.country_ids = {name: country_id for country_id, name in enumerate(self.country_names)}
+        self.spatial_index = STRtree(self.geometries)
+
+        # Where countries overlap (an enclave inside a neighbour without a hole, or sliver
+        # overlaps along borders) the innermost one wins; smaller area stands in for
+        # "innermost", with load order breaking ties. Every engine uses this ranking
+        self.precedence = precedence_ranks(self.geometries)
+        self.innermost_first = np.argsort(self.precedence)  # Country IDs by precedence
+        self._linear_order = self.innermost_first.tolist()
+
+        # Prepare geometries in place (shared with the dataset) so repeated contains()
+        # calls reuse the cached edge index instead of rebuilding it on every click
+        if prepare_geometries:
+            shapely.prepare(self.geometries)
+
+        # Pixel label raster for the canvas, only built when selected since it costs a
+        # full pass over the canvas at startup
+        self.hit_map = None
+        if hit_test == "raster":
+            self.hit_map = RasterHitMap(
+                list(self.geometries), projector, precedence=self.precedence
+            )
+
+    def locate(self, x: int, y: int) -> str | None:
+        """Return the country under a canvas point, or None for the ocean."""
+        country_id = self.locate_id(x, y)
+        return None if country_id == OCEAN else self.country_names[country_id]
+
+    def locate_id(self, x: int, y: int) -> int:
+        """Return the ID of the country under a canvas point, or OCEAN."""
+        if self.hit_test == "raster":
+            return self._locate_raster(x, y)
+
+        # Convert canvas coordinates to geographic coordinates
+        lon, lat = self.projector.canvas_to_geo(x, y)
+        point = Point(lon, lat)
+
+        if self.hit_test == "linear":
+            return self._locate_linear(point)
+        return self._locate_indexed(point)
+
+    def locate_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Locate many canvas clicks at once.
+
+        Points are projected in one batch and classified with a single STRtree bulk
+        query, giving exactly the countries locate would report one at a time.
+
+        Args:
+            xs: Canvas x coordinates
+            ys: Canvas y coordinates, same shape as xs
+
+        Returns:
+            Int array of indices into country_names, OCEAN for ocean clicks
+        """
+        xs = np.asarray(xs).ravel()
+        ys = np.asarray(ys).ravel()
+        if xs.shape != ys.shape:
+            raise ValueError(f"Mismatched click arrays: {xs.shape} vs {ys.shape}")
+
+        if self.hit_test == "raster":
+            indices = self.hit_map.lookup_array(xs, ys)
+            pending = np.flatnonzero(indices == UNRESOLVED)
+        else:
+            indices = np.full(len(xs), OCEAN, dtype=np.int64)
+            pending = np.arange(len(xs))
+
+        if len(pending):
+            indices[pending] = self._locate_indexed_array(xs[pending], ys[pending])
+        return indices
+
+    def _locate_linear(self, point: Point) -> int:
+        # Test against all countries, innermost first
+        for country_id in self._linear_order:
+            if self.geometries[country_id].contains(point):
+                return country_id
+        return OCEAN
+
+    def _locate_indexed(self, point: Point) -> int:
+        # Only countries whose bounding box holds the point are tested exactly; sorting the
+        # candidates by precedence keeps the first-match-wins order of the linear scan
+        candidates = self.spatial_index.query(point)
+        for country_id in candidates[np.argsort(self.precedence[candidates])].tolist():
+            if self.geometries[country_id].contains(point):
+                return country_id
+        return OCEAN
+
+    def _locate_indexed_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        coords = self.projector.canvas_to_geo_array(np.column_stack([xs, ys]))
+        points = shapely.points(coords)
+
+        # "within" pairs each point with every country containing it; the best-ranked one
+        # wins, matching the first-match order of the scalar engines
+        point_ids, country_ids = self.spatial_index.query(points, predicate="within")
+        no_country = len(self.country_names)
+        first_rank = np.full(len(points), no_country, dtype=np.int64)
+        np.minimum.at(first_rank, point_ids, self.precedence[country_ids])
+        found = first_rank < no_country
+        indices = np.full(len(points), OCEAN, dtype=np.int64)
+        indices[found] = self.innermost_first[first_rank[found]]
+        return indices
+
+    def _locate_raster(self, x: int, y: int) -> int:
+        index = self.hit_map.lookup(x, y)
+        if index is None:
+            # Border pixel or off-canvas click: resolve exactly
+            lon, lat = self.projector.canvas_to_geo(x, y)
+            return self._locate_indexed(Point(lon, lat))
+        return index
+
+
+def precedence_ranks(geometries: Sequence[BaseGeometry]) -> np.ndarray:
+    """Rank countries for overlap resolution: smallest area first, then load order.
+
+    Args:
+        geometries: Country geometries in load order
+
+    Returns:
+        Int array where element i is the rank of geometry i (0 wins every overlap)
+    """
+    order = np.lexsort((np.arange(len(geometries)), shapely.area(geometries)))
+    ranks = np.empty(len(geometries), dtype=np.int64)
+    ranks[order] = np.arange(len(geometries))
+    return ranks
@@ -0,0 +1,153 @@
+"""Incremental GeoJSON reading for boundary files too large to parse in one go."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JSONStream:
+    """Character buffer over a text file that grows on demand and forgets consumed input."""
+
+    def __init__(self, f: object, chunk_size: int) -> None:
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self) -> bool:
+        if self.eof:
+            return False
+        # Read at least as much as is already buffered so a value spanning many chunks
+        # is re-scanned O(log n) times rather than once per chunk
+        chunk = self._file.read(max(self._chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid GeoJSON format: expected {char!r}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> object:
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # The value may simply be cut off at the end of the buffer
+                if self._read_more():
+                    continue
+                raise ValueError(f"Invalid GeoJSON format: {e}") from e
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self._read_more():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_geojson_features(geojson_path: str | Path, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """Yield the features of a GeoJSON FeatureCollection one at a time.
+
+    Only the top-level object is walked incrementally; each feature is decoded on its
+    own, so memory use is bounded by the largest single feature rather than the file.
+
+    Args:
+        geojson_path: Path to the GeoJSON file
+        chunk_size: Number of characters read from the file at a time
+
+    Yields:
+        Feature objects in file order
+    """
+    try:
+        with open(geojson_path, encoding="utf-8") as f:
+            yield from _iter_features(_JSONStream(f, chunk_size))
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"GeoJSON file not found: {geojson_path}") from e
+    except PermissionError as e:
+        raise PermissionError(f"Permission denied accessing GeoJSON file: {geojson_path}") from e
+
+
+def read_document_type(geojson_path: str | Path, chunk_size: int = 1 << 16) -> str | None:
+    """Read the top-level "type" of a JSON document without loading its features.
+
+    Top-level members are walked in file order and reading stops at "features", so a
+    GeoJSON file is never decoded past its header.
+
+    Args:
+        geojson_path: Path to the GeoJSON (or TopoJSON) file
+        chunk_size: Number of characters read from the file at a time
+
+    Returns:
+        The "type" string (e.g. "FeatureCollection" or "Topology"), or None when it is
+        missing or only follows the features
+    """
+    try:
+        with open(geojson_path, encoding="utf-8") as f:
+            stream = _JSONStream(f, chunk_size)
+            if stream.peek() != "{":
+                return None
+            stream.expect("{")
+            while stream.peek() not in ("}", ""):
+                key = stream.value()
+                stream.expect(":")
+                if key == "features":
+                    return None
+                value = stream.value()
+                if key == "type":
+                    return value if isinstance(value, str) else None
+                if stream.peek() == ",":
+                    stream.expect(",")
+            return None
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"GeoJSON file not found: {geojson_path}") from e
+    except PermissionError as e:
+        raise PermissionError(f"Permission denied accessing GeoJSON file: {geojson_path}") from e
+
+
+def _iter_features(stream: _JSONStream) -> Iterator[dict]:
+    if stream.peek() != "{":
+        raise ValueError("Invalid GeoJSON format: missing 'features' key")
+    stream.expect("{")
+
+    # Skip top-level members ("type", "bbox", "crs", ...) until the features array
+    while stream.peek() != "}":
+        key = stream.value()
+        stream.expect(":")
+        if key == "features":
+            break
+        stream.value()
+        if stream.peek() == ",":
+            stream.expect(",")
+    else:
+        raise ValueError("Invalid GeoJSON format: missing 'features' key")
+
+    if stream.peek() != "[":
+        raise ValueError("Invalid GeoJSON format: 'features' must be a list")
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+    while True:
+        yield stream.value()
+        if stream.peek() == "]":
+            return
+        stream.expect(",")
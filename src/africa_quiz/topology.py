@@ -0,0 +1,345 @@
+"""Shared-border topology: country rings stored as deduplicated arcs, TopoJSON style.
+
+Neighbouring countries in GeoJSON repeat every shared border, once per feature. A
+Topology cuts rings at junctions (vertices where the set of neighbouring vertices
+changes) and stores each distinct border section once as an arc. Rings reference arcs
+by index, with ``~i`` (``-i - 1``) meaning arc ``i`` traversed backwards.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from itertools import pairwise
+
+import numpy as np
+import shapely
+
+Point = tuple[float, float]
+
+
+@dataclass
+class TopologyObject:
+    """One feature of a topology: its properties and polygons as arc references."""
+
+    properties: dict
+    geometry_type: str | None
+    polygons: list[list[list[int]]] = field(default_factory=list)  # polygon -> ring -> arcs
+    id: object = None
+
+
+class Topology:
+    """Arc store shared by every country ring."""
+
+    def __init__(
+        self, coords: np.ndarray, arc_offsets: np.ndarray, objects: list[TopologyObject]
+    ) -> None:
+        """Wrap an already built arc store.
+
+        Args:
+            coords: Float array of shape (n, 2) with the vertices of all arcs back to back
+            arc_offsets: Int array of length n_arcs + 1; arc i is coords[off[i]:off[i + 1]]
+            objects: Features in source order
+        """
+        self.coords = coords
+        self.arc_offsets = arc_offsets
+        self.objects = objects
+
+    @classmethod
+    def from_geojson(cls, geojson_data: dict) -> "Topology":
+        """Build a topology from a GeoJSON FeatureCollection."""
+        if not isinstance(geojson_data, dict) or "features" not in geojson_data:
+            raise ValueError("Invalid GeoJSON format: missing 'features' key")
+        return cls.from_features(geojson_data["features"])
+
+    @classmethod
+    def from_features(cls, features: Iterable[dict]) -> "Topology":
+        """Build a topology from GeoJSON features, deduplicating shared borders.
+
+        Args:
+            features: GeoJSON features; non-polygon features are kept as empty objects so
+                feature order and properties survive a round trip
+
+        Returns:
+            Topology whose arcs hold every polygon vertex exactly once
+        """
+        objects = []
+        rings: list[list[Point]] = []
+        for feature in features:
+            if not isinstance(feature, dict):
+                objects.append(TopologyObject({}, None))
+                continue
+            properties = feature.get("properties") or {}
+            geometry = feature.get("geometry") or {}
+            geometry_type = geometry.get("type")
+            coords = geometry.get("coordinates")
+
+            if geometry_type == "Polygon" and coords:
+                polygons = [coords]
+            elif geometry_type == "MultiPolygon" and coords:
+                polygons = coords
+            else:
+                polygons = []
+
+            ring_ids = []
+            for polygon in polygons:
+                ring_ids.append(list(range(len(rings), len(rings) + len(polygon))))
+                for ring in polygon:
+                    points = [(float(p[0]), float(p[1])) for p in ring]
+                    if len(points) > 1 and points[0] == points[-1]:
+                        points.pop()  # Arcs store rings open; decoding closes them again
+                    rings.append(points)
+            objects.append(TopologyObject(properties, geometry_type, ring_ids, feature.get("id")))
+
+        builder = _ArcBuilder(rings)
+        for topology_object in objects:
+            topology_object.polygons = [
+                [builder.ring_arcs[ring_id] for ring_id in polygon]
+                for polygon in topology_object.polygons
+            ]
+        return cls(*builder.arc_store(), objects)
+
+    @classmethod
+    def from_topojson(cls, topojson_data: dict, object_name: str | None = None) -> "Topology":
+        """Load a TopoJSON document, decoding quantized arcs if it has a transform.
+
+        Args:
+            topojson_data: Parsed TopoJSON Topology
+            object_name: Name of the object to load; defaults to the first one
+
+        Returns:
+            Topology with one TopologyObject per geometry of the chosen object
+        """
+        if not isinstance(topojson_data, dict) or topojson_data.get("type") != "Topology":
+            raise ValueError("Invalid TopoJSON format: expected a 'Topology' object")
+        if not topojson_data.get("objects"):
+            raise ValueError("Invalid TopoJSON format: missing 'objects'")
+
+        transform = topojson_data.get("transform")
+        arcs = []
+        for arc in topojson_data.get("arcs", []):
+            points = np.asarray(arc, dtype=np.float64).reshape(-1, 2)
+            if transform:
+                # Quantized arcs are delta-encoded integer positions
+                points = np.cumsum(points, axis=0) * transform["scale"] + transform["translate"]
+            arcs.append(points)
+
+        if object_name is None:
+            object_name = next(iter(topojson_data["objects"]))
+        topojson_object = topojson_data["objects"][object_name]
+        if topojson_object.get("type") == "GeometryCollection":
+            geometries = topojson_object.get("geometries", [])
+        else:
+            geometries = [topojson_object]
+
+        objects = []
+        for geometry in geometries:
+            geometry_type = geometry.get("type")
+            if geometry_type == "Polygon":
+                polygons = [geometry.get("arcs", [])]
+            elif geometry_type == "MultiPolygon":
+                polygons = geometry.get("arcs", [])
+            else:
+                polygons = []
+            objects.append(
+                TopologyObject(
+                    geometry.get("properties") or {}, geometry_type, polygons, geometry.get("id")
+                )
+            )
+
+        offsets = np.zeros(len(arcs) + 1, dtype=np.int64)
+        np.cumsum([len(arc) for arc in arcs], out=offsets[1:])
+        coords = np.concatenate(arcs) if arcs else np.empty((0, 2))
+        return cls(coords, offsets, objects)
+
+    def to_topojson(self, object_name: str = "countries") -> dict:
+        """Serialize as an unquantized TopoJSON document."""
+        geometries = []
+        for topology_object in self.objects:
+            geometry = {
+                "type": topology_object.geometry_type,
+                "properties": topology_object.properties,
+            }
+            if topology_object.geometry_type == "Polygon" and topology_object.polygons:
+                geometry["arcs"] = topology_object.polygons[0]
+            elif topology_object.geometry_type == "MultiPolygon" and topology_object.polygons:
+                geometry["arcs"] = topology_object.polygons
+            if topology_object.id is not None:
+                geometry["id"] = topology_object.id
+            geometries.append(geometry)
+
+        return {
+            "type": "Topology",
+            "bbox": list(self.bbox),
+            "arcs": [self.arc(index).tolist() for index in range(self.arc_count)],
+            "objects": {object_name: {"type": "GeometryCollection", "geometries": geometries}},
+        }
+
+    @property
+    def arc_count(self) -> int:
+        return len(self.arc_offsets) - 1
+
+    @property
+    def vertex_count(self) -> int:
+        """Number of stored vertices; shared border vertices count once."""
+        return len(self.coords)
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        """Geographic bounding box of every arc vertex."""
+        if not len(self.coords):
+            return (float("inf"), float("inf"), float("-inf"), float("-inf"))
+        min_lon, min_lat = self.coords.min(axis=0)
+        max_lon, max_lat = self.coords.max(axis=0)
+        return (float(min_lon), float(min_lat), float(max_lon), float(max_lat))
+
+    def arc(self, ref: int, coords: np.ndarray | None = None) -> np.ndarray:
+        """Return the points of an arc reference, reversed for negative references.
+
+        Args:
+            ref: Arc index, or ~index for the reversed arc
+            coords: Alternative per-vertex array aligned with self.coords (e.g. the
+                projected canvas coordinates); defaults to the geographic coordinates
+        """
+        coords = self.coords if coords is None else coords
+        index = ref if ref >= 0 else ~ref
+        points = coords[self.arc_offsets[index] : self.arc_offsets[index + 1]]
+        return points if ref >= 0 else points[::-1]
+
+    def ring(self, arc_refs: list[int], coords: np.ndarray | None = None) -> np.ndarray:
+        """Stitch a closed ring together from its arcs.
+
+        Consecutive arcs share their joining vertex, so it is only emitted once.
+        """
+        parts = [self.arc(ref, coords) for ref in arc_refs]
+        if not parts:
+            return np.empty((0, 2), dtype=(self.coords if coords is None else coords).dtype)
+        ring = np.concatenate([parts[0], *(part[1:] for part in parts[1:])])
+        if len(ring) and (ring[0] != ring[-1]).any():
+            ring = np.concatenate([ring, ring[:1]])  # Single closed arcs are stored open
+        return ring
+
+    def to_features(self) -> list[dict]:
+        """Decode every object back to a GeoJSON feature, in source order."""
+        features = []
+        for topology_object in self.objects:
+            polygons = [
+                [self.ring(ring).tolist() for ring in polygon]
+                for polygon in topology_object.polygons
+            ]
+            if topology_object.geometry_type == "Polygon" and polygons:
+                coordinates = polygons[0]
+            elif topology_object.geometry_type == "MultiPolygon" and polygons:
+                coordinates = polygons
+            else:
+                coordinates = None
+            feature = {
+                "type": "Feature",
+                "properties": topology_object.properties,
+                "geometry": {"type": topology_object.geometry_type, "coordinates": coordinates},
+            }
+            if topology_object.id is not None:
+                feature["id"] = topology_object.id
+            features.append(feature)
+        return features
+
+    def simplify(self, tolerance: float) -> "Topology":
+        """Douglas-Peucker simplify every arc once.
+
+        Arc end points are junctions and are always kept, so neighbouring countries
+        keep identical simplified borders.
+        """
+        # Junction-free rings are stored as one open arc; simplify them closed so they
+        # keep enough vertices to stay polygons
+        closed = {
+            ~ring[0] if ring[0] < 0 else ring[0]
+            for topology_object in self.objects
+            for polygon in topology_object.polygons
+            for ring in polygon
+            if len(ring) == 1
+        }
+        arcs = []
+        for index in range(self.arc_count):
+            arc = self.arc(index)
+            if index in closed:
+                arc = np.concatenate([arc, arc[:1]])
+            if len(arc) >= 2:
+                line = shapely.simplify(shapely.linestrings(arc), tolerance, preserve_topology=True)
+                arc = shapely.get_coordinates(line)
+            arcs.append(arc[:-1] if index in closed else arc)
+
+        offsets = np.zeros(len(arcs) + 1, dtype=np.int64)
+        np.cumsum([len(arc) for arc in arcs], out=offsets[1:])
+        coords = np.concatenate(arcs) if arcs else np.empty((0, 2))
+        return Topology(coords, offsets, self.objects)
+
+
+class _ArcBuilder:
+    """Cuts open rings at junctions and deduplicates the resulting arcs."""
+
+    def __init__(self, rings: list[list[Point]]) -> None:
+        self.arcs: list[list[Point]] = []
+        self._open_index: dict[tuple[Point, ...], int] = {}
+        self._closed_index: dict[tuple[Point, ...], int] = {}
+
+        junctions = self._find_junctions(rings)
+        self.ring_arcs = [self._cut_ring(points, junctions) for points in rings]
+
+    @staticmethod
+    def _find_junctions(rings: list[list[Point]]) -> set[Point]:
+        # A vertex is a junction when it is seen with different neighbours, i.e. where a
+        # shared border starts, ends or branches
+        neighbours: dict[Point, frozenset] = {}
+        junctions = set()
+        for points in rings:
+            count = len(points)
+            for i, point in enumerate(points):
+                pair = frozenset((points[i - 1], points[(i + 1) % count]))
+                seen = neighbours.setdefault(point, pair)
+                if seen != pair:
+                    junctions.add(point)
+        return junctions
+
+    def _cut_ring(self, points: list[Point], junctions: set[Point]) -> list[int]:
+        cuts = [i for i, point in enumerate(points) if point in junctions]
+        if not cuts:
+            return [self._add_closed_arc(points)]
+
+        # Rotate so the ring starts on a junction, then split at every junction
+        rotated = points[cuts[0] :] + points[: cuts[0]] + [points[cuts[0]]]
+        positions = [cut - cuts[0] for cut in cuts] + [len(points)]
+        return [self._add_open_arc(rotated[start : end + 1]) for start, end in pairwise(positions)]
+
+    def _add_open_arc(self, arc: list[Point]) -> int:
+        key = tuple(arc)
+        if key in self._open_index:
+            return self._open_index[key]
+        reversed_key = key[::-1]
+        if reversed_key in self._open_index:
+            return ~self._open_index[reversed_key]
+        self._open_index[key] = len(self.arcs)
+        self.arcs.append(arc)
+        return len(self.arcs) - 1
+
+    def _add_closed_arc(self, points: list[Point]) -> int:
+        # Junction-free rings (islands, enclaves and the holes around them) match
+        # regardless of their start vertex, so compare a canonical rotation
+        forward = _canonical_rotation(points)
+        if forward in self._closed_index:
+            return self._closed_index[forward]
+        backward = _canonical_rotation(points[::-1])
+        if backward in self._closed_index:
+            return ~self._closed_index[backward]
+        self._closed_index[forward] = len(self.arcs)
+        self.arcs.append(points)
+        return len(self.arcs) - 1
+
+    def arc_store(self) -> tuple[np.ndarray, np.ndarray]:
+        offsets = np.zeros(len(self.arcs) + 1, dtype=np.int64)
+        np.cumsum([len(arc) for arc in self.arcs], out=offsets[1:])
+        points = [point for arc in self.arcs for point in arc]
+        coords = np.array(points, dtype=np.float64).reshape(-1, 2)
+        return coords, offsets
+
+
+def _canonical_rotation(points: list[Point]) -> tuple[Point, ...]:
+    start = points.index(min(points))
+    return tuple(points[start:] + points[:start])
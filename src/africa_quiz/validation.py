@@ -0,0 +1,151 @@
+"""Bulk country geometry validation with per-feature load diagnostics."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry.base import BaseGeometry
+
+
+@dataclass(frozen=True)
+class FeatureIssue:
+    """A feature that was skipped or repaired while loading."""
+
+    index: int  # Position of the feature in the source document
+    name: str | None
+    reason: str
+
+
+@dataclass
+class LoadReport:
+    """Counts and reasons for what happened to every feature of a load."""
+
+    accepted: int = 0  # Countries loaded, including repaired ones
+    repaired: list[FeatureIssue] = field(default_factory=list)
+    skipped: list[FeatureIssue] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.accepted + len(self.skipped)
+
+    def reason_counts(self) -> Counter:
+        """Number of skipped features per reason category (the text before any detail)."""
+        return Counter(issue.reason.split(":")[0] for issue in self.skipped)
+
+    def extend(self, other: "LoadReport") -> None:
+        """Add the results of another chunk of the same load."""
+        self.accepted += other.accepted
+        self.repaired.extend(other.repaired)
+        self.skipped.extend(other.skipped)
+
+    def summary(self) -> str:
+        reasons = ", ".join(f"{count} {reason}" for reason, count in self.reason_counts().items())
+        return (
+            f"{self.accepted} accepted ({len(self.repaired)} repaired), "
+            f"{len(self.skipped)} skipped" + (f" ({reasons})" if reasons else "")
+        )
+
+
+def build_countries(
+    features: list[dict] | tuple[dict, ...], repair: bool = False, start: int = 0
+) -> tuple[list[int], list[str], list[BaseGeometry], LoadReport]:
+    """Build country geometries from features and validate them in one bulk pass.
+
+    Structural checks run per feature; validity is checked with one shapely.is_valid
+    call over every built geometry, and reasons are only computed for the failures.
+
+    Args:
+        features: GeoJSON features
+        repair: Fix invalid geometries with make_valid instead of skipping them
+        start: Index of the first feature in the source document, for the report
+
+    Returns:
+        Tuple of (feature indices, names, geometries) of accepted countries in feature
+        order, and the load report
+    """
+    report = LoadReport()
+    indices = []
+    names = []
+    geometries = []
+    for index, feature in enumerate(features, start):
+        name, geometry, reason = _parse_feature(feature)
+        if reason is not None:
+            report.skipped.append(FeatureIssue(index, name, reason))
+        else:
+            indices.append(index)
+            names.append(name)
+            geometries.append(geometry)
+
+    geometry_array = np.array(geometries, dtype=object)
+    valid = shapely.is_valid(geometry_array)
+    invalid = np.flatnonzero(~valid)
+    keep = valid.copy()
+    if len(invalid):
+        reasons = shapely.is_valid_reason(geometry_array[invalid])
+        fixed = shapely.make_valid(geometry_array[invalid]) if repair else [None] * len(invalid)
+        for position, reason, fixed_geometry in zip(invalid.tolist(), reasons, fixed):
+            issue_reason = f"invalid geometry: {reason}"
+            polygonal = _polygonal_part(fixed_geometry) if fixed_geometry is not None else None
+            if polygonal is None:
+                report.skipped.append(
+                    FeatureIssue(indices[position], names[position], issue_reason)
+                )
+                continue
+            geometry_array[position] = polygonal
+            keep[position] = True
+            report.repaired.append(FeatureIssue(indices[position], names[position], issue_reason))
+
+    report.skipped.sort(key=lambda issue: issue.index)
+    kept = np.flatnonzero(keep).tolist()
+    report.accepted = len(kept)
+    return (
+        [indices[i] for i in kept],
+        [names[i] for i in kept],
+        geometry_array[kept].tolist(),
+        report,
+    )
+
+
+def _parse_feature(feature: dict) -> tuple[str | None, BaseGeometry | None, str | None]:
+    # Returns (name, unvalidated geometry, None), or (name, None, skip reason)
+    # Validate feature structure
+    if not isinstance(feature, dict):
+        return None, None, "malformed feature"  # Skip malformed features
+
+    properties = feature.get("properties", {})
+    geometry = feature.get("geometry", {})
+
+    # Skip features without required properties
+    if not properties.get("name"):
+        return None, None, "missing name"  # Skip features without names
+
+    country_name = properties["name"]
+    coords = geometry.get("coordinates")
+    geometry_type = geometry.get("type")
+
+    if not coords or geometry_type not in ["Polygon", "MultiPolygon"]:
+        # Skip unsupported or malformed geometry types
+        return country_name, None, f"unsupported geometry: {geometry_type}"
+
+    try:
+        # Create shapely geometry, keeping interior rings (e.g. the hole an enclave fills)
+        if geometry_type == "Polygon":
+            return country_name, Polygon(coords[0], coords[1:]), None
+        polygons = [Polygon(poly[0], poly[1:]) for poly in coords]
+        return country_name, MultiPolygon(polygons), None
+    except Exception as e:
+        # Skip countries with geometry processing errors
+        return country_name, None, f"geometry error: {e}"
+
+
+def _polygonal_part(geometry: BaseGeometry) -> BaseGeometry | None:
+    # make_valid may return collections with stray lines or points; keep only the area
+    if isinstance(geometry, Polygon | MultiPolygon):
+        return None if geometry.is_empty else geometry
+    parts = shapely.get_parts(shapely.get_parts(geometry)).tolist()  # Flatten twice
+    polygons = [part for part in parts if isinstance(part, Polygon) and not part.is_empty]
+    if not polygons:
+        return None
+    return polygons[0] if len(polygons) == 1 else MultiPolygon(polygons)
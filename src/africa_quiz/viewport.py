@@ -0,0 +1,163 @@
+"""Zoom and pan of the base map on the visible canvas."""
+
+import numpy as np
+
+from .projection import CoordinateProjector
+
+# Zoom limits relative to the whole map filling the canvas; simplify.DEFAULT_ZOOM_LEVELS
+# provides outlines accurate to half a pixel up to MAX_ZOOM
+MIN_ZOOM = 1.0
+MAX_ZOOM = 64.0
+
+
+class Viewport:
+    """Maps between screen pixels and base map pixels under the current zoom and pan.
+
+    Base map pixels are the projector's canvas coordinates at zoom 1. The whole map is
+    fitted to the screen (fit), then magnified by zoom; the viewport shows the map
+    rectangle starting at (x, y), so screen = (map - origin) * scale with
+    scale = fit * zoom.
+    """
+
+    def __init__(
+        self, width: int, height: int, min_zoom: float = MIN_ZOOM, max_zoom: float = MAX_ZOOM
+    ) -> None:
+        """Start fully zoomed out on a screen the size of the base map.
+
+        Args:
+            width: Width of the base map in pixels
+            height: Height of the base map in pixels
+            min_zoom: Smallest allowed zoom
+            max_zoom: Largest allowed zoom
+        """
+        self.width = width
+        self.height = height
+        self.screen_width = width
+        self.screen_height = height
+        self.fit = 1.0  # Screen pixels per map pixel when fully zoomed out
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.zoom = min_zoom
+        self.x = 0.0  # Map pixel at the screen's left edge
+        self.y = 0.0  # Map pixel at the screen's top edge
+
+    @property
+    def scale(self) -> float:
+        """Screen pixels per base map pixel."""
+        return self.fit * self.zoom
+
+    @property
+    def is_identity(self) -> bool:
+        """Whether screen and map pixels coincide."""
+        return (self.scale, self.x, self.y) == (1.0, 0.0, 0.0)
+
+    def screen_to_map(self, sx: float, sy: float) -> tuple[float, float]:
+        """Convert a screen point to base map pixel coordinates."""
+        if self.is_identity:
+            return (sx, sy)  # Keep whole pixels whole for the raster hit map
+        return (self.x + sx / self.scale, self.y + sy / self.scale)
+
+    def map_to_screen(self, mx: float, my: float) -> tuple[float, float]:
+        """Convert a base map point to screen coordinates."""
+        return ((mx - self.x) * self.scale, (my - self.y) * self.scale)
+
+    def map_bounds(self) -> tuple[float, float, float, float]:
+        """Visible map rectangle as (left, top, right, bottom) in map pixels."""
+        return (
+            self.x,
+            self.y,
+            self.x + self.screen_width / self.scale,
+            self.y + self.screen_height / self.scale,
+        )
+
+    def resize(self, screen_width: int, screen_height: int) -> None:
+        """Fit the map to a new screen size, keeping zoom and the top-left map point.
+
+        Args:
+            screen_width: New screen width in pixels
+            screen_height: New screen height in pixels
+        """
+        self.screen_width = max(screen_width, 1)
+        self.screen_height = max(screen_height, 1)
+        self.fit = min(self.screen_width / self.width, self.screen_height / self.height)
+        self._clamp()
+
+    def geo_bounds(self, projector: CoordinateProjector) -> tuple[float, float, float, float]:
+        """Visible area as a geographic (min_lon, min_lat, max_lon, max_lat) box."""
+        left, top, right, bottom = self.map_bounds()
+        (bounds,) = projector.canvas_boxes_to_geo([left, top], [right, bottom]).tolist()
+        return tuple(bounds)
+
+    def visible(self, bounds: np.ndarray, projector: CoordinateProjector) -> np.ndarray:
+        """Flag rows of per-country geographic bounds that intersect the viewport.
+
+        Args:
+            bounds: (min_lon, min_lat, max_lon, max_lat) rows, e.g. CountryDataset.bounds
+            projector: Base map projector
+
+        Returns:
+            Boolean array, True for countries that may be visible
+        """
+        min_lon, min_lat, max_lon, max_lat = self.geo_bounds(projector)
+        return (
+            (bounds[:, 0] <= max_lon)
+            & (bounds[:, 2] >= min_lon)
+            & (bounds[:, 1] <= max_lat)
+            & (bounds[:, 3] >= min_lat)
+        )
+
+    def zoom_at(self, sx: float, sy: float, factor: float) -> float:
+        """Zoom by a factor keeping the map point under a screen point in place.
+
+        Args:
+            sx: Screen x of the zoom center, e.g. the mouse pointer
+            sy: Screen y of the zoom center
+            factor: Requested zoom multiplier; clamped to the zoom limits
+
+        Returns:
+            Zoom multiplier actually applied
+        """
+        zoom = min(max(self.zoom * factor, self.min_zoom), self.max_zoom)
+        applied = zoom / self.zoom
+        mx, my = self.screen_to_map(sx, sy)
+        self.zoom = zoom
+        self.x = mx - sx / self.scale
+        self.y = my - sy / self.scale
+        self._clamp()
+        return applied
+
+    def pan(self, dx: float, dy: float) -> tuple[float, float]:
+        """Drag the map by a screen offset, keeping it covering the screen.
+
+        Returns:
+            Screen offset actually applied after clamping
+        """
+        x, y = self.x, self.y
+        self.x -= dx / self.scale
+        self.y -= dy / self.scale
+        self._clamp()
+        return ((x - self.x) * self.scale, (y - self.y) * self.scale)
+
+    def _clamp(self) -> None:
+        # Never scroll beyond the map's edges; on a screen of another aspect ratio the
+        # spare room is left at the right or bottom
+        self.x = min(max(self.x, 0.0), max(self.width - self.screen_width / self.scale, 0.0))
+        self.y = min(max(self.y, 0.0), max(self.height - self.screen_height / self.scale, 0.0))
+
+    def to_screen_array(self, points: np.ndarray, scale_x: float, scale_y: float) -> np.ndarray:
+        """Transform points stored at another scale of the map onto the screen.
+
+        Args:
+            points: Array of shape (n, 2) of map points multiplied by (scale_x, scale_y),
+                e.g. canvas rings projected for a zoomed simplification tier
+            scale_x: Horizontal scale of points relative to base map pixels
+            scale_y: Vertical scale of points relative to base map pixels
+
+        Returns:
+            Float array of shape (n, 2) of screen coordinates
+        """
+        scale = self.scale
+        screen = np.empty(points.shape, dtype=np.float64)
+        screen[:, 0] = points[:, 0] * (scale / scale_x) - self.x * scale
+        screen[:, 1] = points[:, 1] * (scale / scale_y) - self.y * scale
+        return screen
@@ -0,0 +1,71 @@
+"""Tests for the binary country geometry cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+
+def _copy_africa(tmp_path: Path) -> Path:
+    geojson_path = tmp_path / "africa.geojson"
+    shutil.copy("africa.geojson", geojson_path)
+    return geojson_path
+
+
+def test_cache_is_written_and_reused(tmp_path: Path) -> None:
+    """Test that a warm load returns the same countries without parsing the GeoJSON."""
+    from africa_quiz.cache import cache_path_for
+    from africa_quiz.dataset import CountryDataset
+
+    geojson_path = _copy_africa(tmp_path)
+
+    cold = CountryDataset.from_path(geojson_path, use_cache=True)
+    assert cache_path_for(geojson_path).exists()
+
+    warm = CountryDataset.from_path(geojson_path, use_cache=True)
+
+    # Warm loads come from the cache, so the JSON document has not been parsed
+    assert warm._geojson_data is None
+    assert warm.names == cold.names
+    assert warm.bbox == cold.bbox
+    for cold_geometry, warm_geometry in zip(cold.geometries, warm.geometries):
+        assert warm_geometry.geom_type == cold_geometry.geom_type
+        assert warm_geometry.equals_exact(cold_geometry, 0)
+
+    # Raw features are still available on demand
+    assert len(warm.features) == len(cold.features)
+
+
+def test_cache_is_invalidated_by_source_changes(tmp_path: Path) -> None:
+    """Test that edits or a new modification time make the cache stale."""
+    from africa_quiz.cache import load_cached_dataset
+    from africa_quiz.dataset import CountryDataset
+
+    geojson_path = _copy_africa(tmp_path)
+    CountryDataset.from_path(geojson_path, use_cache=True)
+    assert load_cached_dataset(geojson_path) is not None
+
+    # Same content, new modification time
+    stat = geojson_path.stat()
+    os.utime(geojson_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_cached_dataset(geojson_path) is None
+
+    # Rebuild, then change the content
+    CountryDataset.from_path(geojson_path, use_cache=True)
+    geojson_path.write_text(geojson_path.read_text().replace('"Angola"', '"Angola!"'))
+    assert load_cached_dataset(geojson_path) is None
+
+    reloaded = CountryDataset.from_path(geojson_path, use_cache=True)
+    assert "Angola!" in reloaded.names
+
+
+def test_corrupt_cache_is_ignored(tmp_path: Path) -> None:
+    """Test that an unreadable cache falls back to parsing the GeoJSON file."""
+    from africa_quiz.cache import cache_path_for, load_cached_dataset
+    from africa_quiz.dataset import CountryDataset
+
+    geojson_path = _copy_africa(tmp_path)
+    cache_path_for(geojson_path).write_bytes(b"AQCACHE2 truncated")
+
+    assert load_cached_dataset(geojson_path) is None
+    dataset = CountryDataset.from_path(geojson_path, use_cache=True)
+    assert len(dataset.names) >= 40
@@ -0,0 +1,80 @@
+"""Tests for country dataset loading."""
+
+import json
+from pathlib import Path
+
+
+def test_country_dataset_loads_countries_from_path() -> None:
+    """Test that CountryDataset parses the GeoJSON file and builds country geometries."""
+    from africa_quiz.dataset import CountryDataset
+
+    dataset = CountryDataset.from_path("africa.geojson")
+
+    assert len(dataset.features) == 49
+    assert len(dataset.names) == len(dataset.geometries) >= 40
+    assert {"Angola", "Egypt", "Nigeria"} <= set(dataset.names)
+    assert dataset.source == "africa.geojson"
+
+
+def test_country_dataset_bbox_matches_calculate_bbox() -> None:
+    """Test that the dataset bbox equals the projector's bbox over the raw document."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+
+    with open("africa.geojson") as f:
+        geojson_data = json.load(f)
+
+    dataset = CountryDataset(geojson_data)
+
+    assert dataset.bbox == CoordinateProjector.calculate_bbox(geojson_data)
+
+
+def test_quiz_manager_accepts_loaded_dataset() -> None:
+    """Test that QuizManager reuses a dataset instead of parsing the file again."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 800, 600)
+    quiz_manager = QuizManager(dataset, projector)
+
+    assert quiz_manager.dataset is dataset
+    assert quiz_manager.country_data is dataset.country_data
+    assert sorted(quiz_manager.countries) == sorted(dataset.names)
+
+    # Shuffling the quiz order must not reorder the shared dataset
+    quiz_manager.start_new_round()
+    assert dataset.names == [f["properties"]["name"] for f in dataset.features]
+
+
+def test_country_dataset_rejects_invalid_documents(tmp_path: Path) -> None:
+    """Test that malformed files raise the same errors QuizManager used to raise."""
+    import pytest
+
+    from africa_quiz.dataset import CountryDataset
+
+    with pytest.raises(FileNotFoundError, match="GeoJSON file not found"):
+        CountryDataset.from_path(tmp_path / "missing.geojson")
+
+    broken = tmp_path / "broken.geojson"
+    broken.write_text("{not json")
+    with pytest.raises(ValueError, match="Invalid GeoJSON format"):
+        CountryDataset.from_path(broken)
+
+    with pytest.raises(ValueError, match="missing 'features' key"):
+        CountryDataset({"type": "FeatureCollection"})
+
+    with pytest.raises(ValueError, match="No valid countries"):
+        CountryDataset({"features": [{"properties": {}, "geometry": {}}]})
+
+
+def test_country_dataset_exposes_per_country_bounds() -> None:
+    """Test that per-country bounds line up with the loaded geometries."""
+    from africa_quiz.dataset import CountryDataset
+
+    dataset = CountryDataset.from_path("africa.geojson")
+
+    assert dataset.bounds.shape == (len(dataset.names), 4)
+    for row, geometry in zip(dataset.bounds, dataset.geometries):
+        assert tuple(row) == geometry.bounds
@@ -11,6 +11,9 @@ class MockEvent:
 
     x: int
     y: int
+    delta: int = 0  # Mouse wheel rotation (Windows and macOS)
+    width: int = 0  # New widget size for <Configure>
+    height: int = 0
 
 
 def test_africa_quiz_app_can_be_created() -> None:
@@ -94,9 +97,8 @@ def test_africa_quiz_app_populates_canvas_geometries() -> None:
     # Should have actual coordinate data, not empty lists
     assert len(app.canvas_geometries) > 0
 
-    # Pick a country and verify it has coordinates
-    first_country = next(iter(app.canvas_geometries.keys()))
-    country_coords = app.canvas_geometries[first_country]
+    # Pick a country (by ID) and verify it has coordinates
+    country_coords = app.canvas_geometries[0]
 
     # Should have actual coordinate data (not empty list)
     assert len(country_coords) > 0
@@ -151,7 +153,7 @@ def test_main_function_actually_works() -> None:
 
         from main import main
 
-        main()
+        main(use_cache=False)  # Keep tests from writing next to the tracked data
 
         # Should have called mainloop on the root window
         mock_root.mainloop.assert_called_once()
@@ -477,3 +479,201 @@ def test_africa_quiz_app_handles_click_with_quiz_logic() -> None:
     # Country should now be colored (either green for correct or red for incorrect)
     assert current_country in app.country_colors
     assert app.country_colors[current_country] in ["green", "red"]
+
+
+def test_africa_quiz_app_accepts_loaded_dataset() -> None:
+    """Test that the app can share an already loaded dataset with its quiz manager."""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from africa_quiz.dataset import CountryDataset
+    from main import AfricaQuizApp
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    app = AfricaQuizApp(dataset)
+
+    assert app.quiz_manager.dataset is dataset
+    assert len(app.canvas_geometries) == len(dataset.names)
+
+
+def test_africa_quiz_app_click_restyles_existing_items() -> None:
+    """Test that a click recolors existing polygons instead of redrawing the map."""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from main import AfricaQuizApp
+
+    app = AfricaQuizApp()
+    app.draw_map()
+    polygons_before = [item for item in app.canvas.find_all() if app.canvas.type(item) == "polygon"]
+
+    current_country = app.quiz_manager.get_current_country()
+    current_id = app.quiz_manager.current_country_id
+    app.on_click(MockEvent(0, 0))  # Ocean click colors the prompted country red
+
+    polygons_after = [item for item in app.canvas.find_all() if app.canvas.type(item) == "polygon"]
+    assert polygons_after == polygons_before
+
+    for item in app.country_items[current_id]:
+        assert app.canvas.itemcget(item, "fill") == "red"
+    label = app.label_items[current_id]
+    assert app.canvas.itemcget(label, "text") == current_country
+
+
+def test_africa_quiz_app_reuses_items_across_rounds() -> None:
+    """Test that a new round resets existing items instead of recreating them."""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from main import AfricaQuizApp
+
+    app = AfricaQuizApp()
+    app.draw_map()
+
+    # Color one country, then complete the round with the last prompt
+    first_id = app.quiz_manager.current_country_id
+    app.on_click(MockEvent(0, 0))
+    app.quiz_manager.current_country_index = len(app.quiz_manager.countries) - 1
+    last_id = app.quiz_manager.current_country_id
+    items_before = app.canvas.find_all()
+    app.on_click(MockEvent(0, 0))
+
+    # Nothing is deleted, and the last answer is never drawn since the round resets it
+    assert set(items_before) <= set(app.canvas.find_all())
+    assert len(app.country_colors) == 0
+    assert app.canvas.itemcget(app.label_items[first_id], "state") == "hidden"
+    for country_id in (first_id, last_id):
+        for item in app.country_items[country_id]:
+            assert app.canvas.itemcget(item, "fill") == ""
+        label = app.label_items[country_id]
+        assert label is None or app.canvas.itemcget(label, "state") == "hidden"
+
+
+def test_africa_quiz_app_zooms_culls_and_clicks_small_countries() -> None:
+    """Test that wheel zoom draws only nearby countries and clicks still hit exactly."""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from main import AfricaQuizApp
+
+    app = AfricaQuizApp()
+    app.draw_map()
+    polygons_before = len(app.canvas.find_all())
+
+    # Zoom in on the Gambia under the pointer
+    gambia_id = app.quiz_manager.country_ids["Gambia"]
+    gambia = app.quiz_manager.country_data["Gambia"]
+    x, y = app.projector.geo_to_canvas(*gambia.representative_point().coords[0])
+    for _ in range(12):
+        app.on_wheel(MockEvent(x, y, delta=120))
+    app.draw_map()
+
+    assert app.viewport.zoom > 10
+    assert 0 < len(app.canvas.find_all()) < polygons_before
+    assert app.country_items[gambia_id]
+    assert not app.country_items[app.quiz_manager.country_ids["South Africa"]]
+
+    # The map point under the pointer stayed put, so the same screen point is the Gambia
+    app.quiz_manager.current_country_index = 0
+    target = app.quiz_manager.get_current_country()
+    app.on_press(MockEvent(x, y))
+    app.on_release(MockEvent(x, y))
+    assert app.status_label.cget("text") in (
+        "Correct! Gambia",
+        f"Incorrect. You clicked Gambia, correct answer: {target}",
+    )
+
+
+def test_africa_quiz_app_drag_pans_without_answering() -> None:
+    """Test that a left-button drag moves the view instead of answering."""
+    import pytest
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from main import AfricaQuizApp
+
+    app = AfricaQuizApp()
+    app.draw_map()
+    app.on_wheel(MockEvent(500, 500, delta=120))
+    app.on_wheel(MockEvent(500, 500, delta=120))
+    origin = (app.viewport.x, app.viewport.y)
+
+    app.on_press(MockEvent(500, 500))
+    app.on_drag(MockEvent(540, 520))
+    app.on_release(MockEvent(540, 520))
+
+    assert app.quiz_manager.current_country_index == 0
+    zoom = app.viewport.zoom
+    assert (app.viewport.x, app.viewport.y) == pytest.approx(
+        (origin[0] - 40 / zoom, origin[1] - 20 / zoom)
+    )
+
+
+def test_africa_quiz_app_resize_rescales_without_reprojecting() -> None:
+    """Test that resizing the window scales the drawn map once the size settles."""
+    import pytest
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from main import AfricaQuizApp
+
+    app = AfricaQuizApp()
+    app.draw_map()
+    gambia_id = app.quiz_manager.country_ids["Gambia"]
+    item = app.country_items[gambia_id][0]
+    coords = app.canvas.coords(item)
+    width, height = app.canvas_width // 2, app.canvas_height // 2
+
+    # A burst of events while dragging the window edge applies only the last size
+    app.on_configure(MockEvent(0, 0, width=width + 40, height=height + 40))
+    app.on_configure(MockEvent(0, 0, width=width, height=height))
+    assert app.viewport.is_identity
+    app.apply_resize()
+
+    fit = app.viewport.fit
+    assert fit == pytest.approx(0.5, abs=0.01)
+    assert app.canvas.coords(item) == pytest.approx([value * fit for value in coords])
+    assert app._redraw_job is None  # Whole map still shown at the same tier
+
+    # Clicks are mapped back through the new fit
+    gambia = app.quiz_manager.country_data["Gambia"]
+    x, y = app.projector.geo_to_canvas(*gambia.representative_point().coords[0])
+    assert app.viewport.screen_to_map(x * fit, y * fit) == pytest.approx((x, y))
+
+
+def test_africa_quiz_app_draws_and_clicks_in_an_equal_area_projection() -> None:
+    """Test that the app sizes, draws and hit-tests the map in the Albers projection."""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from main import AfricaQuizApp
+
+    app = AfricaQuizApp(projection="albers")
+    app.draw_map()
+
+    assert app.projector.projection.name == "albers"
+    assert max(app.canvas_width, app.canvas_height) == 1000
+    assert app.country_items[app.quiz_manager.country_ids["Gambia"]]
+
+    app.quiz_manager.current_country_index = 0
+    target = app.quiz_manager.get_current_country()
+    target_geometry = app.quiz_manager.country_data[target]
+    x, y = app.projector.geo_to_canvas(*target_geometry.representative_point().coords[0])
+    app.on_click(MockEvent(x, y))
+    assert app.status_label.cget("text") == f"Correct! {target}"
+
+
+def test_africa_quiz_app_resize_while_zoomed_draws_uncovered_countries() -> None:
+    """Test that widening the window while zoomed in draws the countries it uncovers."""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from main import AfricaQuizApp
+
+    app = AfricaQuizApp()
+    app.draw_map()
+    for _ in range(6):
+        app.on_wheel(MockEvent(100, app.canvas_height // 2, delta=120))
+    app._redraw()  # The debounced redraw after zooming
+    assert app._redraw_job is None
+    before = app._view_state()
+    drawn_before = sum(1 for items in app.country_items if items)
+
+    # The height limits the fit, so a wider window keeps scale and origin
+    app.on_configure(MockEvent(0, 0, width=app.canvas_width * 2, height=app.canvas_height))
+    app.apply_resize()
+    assert app._view_state() == before
+    assert app._redraw_job is not None
+    app._redraw()
+
+    dataset = app.quiz_manager.dataset
+    visible = app.viewport.visible(dataset.bounds, app.projector).tolist()
+    drawn = [bool(items) for items in app.country_items]
+    assert sum(drawn) > drawn_before
+    assert all(drawn[country_id] for country_id, shown in enumerate(visible) if shown)
@@ -0,0 +1,77 @@
+"""Tests for the process-pool geometry build."""
+
+import json
+
+import pytest
+
+
+def _tricky_features() -> list:
+    square = [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+    bowtie = [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]
+    return [
+        {"properties": {"name": "A"}, "geometry": {"type": "Polygon", "coordinates": square}},
+        "not a feature",
+        {"properties": {}, "geometry": {"type": "Polygon", "coordinates": square}},
+        {"properties": {"name": "Bowtie"}, "geometry": {"type": "Polygon", "coordinates": bowtie}},
+        {"properties": {"name": "Dot"}, "geometry": {"type": "Point", "coordinates": [0, 0]}},
+        {
+            "properties": {"name": "Broken"},
+            "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 1]]]},
+        },
+        {
+            "properties": {"name": "B"},
+            "geometry": {"type": "MultiPolygon", "coordinates": [square]},
+        },
+        {
+            "properties": {"name": "A"},
+            "geometry": {"type": "MultiPolygon", "coordinates": [square]},
+        },
+    ]
+
+
+def test_parallel_build_matches_sequential_skip_rules(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that skipped, invalid and repeated features end up exactly as sequentially."""
+    from africa_quiz.dataset import CountryDataset
+
+    monkeypatch.setattr("os.cpu_count", lambda: 4)  # Use the pool even on a single CPU
+
+    geojson_data = {"type": "FeatureCollection", "features": _tricky_features()}
+    sequential = CountryDataset(geojson_data)
+    parallel = CountryDataset(geojson_data, workers=2)
+
+    assert parallel.names == sequential.names == ["A", "B"]
+    for name, geometry in sequential.country_data.items():
+        assert parallel.country_data[name].equals_exact(geometry, 0)
+
+
+def test_parallel_build_preserves_africa_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the parallel loader reproduces africa.geojson in feature order."""
+    from africa_quiz.dataset import CountryDataset
+
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+    with open("africa.geojson") as f:
+        geojson_data = json.load(f)
+
+    sequential = CountryDataset(geojson_data)
+    parallel = CountryDataset.from_path("africa.geojson", workers=3)
+
+    assert parallel.names == sequential.names
+    for name, geometry in sequential.country_data.items():
+        assert parallel.country_data[name].equals_exact(geometry, 0)
+
+
+def test_parallel_build_caps_workers_at_cpu_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a single CPU builds in-process instead of starting a pool."""
+    from africa_quiz import parallel
+
+    def no_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError("started a process pool on a single CPU")
+
+    monkeypatch.setattr("os.cpu_count", lambda: 1)
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", no_pool)
+
+    names, geometries, report = parallel.build_geometries_parallel(_tricky_features(), 8)
+    assert names == ["A", "B", "A"]
+    assert len(geometries) == 3
+    assert report.skipped
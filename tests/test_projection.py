@@ -107,3 +107,231 @@ def test_coordinate_projector_reverse_conversion() -> None:
     lon, lat = projector.canvas_to_geo(0, 0)  # Should be top-left corner
     assert abs(lon - (-20.0)) < 0.1  # Allow small floating point error
     assert abs(lat - 37.0) < 0.1
+
+
+def test_geo_to_canvas_array_matches_scalar_rounding() -> None:
+    """Test that batch projection returns exactly the scalar integers, including negatives."""
+    import numpy as np
+
+    from africa_quiz.projection import CoordinateProjector
+
+    projector = CoordinateProjector((-20.0, -35.0, 55.0, 37.0), 800, 600)
+
+    # Points outside the bbox produce negative canvas coordinates, where truncation matters
+    rng = np.random.default_rng(0)
+    coords = np.column_stack([rng.uniform(-40, 75, 5000), rng.uniform(-55, 57, 5000)])
+
+    batch = projector.geo_to_canvas_array(coords)
+    scalar = [projector.geo_to_canvas(lon, lat) for lon, lat in coords.tolist()]
+
+    assert batch.tolist() == [list(point) for point in scalar]
+
+
+def test_canvas_to_geo_array_matches_scalar() -> None:
+    """Test that batch inverse projection returns exactly the scalar results."""
+    import numpy as np
+
+    from africa_quiz.projection import CoordinateProjector
+
+    projector = CoordinateProjector((-20.0, -35.0, 55.0, 37.0), 800, 600)
+    points = np.array([[0, 0], [400, 300], [799, 599], [-5, 610]])
+
+    batch = projector.canvas_to_geo_array(points)
+
+    assert batch.tolist() == [list(projector.canvas_to_geo(x, y)) for x, y in points.tolist()]
+
+
+def test_geo_to_canvas_array_matches_scalar_on_africa_vertices() -> None:
+    """Test that batch projection of every Africa vertex equals the per-point loop."""
+    import shapely
+    from shapely.geometry import shape
+
+    from africa_quiz.projection import CoordinateProjector
+
+    with open("africa.geojson") as f:
+        africa_data = json.load(f)
+
+    projector = CoordinateProjector(CoordinateProjector.calculate_bbox(africa_data), 1000, 960)
+    coords = shapely.get_coordinates([shape(f["geometry"]) for f in africa_data["features"]])
+
+    scalar = [projector.geo_to_canvas(lon, lat) for lon, lat in coords.tolist()]
+    batch = projector.geo_to_canvas_array(coords)
+    assert batch.tolist() == [list(point) for point in scalar]
+
+
+def _reference_bbox(geojson_data: dict) -> tuple[float, float, float, float]:
+    # Original per-vertex loop, kept to check the vectorized version against
+    min_lon = min_lat = float("inf")
+    max_lon = max_lat = float("-inf")
+    for feature in geojson_data["features"]:
+        geometry = feature["geometry"]
+        if geometry["type"] == "Polygon":
+            rings = geometry["coordinates"]
+        elif geometry["type"] == "MultiPolygon":
+            rings = [ring for polygon in geometry["coordinates"] for ring in polygon]
+        else:
+            continue
+        for ring in rings:
+            for lon, lat in ring:
+                min_lon = min(min_lon, lon)
+                max_lon = max(max_lon, lon)
+                min_lat = min(min_lat, lat)
+                max_lat = max(max_lat, lat)
+    return (min_lon, min_lat, max_lon, max_lat)
+
+
+def test_calculate_bbox_matches_per_vertex_loop() -> None:
+    """Test that the vectorized bbox equals the per-vertex loop, including edge cases."""
+    from africa_quiz.projection import CoordinateProjector
+
+    with open("africa.geojson") as f:
+        africa_data = json.load(f)
+
+    point_feature = {"geometry": {"type": "Point", "coordinates": [100.0, 100.0]}}
+    cases = [
+        africa_data,
+        {"features": []},
+        {"features": [point_feature]},
+        {"features": [*africa_data["features"][:3], point_feature]},
+    ]
+    for case in cases:
+        assert CoordinateProjector.calculate_bbox(case) == _reference_bbox(case)
+
+
+def test_feature_bounds_per_feature() -> None:
+    """Test that per-feature bounds are returned in feature order, NaN for non-polygons."""
+    import math
+
+    from africa_quiz.projection import CoordinateProjector
+
+    test_data = {
+        "features": [
+            {"geometry": {"type": "Point", "coordinates": [3.0, 4.0]}},
+            {
+                "geometry": {
+                    "type": "MultiPolygon",
+                    "coordinates": [
+                        [[[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 0.0]]],
+                        [[[10.0, -2.0], [15.0, 10.0], [12.0, 15.0], [10.0, -2.0]]],
+                    ],
+                }
+            },
+            {
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[1.0, 1.0], [2.0, 3.0], [1.0, 1.0]]],
+                }
+            },
+        ]
+    }
+
+    bounds = CoordinateProjector.feature_bounds(test_data)
+
+    assert bounds.shape == (3, 4)
+    assert all(math.isnan(value) for value in bounds[0])
+    assert bounds[1].tolist() == [0.0, -2.0, 15.0, 15.0]
+    assert bounds[2].tolist() == [1.0, 1.0, 2.0, 3.0]
+
+
+def test_feature_bounds_ignore_altitudes() -> None:
+    """Test that three-dimensional positions are bounded by longitude and latitude only."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+
+    ring = [[0.0, 0.0, 100.0], [10.0, 0.0, 100.0], [10.0, 5.0, 100.0], [0.0, 5.0, 100.0]]
+    feature = {
+        "type": "Feature",
+        "properties": {"name": "Plateau"},
+        "geometry": {"type": "Polygon", "coordinates": [[*ring, ring[0]]]},
+    }
+    geojson_data = {"type": "FeatureCollection", "features": [feature]}
+
+    assert CoordinateProjector.feature_bounds(geojson_data).tolist() == [[0.0, 0.0, 10.0, 5.0]]
+    assert CoordinateProjector.calculate_bbox(geojson_data) == (0.0, 0.0, 10.0, 5.0)
+    assert CountryDataset.from_features(geojson_data["features"]).bbox == (0.0, 0.0, 10.0, 5.0)
+
+
+def test_projections_round_trip_through_the_canvas() -> None:
+    """Test that every projection's inverse recovers the geographic point."""
+    import numpy as np
+    import pytest
+
+    from africa_quiz.projection import (
+        PROJECTIONS,
+        CoordinateProjector,
+        canvas_size,
+        make_projection,
+    )
+
+    bbox = (-20.0, -35.0, 55.0, 37.0)
+    rng = np.random.default_rng(7)
+    coords = np.column_stack([rng.uniform(-20, 55, 500), rng.uniform(-35, 37, 500)])
+    for name in PROJECTIONS:
+        projection = make_projection(name, bbox)
+        x, y = projection.forward(coords[:, 0], coords[:, 1])
+        lon, lat = projection.inverse(x, y)
+        assert np.column_stack([lon, lat]) == pytest.approx(coords, abs=1e-9)
+
+        # The bounding box fills the canvas, whose aspect follows the projection
+        width, height = canvas_size(bbox, 1000, projection)
+        projector = CoordinateProjector(bbox, width, height, projection)
+        canvas = projector.geo_to_canvas_array(coords)
+        assert canvas.min() >= 0
+        assert canvas[:, 0].max() <= width
+        assert canvas[:, 1].max() <= height
+        assert projector.canvas_to_geo(*projector.geo_to_canvas(10.0, 5.0)) == pytest.approx(
+            (10.0, 5.0), abs=1 / projector.pixels_per_degree * 2
+        )
+
+
+def test_projected_clicks_locate_the_country_under_them() -> None:
+    """Test that hit tests invert each projection exactly enough to find every country."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import (
+        PROJECTIONS,
+        CoordinateProjector,
+        canvas_size,
+        make_projection,
+    )
+    from africa_quiz.store import GeometryStore
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    for name in PROJECTIONS:
+        projection = make_projection(name, dataset.bbox)
+        width, height = canvas_size(dataset.bbox, 1000, projection)
+        projector = CoordinateProjector(dataset.bbox, width, height, projection)
+        store = GeometryStore(dataset, projector, hit_test="raster")
+
+        for country_name, geometry in zip(dataset.names, dataset.geometries):
+            x, y = projector.geo_to_canvas(*geometry.representative_point().coords[0])
+            assert store.locate(x, y) == country_name, (name, country_name)
+
+
+def test_make_projection_rejects_unknown_and_degenerate_projections() -> None:
+    """Test that bad projection names and flat Albers cones raise ValueError."""
+    import pytest
+
+    from africa_quiz.projection import AlbersEqualArea, make_projection
+
+    with pytest.raises(ValueError, match="Unknown projection"):
+        make_projection("robinson", (-20.0, -35.0, 55.0, 37.0))
+    with pytest.raises(ValueError, match="symmetric"):
+        AlbersEqualArea(parallel_1=-30.0, parallel_2=30.0)
+
+
+def test_incomplete_projection_fails_on_construction() -> None:
+    """Test that a projection without an inverse cannot be instantiated."""
+    from dataclasses import dataclass
+
+    import numpy as np
+    import pytest
+
+    from africa_quiz.projection import Projection
+
+    @dataclass(frozen=True)
+    class ForwardOnly(Projection):
+        def forward(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            return (lon, lat)
+
+    with pytest.raises(TypeError, match="inverse"):
+        ForwardOnly()
@@ -174,3 +174,207 @@ def test_quiz_manager_round_completion() -> None:
     quiz_manager.current_country_index = total_countries
 
     assert quiz_manager.is_round_complete()
+
+
+def test_quiz_manager_spatial_index_matches_linear_scan() -> None:
+    """Test that the STRtree hit test returns exactly what the linear scan returns."""
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    bbox = (-20.0, -35.0, 55.0, 37.0)
+    projector = CoordinateProjector(bbox, 800, 600)
+    indexed = QuizManager("africa.geojson", projector)
+    linear = QuizManager("africa.geojson", projector, hit_test="linear")
+
+    # Sample a grid covering land, ocean and border pixels
+    for x in range(0, 800, 7):
+        for y in range(0, 600, 7):
+            _, indexed_country = indexed.handle_click(x, y)
+            _, linear_country = linear.handle_click(x, y)
+            assert indexed_country == linear_country
+
+
+def test_quiz_manager_rejects_unknown_hit_test_engine() -> None:
+    """Test that an unknown hit-test engine name raises a ValueError."""
+    import pytest
+
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    projector = CoordinateProjector((-20.0, -35.0, 55.0, 37.0), 800, 600)
+
+    with pytest.raises(ValueError, match="hit-test engine"):
+        QuizManager("africa.geojson", projector, hit_test="quadtree")
+
+
+def test_quiz_manager_prepares_geometries_by_default() -> None:
+    """Test that country geometries are prepared unless explicitly disabled."""
+    import shapely
+
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    projector = CoordinateProjector((-20.0, -35.0, 55.0, 37.0), 800, 600)
+    prepared = QuizManager("africa.geojson", projector)
+    unprepared = QuizManager("africa.geojson", projector, prepare_geometries=False)
+
+    assert all(shapely.is_prepared(g) for g in prepared.country_data.values())
+    assert not any(shapely.is_prepared(g) for g in unprepared.country_data.values())
+
+    # Both paths must agree on hit results
+    for x in range(0, 800, 23):
+        for y in range(0, 600, 23):
+            assert prepared.handle_click(x, y)[1] == unprepared.handle_click(x, y)[1]
+
+
+def test_unprepared_manager_on_a_shared_prepared_dataset() -> None:
+    """Test that prepare_geometries=False holds even after another manager prepared."""
+    import shapely
+
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 800, 600)
+    prepared = QuizManager(dataset, projector)
+    unprepared = QuizManager(dataset, projector, prepare_geometries=False)
+
+    assert shapely.is_prepared(prepared.store.geometries).all()
+    assert not shapely.is_prepared(unprepared.store.geometries).any()
+    assert not any(shapely.is_prepared(g) for g in unprepared.country_data.values())
+    assert list(unprepared.country_data.values()) == dataset.geometries
+    for x in range(0, 800, 37):
+        for y in range(0, 600, 37):
+            assert prepared.locate_id(x, y) == unprepared.locate_id(x, y)
+
+
+def test_unprepared_manager_stays_unprepared_when_a_later_manager_prepares() -> None:
+    """Test that building a prepared manager afterwards leaves an unprepared one alone."""
+    import shapely
+
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 800, 600)
+    unprepared = QuizManager(dataset, projector, prepare_geometries=False)
+    prepared = QuizManager(dataset, projector)
+
+    assert shapely.is_prepared(prepared.store.geometries).all()
+    assert not shapely.is_prepared(unprepared.store.geometries).any()
+    assert not unprepared.prepare_geometries
+
+
+def test_quiz_manager_raster_hit_map_matches_exact_test() -> None:
+    """Test that the raster engine agrees with exact testing, including border pixels."""
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    bbox = (-20.0, -35.0, 55.0, 37.0)
+    projector = CoordinateProjector(bbox, 800, 600)
+    raster = QuizManager("africa.geojson", projector, hit_test="raster")
+    indexed = QuizManager("africa.geojson", projector)
+
+    # Off-canvas clicks are resolved exactly as well
+    for x in [*range(-3, 800, 3), 800, 805]:
+        for y in range(-3, 603, 3):
+            assert raster.handle_click(x, y)[1] == indexed.handle_click(x, y)[1]
+
+
+def test_raster_hit_map_reports_memory_and_ambiguous_pixels() -> None:
+    """Test that the raster hit map is compact and flags border pixels as ambiguous."""
+    from africa_quiz.hitmap import OCEAN
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    projector = CoordinateProjector((-20.0, -35.0, 55.0, 37.0), 800, 600)
+    quiz_manager = QuizManager("africa.geojson", projector, hit_test="raster")
+    hit_map = quiz_manager.hit_map
+
+    # 49 countries fit in one byte per pixel
+    assert hit_map.labels.shape == (600, 800)
+    assert hit_map.nbytes == 800 * 600
+    assert 0 < hit_map.ambiguous_fraction < 0.5
+
+    # Top-left corner is Atlantic ocean; off-canvas pixels are never decided by the raster
+    assert hit_map.lookup(0, 0) == OCEAN
+    assert hit_map.lookup(-1, 0) is None
+    assert hit_map.lookup(800, 0) is None
+
+
+def test_handle_clicks_matches_handle_click() -> None:
+    """Test that batch hit testing agrees with scalar clicks for every engine."""
+    import numpy as np
+
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.hitmap import OCEAN
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import HIT_TEST_ENGINES, QuizManager
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 800, 840)
+
+    # Whole pixels, fractional pixels and points off the canvas
+    rng = np.random.default_rng(0)
+    xs = np.concatenate([rng.integers(-20, 820, 3000), rng.uniform(0, 800, 500)])
+    ys = np.concatenate([rng.integers(-20, 860, 3000), rng.uniform(0, 840, 500)])
+
+    for engine in HIT_TEST_ENGINES:
+        quiz_manager = QuizManager(dataset, projector, hit_test=engine)
+        indices = quiz_manager.handle_clicks(xs, ys)
+
+        assert indices.shape == xs.shape
+        for x, y, index in zip(xs.tolist(), ys.tolist(), indices.tolist()):
+            _, country_name = quiz_manager.handle_click(x, y)
+            expected = (
+                OCEAN if country_name is None else quiz_manager.country_names.index(country_name)
+            )
+            assert index == expected, (engine, x, y)
+        assert (indices != OCEAN).any()
+
+
+def test_enclave_clicks_resolve_to_the_enclave() -> None:
+    """Test that clicks inside Lesotho report Lesotho, not the South Africa around it."""
+    import numpy as np
+
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import HIT_TEST_ENGINES, QuizManager
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 800, 840)
+    lesotho = dataset.country_data["Lesotho"]
+    x, y = projector.geo_to_canvas(*lesotho.representative_point().coords[0])
+
+    for engine in HIT_TEST_ENGINES:
+        quiz_manager = QuizManager(dataset, projector, hit_test=engine)
+        assert quiz_manager.locate(x, y) == "Lesotho", engine
+        index = quiz_manager.handle_clicks(np.array([x]), np.array([y]))[0]
+        assert quiz_manager.country_names[index] == "Lesotho", engine
+
+
+def test_overlapping_countries_resolve_to_the_innermost() -> None:
+    """Test that every engine picks the smaller country where two overlap."""
+    import numpy as np
+    from shapely.geometry import box
+
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import HIT_TEST_ENGINES, QuizManager
+
+    # The enclave is loaded last and its host has no hole for it
+    dataset = CountryDataset.from_geometries(
+        {"Host": box(0, 0, 10, 10), "Enclave": box(4, 4, 6, 6)}, (0.0, 0.0, 10.0, 10.0)
+    )
+    projector = CoordinateProjector(dataset.bbox, 100, 100)
+    xs = np.array([50, 10])
+    ys = np.array([50, 10])
+
+    for engine in HIT_TEST_ENGINES:
+        quiz_manager = QuizManager(dataset, projector, hit_test=engine)
+        assert quiz_manager.locate(50, 50) == "Enclave", engine
+        assert quiz_manager.locate(10, 10) == "Host", engine
+        names = [quiz_manager.country_names[i] for i in quiz_manager.handle_clicks(xs, ys)]
+        assert names == ["Enclave", "Host"], engine
@@ -0,0 +1,55 @@
+"""Tests for lazily generated, seeded round orders."""
+
+
+def test_round_order_is_a_permutation() -> None:
+    """Test that every round visits each country exactly once, for awkward sizes too."""
+    from africa_quiz.rounds import RoundSchedule
+
+    for size in (1, 2, 3, 7, 49, 64, 65, 1000):
+        names = tuple(f"Country {i}" for i in range(size))
+        schedule = RoundSchedule(names, seed=11)
+        for number in range(3):
+            order = schedule.round(number)
+            assert len(order) == size
+            assert sorted(order) == sorted(names)
+            assert order[-1] == order[size - 1]
+
+
+def test_rounds_are_reproducible_and_random_access() -> None:
+    """Test that a seed fixes every round and round k needs no earlier rounds."""
+    from africa_quiz.rounds import RoundSchedule
+
+    names = tuple(f"Country {i}" for i in range(49))
+    first = RoundSchedule(names, seed=2024)
+    second = RoundSchedule(names, seed=2024)
+
+    assert list(first.round(1_000_000)) == list(second.round(1_000_000))
+    assert list(first.round(0)) != list(first.round(1))
+    assert list(first.round(0)) != list(RoundSchedule(names, seed=2025).round(0))
+    assert first.round(5)[10:20] == list(first.round(5))[10:20]
+
+
+def test_seeded_quiz_managers_replay_the_same_rounds() -> None:
+    """Test that a seed reproduces a player's rounds without reordering shared data."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 800, 840)
+    names = dataset.names
+
+    orders = []
+    for _ in range(2):
+        quiz_manager = QuizManager(dataset, projector, seed=99)
+        rounds = [list(quiz_manager.countries)]
+        quiz_manager.start_new_round()
+        rounds.append(list(quiz_manager.countries))
+        orders.append(rounds)
+
+    assert orders[0] == orders[1]
+    assert orders[0][0] != orders[0][1]
+    assert quiz_manager.seed == 99
+    assert quiz_manager.round_number == 1
+    assert dataset.names == names
+    assert quiz_manager.countries.names is quiz_manager.store.country_names
@@ -0,0 +1,59 @@
+"""Tests for spaced-repetition prompt scheduling."""
+
+
+def test_missed_countries_come_back_sooner() -> None:
+    """Test that a country the player keeps missing is asked far more than known ones."""
+    from collections import Counter
+
+    from africa_quiz.scheduling import SpacedRepetitionScheduler
+
+    scheduler = SpacedRepetitionScheduler(range(100))
+    asked = Counter()
+    for _ in range(1000):
+        asked[scheduler.current] += 1
+        scheduler.record(scheduler.current != 42)
+
+    assert scheduler.step == 1000
+    assert set(asked) == set(range(100))  # Everything gets introduced
+    assert asked[42] > 5 * max(count for index, count in asked.items() if index != 42)
+    assert scheduler.boxes[42] == 0
+    assert scheduler.attempts[42] == asked[42]
+    assert scheduler.correct[42] == 0
+
+
+def test_scheduler_handles_a_single_country() -> None:
+    """Test that the only country is asked again and again."""
+    from africa_quiz.scheduling import SpacedRepetitionScheduler
+
+    scheduler = SpacedRepetitionScheduler([0])
+    assert [scheduler.record(True) for _ in range(3)] == [0, 0, 0]
+    assert scheduler.boxes[0] == 3
+
+
+def test_spaced_quiz_session_plays_rounds() -> None:
+    """Test that spaced scheduling plugs into prompts, round completion and sessions."""
+    import pytest
+
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+    from africa_quiz.session import QuizSession
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 800, 840)
+    quiz_manager = QuizManager(dataset, projector, seed=1, scheduler="spaced")
+    session = QuizSession(quiz_manager)
+    country_count = len(dataset.names)
+
+    first_prompt = quiz_manager.get_current_country()
+    outcomes = [session.answer(None) for _ in range(country_count)]
+
+    # Every answer was wrong, so the first country is back long before the round ends
+    assert [outcome.target for outcome in outcomes].count(first_prompt) > 1
+    assert outcomes[-1].round_complete
+    assert not any(outcome.round_complete for outcome in outcomes[:-1])
+    assert quiz_manager.current_country_index == 0
+    assert quiz_manager.spaced.step == country_count
+
+    with pytest.raises(ValueError, match="Unknown scheduler"):
+        QuizManager(dataset, projector, scheduler="random")
@@ -0,0 +1,184 @@
+"""Tests for the multi-player quiz server."""
+
+import json
+
+
+def test_sessions_share_one_geometry_store() -> None:
+    """Test that every player gets their own progress on top of the same store."""
+    from africa_quiz.server import QuizServer
+
+    server = QuizServer.from_path("africa.geojson", use_cache=False)
+    first = server.create_session()
+    second = server.create_session()
+
+    first_manager = server.sessions[first].quiz_manager
+    second_manager = server.sessions[second].quiz_manager
+    assert first_manager.store is second_manager.store is server.store
+    assert first_manager.countries is not second_manager.countries
+
+    server.sessions[first].answer(None)
+    assert first_manager.current_country_index == 1
+    assert second_manager.current_country_index == 0
+    assert server.sessions[second].colors == {}
+
+
+def test_dispatch_plays_a_session() -> None:
+    """Test the JSON API from session creation through clicks to deletion."""
+    from africa_quiz.server import QuizServer
+
+    server = QuizServer.from_path("africa.geojson", use_cache=False)
+    status, info = server.dispatch("GET", "/")
+    assert status == 200
+    assert info["countries"] == len(server.store.country_names)
+    assert info["projection"] == "equirectangular"
+
+    status, created = server.dispatch("POST", "/sessions")
+    assert status == 201
+    session_id = created["session"]
+
+    # Click the prompted country at a point inside it
+    target = created["prompt"]
+    point = server.store.country_data[target].representative_point()
+    x, y = server.store.projector.geo_to_canvas(point.x, point.y)
+    body = json.dumps({"clicks": [[x, y], [-5, -5]]}).encode()
+    status, result = server.dispatch("POST", f"/sessions/{session_id}/clicks", body)
+    assert status == 200
+    assert [outcome["correct"] for outcome in result["outcomes"]] == [True, False]
+    assert result["outcomes"][0]["clicked"] == target
+
+    status, state = server.dispatch("GET", f"/sessions/{session_id}")
+    assert (status, state["index"], state["correct"], state["ocean"]) == (200, 2, 1, 1)
+    assert state["colors"][target] == "green"
+
+    assert server.dispatch("POST", f"/sessions/{session_id}/clicks", b"{}")[0] == 400
+    assert server.dispatch("DELETE", f"/sessions/{session_id}")[0] == 200
+    assert server.dispatch("GET", f"/sessions/{session_id}")[0] == 404
+    assert server.dispatch("GET", "/nowhere")[0] == 404
+
+
+def test_server_answers_over_http() -> None:
+    """Test a keep-alive HTTP exchange against a running server."""
+    import asyncio
+
+    from africa_quiz.server import QuizServer
+
+    async def exchange() -> list[tuple[bytes, dict]]:
+        server = QuizServer.from_path("africa.geojson", use_cache=False)
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        responses = []
+        for method, path, body in (
+            ("POST", "/sessions", b""),
+            ("GET", "/", b""),
+        ):
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            payload = json.loads(await reader.readexactly(int(headers["content-length"])))
+            responses.append((status_line, payload))
+
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return responses
+
+    (created_status, created), (info_status, info) = asyncio.run(exchange())
+    assert created_status.startswith(b"HTTP/1.1 201")
+    assert "session" in created
+    assert info_status.startswith(b"HTTP/1.1 200")
+    assert info["sessions"] == 1
+
+
+def test_seeded_sessions_get_the_same_prompts() -> None:
+    """Test that sessions created with the same seed are asked the same countries."""
+    from africa_quiz.server import QuizServer
+
+    server = QuizServer.from_path("africa.geojson", use_cache=False)
+    states = [server.dispatch("POST", "/sessions", b'{"seed": 5}')[1] for _ in range(2)]
+
+    assert states[0]["prompt"] == states[1]["prompt"]
+    assert states[0]["seed"] == 5
+    assert server.dispatch("POST", "/sessions", b'{"seed": "five"}')[0] == 400
+
+
+def test_sessions_can_use_spaced_repetition() -> None:
+    """Test that the scheduler is chosen per session and unknown ones are rejected."""
+    from africa_quiz.server import QuizServer
+
+    server = QuizServer.from_path("africa.geojson", use_cache=False)
+    status, state = server.dispatch("POST", "/sessions", b'{"scheduler": "spaced"}')
+
+    assert status == 201
+    assert state["scheduler"] == "spaced"
+    assert server.sessions[state["session"]].quiz_manager.spaced is not None
+    assert server.dispatch("POST", "/sessions", b'{"scheduler": "random"}')[0] == 400
+
+
+def test_non_finite_clicks_are_rejected() -> None:
+    """Test that NaN and infinite click coordinates get a 400, even on a raster store."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.server import QuizServer
+    from africa_quiz.store import GeometryStore
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    server = QuizServer(
+        GeometryStore(dataset, CoordinateProjector(dataset.bbox, 952, 1000), "raster")
+    )
+    session_id = server.create_session()
+
+    for body in (b'{"clicks": [[NaN, 10]]}', b'{"clicks": [[10, 20], [Infinity, 5]]}'):
+        status, payload = server.dispatch("POST", f"/sessions/{session_id}/clicks", body)
+        assert status == 400
+        assert "finite" in payload["error"]
+    assert server.sessions[session_id].quiz_manager.current_country_index == 0
+
+
+def test_malformed_content_length_gets_a_response() -> None:
+    """Test that a non-numeric Content-Length is answered with 400 instead of dropped."""
+    import asyncio
+
+    from africa_quiz.server import QuizServer
+
+    async def exchange() -> bytes:
+        server = QuizServer.from_path("africa.geojson", use_cache=False)
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"POST /sessions HTTP/1.1\r\nContent-Length: ten\r\n\r\n")
+        await writer.drain()
+        status_line = await reader.readline()
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return status_line
+
+    assert asyncio.run(exchange()).startswith(b"HTTP/1.1 400")
+
+
+def test_idle_and_excess_sessions_are_dropped() -> None:
+    """Test that sessions expire after the idle TTL and are capped least recently used first."""
+    from africa_quiz.server import QuizServer
+
+    store = QuizServer.from_path("africa.geojson", use_cache=False).store
+
+    expiring = QuizServer(store, session_ttl=0.0)
+    first = expiring.create_session()
+    second = expiring.create_session()
+    assert list(expiring.sessions) == [second]
+    assert expiring.dispatch("GET", f"/sessions/{first}")[0] == 404
+
+    capped = QuizServer(store, max_sessions=2)
+    oldest, newer = capped.create_session(), capped.create_session()
+    assert capped.dispatch("GET", f"/sessions/{oldest}")[0] == 200  # Now most recently used
+    newest = capped.create_session()
+    assert set(capped.sessions) == {oldest, newest}
+    assert capped.dispatch("DELETE", f"/sessions/{newer}")[0] == 404
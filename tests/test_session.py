@@ -0,0 +1,88 @@
+"""Tests for the headless quiz session."""
+
+
+def _session(hit_test: str = "strtree") -> object:
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.quiz import QuizManager
+    from africa_quiz.session import QuizSession
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 1000, 1049)
+    return QuizSession(QuizManager(dataset, projector, hit_test=hit_test))
+
+
+def test_session_evaluates_answers_without_tk() -> None:
+    """Test that answers are scored, colored and advance the prompt."""
+    session = _session()
+    quiz_manager = session.quiz_manager
+    first = session.current_country
+
+    outcome = session.answer(first)
+    assert outcome.correct
+    assert (outcome.target, outcome.colored, outcome.color) == (first, first, "green")
+    assert session.colors == {first: "green"}
+    assert quiz_manager.current_country_index == 1
+
+    second = session.current_country
+    outcome = session.answer(None)
+    assert not outcome.correct
+    assert outcome.clicked is None
+    assert session.colors[second] == "red"
+    assert (session.correct_count, session.incorrect_count, session.ocean_count) == (1, 0, 1)
+
+
+def test_session_starts_a_new_round_after_the_last_prompt() -> None:
+    """Test that finishing a round clears colors and reports what was cleared."""
+    session = _session()
+    country_count = len(session.quiz_manager.countries)
+
+    outcomes = session.answer_batch([None] * country_count)
+
+    assert not any(outcome.round_complete for outcome in outcomes[:-1])
+    assert outcomes[-1].round_complete
+    assert set(outcomes[-1].cleared) == set(session.quiz_manager.countries)
+    assert session.colors == {}
+    assert session.rounds_completed == 1
+    assert session.quiz_manager.current_country_index == 0
+
+
+def test_click_batch_matches_single_clicks() -> None:
+    """Test that batched clicks produce the same outcomes as clicking one at a time."""
+    import random
+
+    rng = random.Random(7)
+    clicks = [(rng.randrange(1000), rng.randrange(1049)) for _ in range(200)]
+
+    random.seed(3)
+    single = _session()
+    expected = [single.click(x, y) for x, y in clicks]
+
+    random.seed(3)
+    batched = _session()
+    assert batched.click_batch(clicks) == expected
+    assert batched.colors == single.colors
+
+
+def test_session_state_is_one_byte_per_country() -> None:
+    """Test that feedback lives in a byte array indexed by country ID."""
+    session = _session()
+    quiz_manager = session.quiz_manager
+    names = quiz_manager.country_names
+    first_id = quiz_manager.current_country_id
+
+    outcome = session.answer_id(first_id)
+    assert outcome.target_id == first_id
+    assert outcome.target == names[first_id]
+    assert len(session.color_codes) == len(names)
+    assert session.color_codes.count(0) == len(names) - 1
+
+    # The by-name view is a read-only mapping of colored countries only
+    assert dict(session.colors) == {names[first_id]: "green"}
+    assert names[first_id] in session.colors
+    assert session.colors.get(names[quiz_manager.current_country_id]) is None
+
+    outcomes = session.answer_batch([None] * (len(names) - 1))
+    assert set(outcomes[-1].cleared_ids) == set(range(len(names)))
+    assert [names[i] for i in outcomes[-1].cleared_ids] == list(outcomes[-1].cleared)
+    assert not any(session.color_codes)
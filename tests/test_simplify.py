@@ -0,0 +1,142 @@
+"""Tests for simplified rendering tiers."""
+
+
+def _africa_projector_and_geometries() -> tuple:
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    return CoordinateProjector(dataset.bbox, 1000, 1049), dataset.geometries
+
+
+def test_simplification_tiers_tighten_with_zoom() -> None:
+    """Test that each zoom level gets a smaller tolerance and at least as many vertices."""
+    import shapely
+
+    from africa_quiz.simplify import (
+        DEFAULT_ZOOM_LEVELS,
+        build_simplification_tiers,
+        exterior_rings,
+    )
+
+    projector, geometries = _africa_projector_and_geometries()
+    tiers = build_simplification_tiers(geometries, projector)
+
+    assert [tier.zoom for tier in tiers] == list(DEFAULT_ZOOM_LEVELS)
+    tolerances = [tier.tolerance for tier in tiers]
+    assert tolerances == sorted(tolerances, reverse=True)
+    vertex_counts = [tier.vertex_count for tier in tiers]
+    assert vertex_counts == sorted(vertex_counts)
+
+    raw_rings, _ = exterior_rings(geometries)
+    assert vertex_counts[0] < shapely.get_num_coordinates(raw_rings).sum()
+
+
+def test_simplified_outlines_stay_within_half_a_pixel() -> None:
+    """Test that simplified geometries stay valid and within tolerance of the originals."""
+    from africa_quiz.simplify import build_simplification_tiers
+
+    projector, geometries = _africa_projector_and_geometries()
+    base = build_simplification_tiers(geometries, projector, zoom_levels=(1.0,))[0]
+
+    assert len(base.geometries) == len(geometries)
+    for original, simplified in zip(geometries, base.geometries):
+        assert simplified.is_valid
+        assert original.hausdorff_distance(simplified) <= base.tolerance + 1e-12
+
+
+def test_project_rings_collapses_repeated_pixels() -> None:
+    """Test that consecutive vertices on the same pixel are emitted once."""
+    from shapely.geometry import LinearRing
+
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.simplify import project_rings
+
+    projector = CoordinateProjector((0.0, 0.0, 10.0, 10.0), 10, 10)
+    ring = LinearRing([(0.1, 0.1), (0.2, 0.2), (5.0, 0.1), (5.5, 0.3), (5.0, 5.0)])
+    other = LinearRing([(9.1, 9.1), (9.2, 9.3), (9.9, 9.9), (1.0, 9.5)])
+
+    first, second = project_rings([ring, other], projector)
+
+    assert first.tolist() == [[0, 9], [5, 9], [5, 5], [0, 9]]
+    # Duplicates are only collapsed within a ring, never across ring boundaries
+    assert second.tolist() == [[9, 0], [1, 0], [9, 0]]
+
+
+def test_canvas_rings_are_packed_into_one_buffer() -> None:
+    """Test that every country's rings are int32 slices of one shared coordinate buffer."""
+    import numpy as np
+
+    from africa_quiz.simplify import build_simplification_tiers, exterior_rings, project_rings
+
+    projector, geometries = _africa_projector_and_geometries()
+    (tier,) = build_simplification_tiers(geometries, projector, zoom_levels=(1.0,))
+    packed = tier.canvas_rings(projector)
+
+    rings, rings_per_geometry = exterior_rings(tier.geometries)
+    expected = iter(project_rings(rings, projector))
+    assert len(packed) == len(geometries)
+    for country_rings, ring_count in zip(packed, rings_per_geometry):
+        assert len(country_rings) == ring_count
+        for ring in country_rings:
+            assert ring.format == "i"
+            assert ring.obj is packed.coords
+            assert ring.tolist() == next(expected).ravel().tolist()
+
+    assert packed.coords.dtype == np.int32
+    assert packed.vertex_count * 2 == len(packed.coords) == packed.ring_offsets[-1]
+    assert packed.nbytes < packed.vertex_count * 16
+    assert packed[-1] == packed[len(packed) - 1]
+
+
+def test_tier_for_zoom_picks_the_coarsest_accurate_tier() -> None:
+    """Test that each zoom uses the first tier prepared for at least that scale."""
+    from africa_quiz.simplify import build_simplification_tiers, tier_for_zoom
+
+    projector, geometries = _africa_projector_and_geometries()
+    tiers = build_simplification_tiers(geometries[:3], projector, zoom_levels=(1.0, 2.0, 4.0))
+
+    assert [tier_for_zoom(tiers, zoom) for zoom in (1.0, 1.5, 2.0, 3.0, 4.0, 40.0)] == [
+        0,
+        1,
+        1,
+        2,
+        2,
+        2,
+    ]
+
+
+def test_tiers_project_vertices_once_per_projection() -> None:
+    """Test that redrawing a tier reuses its projected vertices at any canvas size."""
+    import numpy as np
+
+    from africa_quiz.projection import CoordinateProjector, make_projection
+    from africa_quiz.simplify import (
+        PROJECTION_CACHE_SIZE,
+        build_simplification_tiers,
+        exterior_rings,
+        project_rings,
+    )
+
+    base, geometries = _africa_projector_and_geometries()
+    albers = make_projection("albers", base.bbox)
+    projector = CoordinateProjector(base.bbox, 1000, 1049, albers)
+    (tier,) = build_simplification_tiers(geometries, projector, zoom_levels=(1.0,))
+
+    projected = tier.projected_vertices(albers)
+    zoomed = tier.canvas_rings(projector.scaled(4.0))
+    assert tier.projected_vertices(albers) is projected
+    assert tier.projected_vertices(base.projection) is not projected
+
+    # Same pixels as projecting every vertex from scratch
+    rings, _ = exterior_rings(tier.geometries)
+    expected = project_rings(rings, projector.scaled(4.0))
+    assert np.array_equal(zoomed.coords, np.concatenate(expected).ravel())
+
+    # Only the most recently used projections stay cached, and the cache can be released
+    assert tier.projected_nbytes == 2 * projected.nbytes
+    tier.projected_vertices(make_projection("mercator", base.bbox))
+    assert tier.projected_vertices(albers) is not projected
+    assert tier.projected_nbytes == PROJECTION_CACHE_SIZE * projected.nbytes
+    tier.clear_projected()
+    assert tier.projected_nbytes == 0
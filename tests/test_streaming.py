@@ -0,0 +1,83 @@
+"""Tests for incremental GeoJSON feature reading."""
+
+import json
+from pathlib import Path
+
+
+def test_iter_geojson_features_matches_full_parse() -> None:
+    """Test that streamed features equal json.load output, even with tiny read chunks."""
+    from africa_quiz.streaming import iter_geojson_features
+
+    with open("africa.geojson") as f:
+        expected = json.load(f)["features"]
+
+    for chunk_size in (1, 13, 1 << 16):
+        assert list(iter_geojson_features("africa.geojson", chunk_size=chunk_size)) == expected
+
+
+def test_iter_geojson_features_skips_other_top_level_members(tmp_path: Path) -> None:
+    """Test that members before and after the features array are skipped."""
+    from africa_quiz.streaming import iter_geojson_features
+
+    document = {
+        "type": "FeatureCollection",
+        "bbox": [0, 0, 1, 1],
+        "crs": {"type": "name", "properties": {"name": "EPSG:4326"}},
+        "features": [{"id": 1}, {"id": 2}],
+        "version": 12345,
+    }
+    path = tmp_path / "collection.geojson"
+    path.write_text(json.dumps(document, indent=2))
+
+    assert list(iter_geojson_features(path, chunk_size=5)) == [{"id": 1}, {"id": 2}]
+
+    path.write_text('{"features": []}')
+    assert list(iter_geojson_features(path)) == []
+
+
+def test_iter_geojson_features_rejects_invalid_documents(tmp_path: Path) -> None:
+    """Test that structural problems raise the same errors as a full parse."""
+    import pytest
+
+    from africa_quiz.streaming import iter_geojson_features
+
+    with pytest.raises(FileNotFoundError, match="GeoJSON file not found"):
+        list(iter_geojson_features(tmp_path / "missing.geojson"))
+
+    cases = {
+        '{"type": "FeatureCollection"}': "missing 'features' key",
+        "[1, 2]": "missing 'features' key",
+        '{"features": {"a": 1}}': "'features' must be a list",
+        '{"features": [{"id": 1}, {"id": ': "Invalid GeoJSON format",
+    }
+    for text, message in cases.items():
+        path = tmp_path / "broken.geojson"
+        path.write_text(text)
+        with pytest.raises(ValueError, match=message):
+            list(iter_geojson_features(path, chunk_size=4))
+
+
+def test_streamed_dataset_matches_full_load() -> None:
+    """Test that a streamed dataset has the same countries and bbox as a full load."""
+    from africa_quiz.dataset import CountryDataset
+
+    full = CountryDataset.from_path("africa.geojson")
+    streamed = CountryDataset.from_path("africa.geojson", stream=True)
+
+    assert streamed._geojson_data is None  # Raw document is never held in memory
+    assert streamed.names == full.names
+    assert streamed.bbox == full.bbox
+    for full_geometry, streamed_geometry in zip(full.geometries, streamed.geometries):
+        assert streamed_geometry.equals_exact(full_geometry, 0)
+
+
+def test_read_document_type_stops_at_features(tmp_path: Path) -> None:
+    """Test that the document type is read from the header without decoding features."""
+    from africa_quiz.streaming import read_document_type
+
+    assert read_document_type("africa.geojson") == "FeatureCollection"
+
+    # Features first: the (broken) feature list is never decoded
+    path = tmp_path / "features_first.geojson"
+    path.write_text('{"features": [{"broken": }], "type": "FeatureCollection"}')
+    assert read_document_type(path) is None
@@ -0,0 +1,160 @@
+"""Tests for the shared-border arc store."""
+
+import json
+from itertools import pairwise
+from pathlib import Path
+
+
+def _two_squares() -> dict:
+    # Two unit squares sharing the edge x = 1
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"name": "West"},
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
+                },
+            },
+            {
+                "type": "Feature",
+                "properties": {"name": "East"},
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[1, 0], [2, 0], [2, 1], [1, 1], [1, 0]]],
+                },
+            },
+        ],
+    }
+
+
+def test_shared_border_is_stored_once() -> None:
+    """Test that a border shared by two countries becomes one arc used in both directions."""
+    from africa_quiz.topology import Topology
+
+    topology = Topology.from_geojson(_two_squares())
+
+    # The shared edge plus one outer arc per country
+    assert topology.arc_count == 3
+    west, east = (topology_object.polygons[0][0] for topology_object in topology.objects)
+    shared = set(west) & {~ref for ref in east}
+    assert len(shared) == 1
+
+
+def test_topology_round_trips_africa() -> None:
+    """Test that decoding the arcs reproduces every country and shrinks the vertex count."""
+    from shapely.geometry import shape
+
+    from africa_quiz.topology import Topology
+
+    with open("africa.geojson") as f:
+        geojson_data = json.load(f)
+    topology = Topology.from_geojson(geojson_data)
+
+    raw_vertices = sum(
+        len(ring)
+        for feature in geojson_data["features"]
+        for polygon in (
+            [feature["geometry"]["coordinates"]]
+            if feature["geometry"]["type"] == "Polygon"
+            else feature["geometry"]["coordinates"]
+        )
+        for ring in polygon
+    )
+    assert topology.vertex_count < raw_vertices
+
+    for original, decoded in zip(geojson_data["features"], topology.to_features()):
+        assert decoded["properties"] == original["properties"]
+        assert shape(decoded["geometry"]).equals(shape(original["geometry"]))
+
+
+def test_topojson_input_matches_geojson(tmp_path: Path) -> None:
+    """Test that TopoJSON files load to the same countries, quantized or not."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.topology import Topology
+
+    topojson_data = Topology.from_geojson(_two_squares()).to_topojson()
+    assert CoordinateProjector.calculate_bbox(topojson_data) == (0.0, 0.0, 2.0, 1.0)
+
+    # Quantize onto a 0.5 grid with delta-encoded arcs
+    quantized = dict(topojson_data, transform={"scale": [0.5, 0.5], "translate": [0, 0]})
+    quantized["arcs"] = [
+        [[int(x / 0.5), int(y / 0.5)] for x, y in arc] for arc in topojson_data["arcs"]
+    ]
+    quantized["arcs"] = [
+        [arc[0]] + [[b[0] - a[0], b[1] - a[1]] for a, b in pairwise(arc)]
+        for arc in quantized["arcs"]
+    ]
+
+    expected = CountryDataset(_two_squares())
+    for data in (topojson_data, quantized):
+        path = tmp_path / "countries.topojson"
+        path.write_text(json.dumps(data))
+        dataset = CountryDataset.from_path(path)
+
+        assert dataset.topology is not None
+        assert dataset.names == expected.names
+        assert dataset.bbox == expected.bbox
+        for name, geometry in expected.country_data.items():
+            assert dataset.country_data[name].equals(geometry)
+
+
+def test_streamed_topojson_input_loads_with_its_topology(tmp_path: Path) -> None:
+    """Test that stream=True falls back to a whole-document load for TopoJSON files."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.streaming import read_document_type
+    from africa_quiz.topology import Topology
+
+    path = tmp_path / "countries.topojson"
+    path.write_text(json.dumps(Topology.from_geojson(_two_squares()).to_topojson()))
+    assert read_document_type(path) == "Topology"
+
+    dataset = CountryDataset.from_path(path, stream=True)
+    expected = CountryDataset(_two_squares())
+    assert dataset.topology is not None
+    assert dataset.names == expected.names
+    assert dataset.bbox == expected.bbox
+
+
+def test_topology_canvas_rings_match_per_country_projection() -> None:
+    """Test that stitching projected arcs draws the same outlines as projecting each ring."""
+    from shapely.geometry import Polygon
+
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.simplify import build_simplification_tiers
+
+    plain = CountryDataset.from_path("africa.geojson")
+    dataset = CountryDataset.from_path("africa.geojson", topology=True)
+    assert dataset.names == plain.names
+    assert dataset.topology is not None
+    assert len(dataset.topology.objects) == len(dataset.names)
+
+    projector = CoordinateProjector(dataset.bbox, 1000, 1049)
+
+    # A huge zoom makes the tolerance negligible, so both paths draw the raw outlines;
+    # stitched rings start at a junction, so compare them as shapes
+    (tier,) = build_simplification_tiers(
+        dataset.geometries, projector, zoom_levels=(1e9,), topology=dataset.topology
+    )
+    (expected,) = build_simplification_tiers(plain.geometries, projector, zoom_levels=(1e9,))
+    for rings, expected_rings in zip(
+        tier.canvas_rings(projector), expected.canvas_rings(projector)
+    ):
+        assert len(rings) == len(expected_rings)
+        for ring, expected_ring in zip(rings, expected_rings):
+            assert Polygon(_pairs(ring)).equals(Polygon(_pairs(expected_ring)))
+
+    # Shared borders are simplified and counted once
+    (tier,) = build_simplification_tiers(
+        dataset.geometries, projector, zoom_levels=(1.0,), topology=dataset.topology
+    )
+    (expected,) = build_simplification_tiers(plain.geometries, projector, zoom_levels=(1.0,))
+    assert tier.vertex_count < expected.vertex_count
+
+
+def _pairs(flat: list[int]) -> list[tuple[int, int]]:
+    return list(zip(flat[::2], flat[1::2]))
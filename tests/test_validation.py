@@ -0,0 +1,110 @@
+"""Tests for bulk geometry validation and load reports."""
+
+import json
+from pathlib import Path
+
+SQUARE = [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+BOWTIE = [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]
+
+
+def _document() -> dict:
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"properties": {"name": "A"}, "geometry": {"type": "Polygon", "coordinates": SQUARE}},
+            "not a feature",
+            {"properties": {}, "geometry": {"type": "Polygon", "coordinates": SQUARE}},
+            {
+                "properties": {"name": "Bowtie"},
+                "geometry": {"type": "Polygon", "coordinates": BOWTIE},
+            },
+            {"properties": {"name": "Dot"}, "geometry": {"type": "Point", "coordinates": [0, 0]}},
+            {
+                "properties": {"name": "Line"},
+                "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 1]]]},
+            },
+        ],
+    }
+
+
+def test_load_report_explains_every_skipped_feature() -> None:
+    """Test that each skipped feature is reported with its index, name and reason."""
+    from africa_quiz.dataset import CountryDataset
+
+    dataset = CountryDataset(_document())
+    report = dataset.load_report
+
+    assert dataset.names == ["A"]
+    assert report.accepted == 1
+    assert report.total == 6
+    assert report.repaired == []
+    assert [(issue.index, issue.name) for issue in report.skipped] == [
+        (1, None),
+        (2, None),
+        (3, "Bowtie"),
+        (4, "Dot"),
+        (5, "Line"),
+    ]
+    assert report.skipped[2].reason.startswith("invalid geometry: Self-intersection")
+    assert report.reason_counts() == {
+        "malformed feature": 1,
+        "missing name": 1,
+        "invalid geometry": 1,
+        "unsupported geometry": 1,
+        "geometry error": 1,
+    }
+
+
+def test_repair_keeps_invalid_countries() -> None:
+    """Test that make_valid repairs a self-intersecting country instead of dropping it."""
+    from africa_quiz.dataset import CountryDataset
+
+    dataset = CountryDataset(_document(), repair=True)
+
+    assert dataset.names == ["A", "Bowtie"]
+    assert dataset.country_data["Bowtie"].is_valid
+    assert dataset.country_data["Bowtie"].geom_type == "MultiPolygon"
+    assert [issue.name for issue in dataset.load_report.repaired] == ["Bowtie"]
+    assert len(dataset.load_report.skipped) == 4
+
+
+def test_load_report_is_the_same_for_every_loader(tmp_path: Path) -> None:
+    """Test that sequential, parallel and streamed loads agree on countries and report."""
+    from africa_quiz.dataset import CountryDataset
+
+    path = tmp_path / "countries.geojson"
+    path.write_text(json.dumps(_document()))
+
+    sequential = CountryDataset.from_path(path, repair=True)
+    for dataset in (
+        CountryDataset.from_path(path, repair=True, workers=2),
+        CountryDataset.from_path(path, repair=True, stream=True),
+    ):
+        assert dataset.names == sequential.names
+        assert dataset.load_report == sequential.load_report
+
+
+def test_africa_loads_cleanly() -> None:
+    """Test that the bundled map reports every feature as accepted."""
+    from africa_quiz.dataset import CountryDataset
+
+    with open("africa.geojson") as f:
+        feature_count = len(json.load(f)["features"])
+
+    report = CountryDataset.from_path("africa.geojson").load_report
+    assert report.total == feature_count
+    assert report.accepted == feature_count - len(report.skipped)
+
+
+def test_interior_rings_are_kept() -> None:
+    """Test that holes survive loading, e.g. the one Lesotho fills in South Africa."""
+    import shapely
+
+    from africa_quiz.dataset import CountryDataset
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    south_africa = dataset.country_data["South Africa"]
+    lesotho = dataset.country_data["Lesotho"]
+
+    assert shapely.get_num_interior_rings(shapely.get_parts(south_africa)).sum() >= 1
+    assert not south_africa.contains(lesotho.representative_point())
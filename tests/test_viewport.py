@@ -0,0 +1,95 @@
+"""Tests for zoom and pan of the map view."""
+
+
+def test_zoom_keeps_the_point_under_the_pointer() -> None:
+    """Test that zooming at a screen point leaves the map point under it in place."""
+    import pytest
+
+    from africa_quiz.viewport import Viewport
+
+    viewport = Viewport(1000, 800)
+    before = viewport.screen_to_map(300, 200)
+    viewport.zoom_at(300, 200, 4.0)
+
+    assert viewport.zoom == pytest.approx(4.0)
+    assert viewport.screen_to_map(300, 200) == pytest.approx(before)
+    assert viewport.map_to_screen(*before) == pytest.approx((300, 200))
+
+
+def test_view_stays_within_zoom_limits_and_map_edges() -> None:
+    """Test that zoom is clamped and panning never shows beyond the map."""
+    import pytest
+
+    from africa_quiz.viewport import MAX_ZOOM, Viewport
+
+    viewport = Viewport(1000, 800)
+    assert viewport.zoom_at(500, 400, 0.5) == pytest.approx(1.0)
+    assert viewport.is_identity
+    assert viewport.pan(50, 50) == pytest.approx((0, 0))
+
+    viewport.zoom_at(0, 0, 1e6)
+    assert viewport.zoom == MAX_ZOOM
+    viewport.pan(-1e9, -1e9)
+    left, top, right, bottom = viewport.map_bounds()
+    assert (right, bottom) == pytest.approx((1000, 800))
+    assert (right - left, bottom - top) == pytest.approx((1000 / MAX_ZOOM, 800 / MAX_ZOOM))
+
+
+def test_simplification_tiers_cover_the_zoom_range() -> None:
+    """Test that the most zoomed-in view still gets outlines prepared for its scale."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.simplify import build_simplification_tiers, tier_for_zoom
+    from africa_quiz.viewport import MAX_ZOOM, Viewport
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 1000, 1049)
+    tiers = build_simplification_tiers(dataset.geometries, projector)
+    viewport = Viewport(1000, 1049)
+    viewport.zoom_at(500, 500, 1e6)
+
+    assert viewport.zoom == MAX_ZOOM
+    assert tiers[tier_for_zoom(tiers, viewport.scale)].zoom >= viewport.scale
+
+
+def test_resize_fits_the_map_to_the_new_screen() -> None:
+    """Test that a resize scales the map to fit and keeps the view on the map."""
+    import pytest
+
+    from africa_quiz.viewport import Viewport
+
+    viewport = Viewport(1000, 800)
+    viewport.resize(500, 600)
+    assert viewport.scale == pytest.approx(0.5)
+    assert viewport.map_to_screen(1000, 800) == pytest.approx((500, 400))
+    assert viewport.screen_to_map(250, 200) == pytest.approx((500, 400))
+
+    # Zoomed in at the bottom-right corner, a wider screen pulls the view left
+    viewport.resize(500, 400)
+    viewport.zoom_at(500, 400, 4.0)
+    assert viewport.map_bounds() == pytest.approx((750, 600, 1000, 800))
+    viewport.resize(1000, 400)
+    assert viewport.scale == pytest.approx(2.0)
+    assert viewport.map_bounds() == pytest.approx((500, 600, 1000, 800))
+
+
+def test_viewport_culls_countries_outside_the_view() -> None:
+    """Test that only countries whose bounds meet the viewport are flagged visible."""
+    from africa_quiz.dataset import CountryDataset
+    from africa_quiz.projection import CoordinateProjector
+    from africa_quiz.viewport import Viewport
+
+    dataset = CountryDataset.from_path("africa.geojson")
+    projector = CoordinateProjector(dataset.bbox, 1000, 1049)
+    viewport = Viewport(1000, 1049)
+    assert viewport.visible(dataset.bounds, projector).all()
+
+    gambia = dataset.country_data["Gambia"]
+    x, y = projector.geo_to_canvas(*gambia.representative_point().coords[0])
+    viewport.zoom_at(x, y, 16.0)
+    visible = dict(zip(dataset.names, viewport.visible(dataset.bounds, projector).tolist()))
+
+    assert visible["Gambia"]
+    assert visible["Senegal"]
+    assert not visible["South Africa"]
+    assert sum(visible.values()) < 10